@@ -0,0 +1,41 @@
+"""
+Débit du moteur à événements discrets : troupeau en colonnes et vaches objets.
+
+Usage : python -m benchmarks.bench_evenements [--vaches 10000] [--annees 3] [--objets 2000] [--jours 60]
+"""
+import argparse
+
+from src.vaches.domain.nourriture.TypeNourriture import TypeNourriture
+from src.vaches.domain.pie_noire import PieNoire
+from src.vaches.domain.vache_a_lait import VacheALait
+from src.vaches.simulation.evenements import AN, JOUR, MoteurEvenements
+from src.vaches.troupeau.troupeau import Troupeau
+
+REPAS = ((6.0, 10.0, TypeNourriture.HERBE), (16.0, 10.0, TypeNourriture.CEREALES))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--vaches", type=int, default=10_000, help="vaches du troupeau en colonnes")
+    parser.add_argument("--annees", type=int, default=3)
+    parser.add_argument("--objets", type=int, default=2000, help="vaches objets de chaque race")
+    parser.add_argument("--jours", type=int, default=60)
+    args = parser.parse_args()
+
+    troupeau = Troupeau(race=PieNoire, capacite=args.vaches)
+    for i in range(args.vaches):
+        troupeau.ajouter(f"Bella{i}", 500.0)
+    moteur = MoteurEvenements(delai_rumination=1.0)
+    moteur.planifier_journees(troupeau, repas=REPAS)
+    print(f"Troupeau[{args.vaches}] : {moteur.executer(args.annees * AN)}")
+
+    vaches = [VacheALait(petitNom=f"Lola{i}", poids=500.0) for i in range(args.objets)]
+    vaches += [PieNoire(f"Bella{i}", 500.0, nb_taches_blanches=1, nb_taches_noires=1) for i in range(args.objets)]
+    moteur = MoteurEvenements(delai_rumination=1.0)
+    # broutement primaire : VacheALait refuse la nourriture typée
+    moteur.planifier_journees(vaches)
+    print(f"objets[{len(vaches)}] : {moteur.executer(args.jours * JOUR)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Requêtes spatiales sur un troupeau : index en grille contre parcours exhaustif.
+
+Usage : python -m benchmarks.bench_index_spatial [--nombre 100000] [--cote 2000] [--requetes 200]
+"""
+import argparse
+import random
+import time
+
+from point_plan.point_3d import Point3D
+from point_plan.point_cloud import PointCloud
+from point_plan.point_plan import PointPlan
+from src.vaches.domain.vache import Vache
+from src.vaches.paturage.index_spatial import IndexSpatial
+
+RAYON = 50.0
+K = 10
+
+
+def _dans_rayon_exhaustif(vaches, positions, centre, rayon):
+    r2 = rayon * rayon
+    return [v for v, p in zip(vaches, positions)
+            if (p.abscisse - centre.abscisse) ** 2 + (p.ordonnee - centre.ordonnee) ** 2 <= r2]
+
+
+def _plus_proches_exhaustif(vaches, positions, centre, k):
+    distances = sorted(((p.abscisse - centre.abscisse) ** 2 + (p.ordonnee - centre.ordonnee) ** 2, i)
+                       for i, p in enumerate(positions))
+    return [vaches[i] for _, i in distances[:k]]
+
+
+def _chronometrer(requete, centres) -> float:
+    debut = time.perf_counter()
+    for centre in centres:
+        requete(centre)
+    return (time.perf_counter() - debut) / len(centres)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--nombre", type=int, default=100_000)
+    parser.add_argument("--cote", type=float, default=2000.0, help="côté du pâturage carré, en mètres")
+    parser.add_argument("--requetes", type=int, default=200)
+    args = parser.parse_args()
+
+    aleatoire = random.Random(0)
+    vaches = [Vache(petit_nom=f"Marguerite{i}", poids=450.0) for i in range(args.nombre)]
+    positions = [Point3D(aleatoire.uniform(0, args.cote), aleatoire.uniform(0, args.cote), aleatoire.uniform(0, 360))
+                 for _ in vaches]
+    centres = [PointPlan(aleatoire.uniform(0, args.cote), aleatoire.uniform(0, args.cote))
+               for _ in range(args.requetes)]
+
+    debut = time.perf_counter()
+    index = IndexSpatial()
+    for vache, position in zip(vaches, positions):
+        index.placer(vache, position)
+    construction = time.perf_counter() - debut
+
+    debut = time.perf_counter()
+    for vache, position in zip(vaches, positions):
+        position.abscisse += 1.0
+        index.placer(vache, position)
+    deplacement = (time.perf_counter() - debut) / args.nombre
+
+    # nuage plan : les requêtes portent sur (abscisse, ordonnee), comme l'index
+    nuage = PointCloud([p.abscisse for p in positions], [p.ordonnee for p in positions])
+    exhaustif = max(1, args.requetes // 20)
+    mesures = {
+        f"rayon {RAYON:g} m": (
+            _chronometrer(lambda c: index.dans_rayon(c, RAYON), centres),
+            _chronometrer(lambda c: _dans_rayon_exhaustif(vaches, positions, c, RAYON), centres[:exhaustif]),
+            _chronometrer(lambda c: (nuage.distances(c) <= RAYON).nonzero(), centres),
+        ),
+        f"{K} plus proches": (
+            _chronometrer(lambda c: index.plus_proches(c, K), centres),
+            _chronometrer(lambda c: _plus_proches_exhaustif(vaches, positions, c, K), centres[:exhaustif]),
+            _chronometrer(lambda c: nuage.distances(c).argpartition(K)[:K], centres),
+        ),
+        "boîte 100 m": (
+            _chronometrer(lambda c: index.dans_boite(c, PointPlan(c.abscisse + 100, c.ordonnee + 100)), centres),
+            None,
+            _chronometrer(lambda c: nuage.dans_boite(c, PointPlan(c.abscisse + 100, c.ordonnee + 100)).nonzero(),
+                          centres),
+        ),
+    }
+
+    print(f"{args.nombre} vaches sur {args.cote:g} x {args.cote:g} m, cellules de {index.TAILLE_CELLULE:g} m")
+    print(f"construction : {construction * 1e3:8.1f} ms, déplacement : {deplacement * 1e6:6.2f} µs/vache")
+    print(f"{'requête':<18} {'index':>10} {'exhaustif':>12} {'NumPy':>10}")
+    for nom, (grille, boucle, vectorise) in mesures.items():
+        boucle = f"{boucle * 1e6:10.0f} µs" if boucle is not None else f"{'-':>13}"
+        print(f"{nom:<18} {grille * 1e6:7.1f} µs {boucle} {vectorise * 1e6:7.0f} µs")
+
+
+if __name__ == "__main__":
+    main()
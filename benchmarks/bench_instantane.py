@@ -0,0 +1,46 @@
+"""
+Durée d'écriture et de restauration d'un instantané de troupeau.
+
+Usage : python -m benchmarks.bench_instantane [--nombre 1000000] [--chemin /tmp/troupeau.snap]
+"""
+import argparse
+import os
+import time
+
+import numpy as np
+
+from src.vaches.domain.nourriture.TypeNourriture import TypeNourriture
+from src.vaches.domain.pie_noire import PieNoire
+from src.vaches.infrastructure.instantane import restaurer, sauvegarder
+from src.vaches.troupeau.troupeau import Troupeau
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--nombre", type=int, default=1_000_000)
+    parser.add_argument("--chemin", default="troupeau.snap")
+    args = parser.parse_args()
+
+    troupeau = Troupeau(race=PieNoire, capacite=args.nombre)
+    for i in range(args.nombre):
+        troupeau.ajouter(f"Bella{i}", 500.0)
+    troupeau.brouter_all(3.0, nourritures=TypeNourriture.HERBE)
+    taches = np.full(args.nombre, 10)
+
+    debut = time.perf_counter()
+    sauvegarder(args.chemin, troupeau, taches, taches)
+    ecriture = time.perf_counter() - debut
+
+    debut = time.perf_counter()
+    restaure = restaurer(args.chemin).troupeau
+    projection = time.perf_counter() - debut
+
+    taille = os.path.getsize(args.chemin)
+    print(f"{args.nombre} vaches, {taille / 1e6:.1f} Mo ({taille / args.nombre:.0f} octets/vache)")
+    print(f"sauvegarde : {ecriture * 1e3:8.1f} ms")
+    print(f"restauration : {projection * 1e3:8.1f} ms ({len(restaure)} vaches projetées)")
+    os.remove(args.chemin)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Empreinte mémoire et débit de construction des vaches.
+
+Usage : python -m benchmarks.bench_memoire [--nombre 100000]
+"""
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+
+from src.vaches.domain.nourriture.TypeNourriture import TypeNourriture
+from src.vaches.domain.pie_noire import PieNoire
+from src.vaches.domain.vache import Vache
+from src.vaches.domain.vache_a_lait import VacheALait
+
+
+def _creer_vache() -> Vache:
+    return Vache(petit_nom="Marguerite", poids=450.0)
+
+
+def _creer_vache_a_lait() -> VacheALait:
+    return VacheALait(petitNom="Lola", poids=500.0)
+
+
+def _creer_pie_noire() -> PieNoire:
+    return PieNoire("Bella", 520.0, nb_taches_blanches=12, nb_taches_noires=18)
+
+
+def _creer_pie_noire_nourrie() -> PieNoire:
+    pie = _creer_pie_noire()
+    pie.brouter(2.0, TypeNourriture.HERBE)
+    return pie
+
+
+CAS = {
+    "Vache": _creer_vache,
+    "VacheALait": _creer_vache_a_lait,
+    "PieNoire": _creer_pie_noire,
+    "PieNoire (ration allouée)": _creer_pie_noire_nourrie,
+}
+
+
+def octets_par_vache(fabrique, nombre: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    avant, _ = tracemalloc.get_traced_memory()
+    vaches = [fabrique() for _ in range(nombre)]
+    apres, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # on ne compte pas la liste qui retient les vaches
+    return (apres - avant - sys.getsizeof(vaches)) / nombre
+
+
+def vaches_par_seconde(fabrique, nombre: int) -> float:
+    debut = time.perf_counter()
+    for _ in range(nombre):
+        fabrique()
+    return nombre / (time.perf_counter() - debut)
+
+
+def mesurer(nombre: int) -> dict[str, dict[str, float]]:
+    return {
+        nom: {
+            "octets_par_vache": octets_par_vache(fabrique, nombre),
+            "vaches_par_seconde": vaches_par_seconde(fabrique, nombre),
+        }
+        for nom, fabrique in CAS.items()
+    }
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--nombre", type=int, default=100_000)
+    args = parser.parse_args(argv)
+
+    print(f"{'classe':<28}{'octets/vache':>14}{'vaches/s':>14}")
+    for nom, mesure in mesurer(args.nombre).items():
+        print(f"{nom:<28}{mesure['octets_par_vache']:>14.1f}{mesure['vaches_par_seconde']:>14.0f}")
+
+
+if __name__ == "__main__":
+    main()
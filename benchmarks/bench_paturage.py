@@ -0,0 +1,51 @@
+"""
+Cadence de la simulation de pâturage : broutement, rumination et repousse par pas.
+
+Usage : python -m benchmarks.bench_paturage [--vaches 10000] [--cote 1000] [--pas 50]
+"""
+import argparse
+import time
+
+import numpy as np
+
+from src.vaches.domain.nourriture.TypeNourriture import TypeNourriture
+from src.vaches.domain.pie_noire import PieNoire
+from src.vaches.paturage.paturage import Paturage
+from src.vaches.troupeau.troupeau import Troupeau
+
+CAPACITES = {TypeNourriture.HERBE: 2.0, TypeNourriture.MARGUERITE: 0.5, TypeNourriture.FOIN: 0.3}
+CROISSANCES = {TypeNourriture.HERBE: 0.05, TypeNourriture.MARGUERITE: 0.02}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--vaches", type=int, default=10_000)
+    parser.add_argument("--cote", type=int, default=1000)
+    parser.add_argument("--pas", type=int, default=50)
+    args = parser.parse_args()
+
+    paturage = Paturage(args.cote, args.cote, CAPACITES, CROISSANCES)
+    troupeau = Troupeau(race=PieNoire, capacite=args.vaches)
+    for i in range(args.vaches):
+        troupeau.ajouter(f"Bella{i}", 500.0)
+
+    aleatoire = np.random.default_rng(0)
+    lignes = aleatoire.integers(0, args.cote, args.vaches)
+    colonnes = aleatoire.integers(0, args.cote, args.vaches)
+
+    debut = time.perf_counter()
+    broute = 0.0
+    for _ in range(args.pas):
+        broute += paturage.avancer(troupeau, lignes, colonnes, 1.5).sum()
+        troupeau.ruminer_all(selection=troupeau.panse > 0)
+        # chaque vache fait un pas vers une cellule voisine
+        lignes = np.clip(lignes + aleatoire.integers(-1, 2, args.vaches), 0, args.cote - 1)
+        colonnes = np.clip(colonnes + aleatoire.integers(-1, 2, args.vaches), 0, args.cote - 1)
+    duree = (time.perf_counter() - debut) / args.pas
+
+    print(f"{args.vaches} vaches sur {args.cote} x {args.cote} cellules, {args.pas} pas")
+    print(f"{duree * 1e3:.1f} ms/pas ({1 / duree:.0f} pas/s), {broute / args.pas:.0f} broutés par pas")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Latence d'un cycle de rumination par race (template method Vache.ruminer).
+
+Usage : python -m benchmarks.bench_rumination [--nombre 100000] [--repetitions 9]
+"""
+import argparse
+import gc
+import time
+
+from benchmarks.bench_memoire import _creer_pie_noire, _creer_vache, _creer_vache_a_lait
+from src.vaches.domain.nourriture.TypeNourriture import TypeNourriture
+
+
+def _nourrir(fabrique, nombre: int, types=()) -> list:
+    vaches = [fabrique() for _ in range(nombre)]
+    for vache in vaches:
+        if types:
+            for nourriture in types:
+                vache.brouter(1.0, nourriture)
+        else:
+            vache.brouter(5.0)
+    return vaches
+
+
+CAS = {
+    "Vache": lambda n: _nourrir(_creer_vache, n),
+    "VacheALait": lambda n: _nourrir(_creer_vache_a_lait, n),
+    "PieNoire (sans type)": lambda n: _nourrir(_creer_pie_noire, n),
+    "PieNoire (1 type)": lambda n: _nourrir(_creer_pie_noire, n, list(TypeNourriture)[:1]),
+    "PieNoire (5 types)": lambda n: _nourrir(_creer_pie_noire, n, list(TypeNourriture)),
+}
+
+
+def ns_par_rumination(preparer, nombre: int, repetitions: int) -> float:
+    meilleur = float("inf")
+    for _ in range(repetitions):
+        vaches = preparer(nombre)
+        gc.collect()
+        gc.disable()
+        try:
+            debut = time.perf_counter_ns()
+            for vache in vaches:
+                vache.ruminer()
+            meilleur = min(meilleur, (time.perf_counter_ns() - debut) / nombre)
+        finally:
+            gc.enable()
+    return meilleur
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--nombre", type=int, default=100_000)
+    parser.add_argument("--repetitions", type=int, default=9)
+    args = parser.parse_args()
+
+    print(f"{'race':<24}{'ns/ruminer':>12}")
+    for nom, preparer in CAS.items():
+        print(f"{nom:<24}{ns_par_rumination(preparer, args.nombre, args.repetitions):>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,219 @@
+"""
+Suite de benchmarks des chemins chauds du domaine vaches.
+
+Usage :
+    python -m benchmarks.suite --sortie resultats.json
+    python -m benchmarks.suite --sortie nouveau.json --baseline resultats.json --seuil 0.10
+
+Mesures :
+- débit de construction de Vache, VacheALait et PieNoire ;
+- latence par appel de brouter, ruminer et traire, dont PieNoire.ruminer
+  avec 1 à 5 types de nourriture dans la ration ;
+- journée complète (brouter, ruminer, traire) à l'échelle d'un troupeau,
+  en objets et en colonnes (Troupeau).
+
+En mode comparaison, toute mesure dégradée de plus de `seuil` par rapport à
+la baseline est signalée et le code de sortie vaut 1.
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+
+from benchmarks.bench_memoire import (
+    CAS,
+    _creer_pie_noire,
+    _creer_vache,
+    _creer_vache_a_lait,
+    vaches_par_seconde,
+)
+from src.vaches.domain.nourriture.TypeNourriture import TypeNourriture
+from src.vaches.domain.pie_noire import PieNoire
+from src.vaches.domain.vache import Vache
+from src.vaches.domain.vache_a_lait import VacheALait
+from src.vaches.simulation.parallele import simuler_journees
+from src.vaches.troupeau.troupeau import Troupeau
+
+# sens : "haut" si une valeur plus grande est meilleure, "bas" sinon
+HAUT = "haut"
+BAS = "bas"
+
+TAILLES_TROUPEAU = (1_000, 100_000, 1_000_000)
+
+
+def _meilleur(mesure, repetitions: int) -> float:
+    return min(mesure() for _ in range(repetitions))
+
+
+def _latence(preparer, appel, nombre: int, repetitions: int) -> float:
+    """Latence en ns par appel : `preparer(nombre)` fournit des vaches neuves à chaque répétition."""
+    def mesure() -> float:
+        vaches = preparer(nombre)
+        debut = time.perf_counter_ns()
+        for vache in vaches:
+            appel(vache)
+        return (time.perf_counter_ns() - debut) / nombre
+    return _meilleur(mesure, repetitions)
+
+
+def _pies(nombre: int, nb_types: int) -> list[PieNoire]:
+    """PieNoire nourries de 1 kg de chacun des `nb_types` premiers types (5 kg sans type si 0)."""
+    pies = [_creer_pie_noire() for _ in range(nombre)]
+    types = list(TypeNourriture)[:nb_types]
+    for pie in pies:
+        for nourriture in types:
+            pie.brouter(1.0, nourriture)
+        if not types:
+            pie.brouter(5.0)
+    return pies
+
+
+def _laitieres_nourries(nombre: int) -> list[VacheALait]:
+    vaches = [_creer_vache_a_lait() for _ in range(nombre)]
+    for vache in vaches:
+        vache.brouter(10.0)
+    return vaches
+
+
+def _laitieres_pleines(nombre: int) -> list[VacheALait]:
+    vaches = _laitieres_nourries(nombre)
+    for vache in vaches:
+        vache.ruminer()
+    return vaches
+
+
+def _vaches_nourries(nombre: int) -> list[Vache]:
+    vaches = [_creer_vache() for _ in range(nombre)]
+    for vache in vaches:
+        vache.brouter(10.0)
+    return vaches
+
+
+def mesurer_construction(nombre: int, repetitions: int) -> dict:
+    return {
+        f"construction/{nom}": (max(vaches_par_seconde(fabrique, nombre) for _ in range(repetitions)), "vaches/s", HAUT)
+        for nom, fabrique in CAS.items()
+    }
+
+
+def mesurer_latences(nombre: int, repetitions: int) -> dict:
+    def neuves(fabrique):
+        return lambda n: [fabrique() for _ in range(n)]
+
+    cas = {
+        "Vache.brouter": (neuves(_creer_vache), lambda v: v.brouter(1.0)),
+        "VacheALait.brouter": (neuves(_creer_vache_a_lait), lambda v: v.brouter(1.0)),
+        "PieNoire.brouter": (neuves(_creer_pie_noire), lambda v: v.brouter(1.0)),
+        "PieNoire.brouter[type]": (neuves(_creer_pie_noire), lambda v: v.brouter(1.0, TypeNourriture.FOIN)),
+        "Vache.ruminer": (_vaches_nourries, Vache.ruminer),
+        "VacheALait.ruminer": (_laitieres_nourries, VacheALait.ruminer),
+        "VacheALait.traire": (_laitieres_pleines, lambda v: v.traire(1.0)),
+        "PieNoire.ruminer[sans type]": (lambda n: _pies(n, 0), PieNoire.ruminer),
+    }
+    for nb_types in range(1, len(TypeNourriture) + 1):
+        cas[f"PieNoire.ruminer[{nb_types} types]"] = (lambda n, k=nb_types: _pies(n, k), PieNoire.ruminer)
+
+    return {
+        f"latence/{nom}": (_latence(preparer, appel, nombre, repetitions), "ns/appel", BAS)
+        for nom, (preparer, appel) in cas.items()
+    }
+
+
+def _journee_objets(vaches: list[VacheALait]) -> None:
+    for vache in vaches:
+        vache.brouter(10.0)
+        vache.ruminer()
+        vache.traire(vache.lait_disponible)
+
+
+def mesurer_troupeaux(tailles, max_objets: int, repetitions: int) -> dict:
+    resultats = {}
+    for taille in tailles:
+        troupeau = Troupeau(race=VacheALait, capacite=taille)
+        for _ in range(taille):
+            troupeau.ajouter("Lola", 500.0)
+        duree = _meilleur(lambda: simuler_journees(troupeau, 1, 10.0).duree, repetitions)
+        resultats[f"journee/Troupeau[{taille}]"] = (duree * 1e3, "ms/jour", BAS)
+
+        if taille <= max_objets:
+            vaches = [_creer_vache_a_lait() for _ in range(taille)]
+
+            def mesure() -> float:
+                debut = time.perf_counter()
+                _journee_objets(vaches)
+                return time.perf_counter() - debut
+            resultats[f"journee/objets[{taille}]"] = (_meilleur(mesure, repetitions) * 1e3, "ms/jour", BAS)
+    return resultats
+
+
+def executer(nombre: int, tailles, max_objets: int, repetitions: int) -> dict:
+    mesures = {}
+    mesures.update(mesurer_construction(nombre, repetitions))
+    mesures.update(mesurer_latences(nombre, repetitions))
+    mesures.update(mesurer_troupeaux(tailles, max_objets, repetitions))
+    return {
+        "meta": {
+            "date": datetime.now(timezone.utc).isoformat(),
+            "python": sys.version.split()[0],
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+        },
+        "resultats": {
+            nom: {"valeur": valeur, "unite": unite, "sens": sens}
+            for nom, (valeur, unite, sens) in mesures.items()
+        },
+    }
+
+
+def comparer(resultats: dict, baseline: dict, seuil: float) -> list[str]:
+    """Renvoie une ligne par mesure dégradée de plus de `seuil` (0.10 = 10 %) par rapport à la baseline."""
+    regressions = []
+    for nom, reference in baseline["resultats"].items():
+        actuel = resultats["resultats"].get(nom)
+        if actuel is None or not reference["valeur"]:
+            continue
+
+        ecart = (actuel["valeur"] - reference["valeur"]) / reference["valeur"]
+        if reference["sens"] == HAUT:
+            ecart = -ecart
+        if ecart > seuil:
+            regressions.append(
+                f"{nom} : {reference['valeur']:.1f} -> {actuel['valeur']:.1f} {actuel['unite']} ({ecart:+.0%})"
+            )
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmarks des chemins chauds du domaine vaches")
+    parser.add_argument("--sortie", help="fichier JSON des résultats")
+    parser.add_argument("--baseline", help="fichier JSON de référence à comparer")
+    parser.add_argument("--seuil", type=float, default=0.10, help="dégradation tolérée (0.10 = 10 %%)")
+    parser.add_argument("--nombre", type=int, default=50_000, help="vaches par mesure de latence")
+    parser.add_argument("--tailles", type=int, nargs="+", default=list(TAILLES_TROUPEAU))
+    parser.add_argument("--max-objets", type=int, default=100_000, help="taille max des journées en objets")
+    parser.add_argument("--repetitions", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    resultats = executer(args.nombre, args.tailles, args.max_objets, args.repetitions)
+    for nom, mesure in resultats["resultats"].items():
+        print(f"{nom:<40}{mesure['valeur']:>16.1f} {mesure['unite']}")
+
+    if args.sortie:
+        with open(args.sortie, "w", encoding="utf-8") as f:
+            json.dump(resultats, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            regressions = comparer(resultats, json.load(f), args.seuil)
+        for ligne in regressions:
+            print(f"REGRESSION {ligne}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,24 @@
+from point_plan.point_plan import PointPlan
+
+
+class Point3D(PointPlan):
+    __slots__ = ("_azimut",)
+
+    def __init__(self, abscisse=None, ordonnee=None, azimut=None):
+        super().__init__(abscisse, ordonnee)
+        self._azimut = azimut
+
+    @classmethod
+    def from_point(cls, point: "Point3D") -> "Point3D":
+        return cls(point.abscisse, point.ordonnee, point.azimut)
+
+    @property
+    def azimut(self):
+        return self._azimut
+
+    @azimut.setter
+    def azimut(self, azimut) -> None:
+        self._azimut = azimut
+
+    def __str__(self) -> str:
+        return f"Point3D :{super().__str__()}azimut={self._azimut}"
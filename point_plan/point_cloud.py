@@ -0,0 +1,104 @@
+from collections.abc import Iterable
+
+import numpy as np
+
+from point_plan.point_3d import Point3D
+from point_plan.point_plan import PointPlan
+
+
+class PointCloud:
+    """
+    Nuage de points stocké en colonnes NumPy float64 contiguës (une par axe).
+
+    Les opérations portent sur tout le nuage d'un coup : un million de
+    positions occupent trois tableaux, pas un million d'objets PointPlan.
+    Les objets ne sont recréés qu'à la demande, par indexation.
+    """
+
+    __slots__ = ("abscisses", "ordonnees", "azimuts")
+
+    def __init__(self, abscisses, ordonnees, azimuts=None):
+        self.abscisses = np.ascontiguousarray(abscisses, dtype=np.float64)
+        self.ordonnees = np.ascontiguousarray(ordonnees, dtype=np.float64)
+        self.azimuts = None if azimuts is None else np.ascontiguousarray(azimuts, dtype=np.float64)
+
+        if self.abscisses.ndim != 1 or any(c.shape != self.abscisses.shape for c in self._colonnes()):
+            raise ValueError("les colonnes d'un nuage doivent être des vecteurs de même longueur")
+
+    @classmethod
+    def depuis_points(cls, points: Iterable[PointPlan]) -> "PointCloud":
+        """Nuage 3D si tous les points sont des Point3D, 2D sinon (azimuts ignorés)."""
+        points = list(points)
+        n = len(points)
+        abscisses = np.fromiter((p.abscisse for p in points), dtype=np.float64, count=n)
+        ordonnees = np.fromiter((p.ordonnee for p in points), dtype=np.float64, count=n)
+        azimuts = None
+        if points and all(isinstance(p, Point3D) for p in points):
+            azimuts = np.fromiter((p.azimut for p in points), dtype=np.float64, count=n)
+        return cls(abscisses, ordonnees, azimuts)
+
+    def _colonnes(self) -> tuple[np.ndarray, ...]:
+        if self.azimuts is None:
+            return self.abscisses, self.ordonnees
+        return self.abscisses, self.ordonnees, self.azimuts
+
+    @property
+    def dimension(self) -> int:
+        return 2 if self.azimuts is None else 3
+
+    def __len__(self) -> int:
+        return len(self.abscisses)
+
+    def __getitem__(self, i):
+        """Un indice renvoie un PointPlan / Point3D ; une tranche ou un masque, un nuage (vues si possible)."""
+        if isinstance(i, (int, np.integer)):
+            return self._point(c[i] for c in self._colonnes())
+        return PointCloud(*(c[i] for c in self._colonnes()))
+
+    def coordonnees(self) -> np.ndarray:
+        """Copie (n, dimension) des coordonnées."""
+        return np.column_stack(self._colonnes())
+
+    # -------------------------
+    # Opérations vectorisées
+    # -------------------------
+
+    def translater(self, dx, dy, dz=0.0) -> None:
+        """Déplace tous les points en place ; chaque décalage est un scalaire ou un vecteur par point."""
+        self.abscisses += dx
+        self.ordonnees += dy
+        if self.azimuts is not None:
+            self.azimuts += dz
+
+    def distances(self, point: PointPlan) -> np.ndarray:
+        """Distance euclidienne de chaque point du nuage à `point`."""
+        carres = (self.abscisses - point.abscisse) ** 2
+        carres += (self.ordonnees - point.ordonnee) ** 2
+        if self.azimuts is not None:
+            carres += (self.azimuts - point.azimut) ** 2
+        return np.sqrt(carres, out=carres)
+
+    def plus_proche(self, point: PointPlan) -> int:
+        """Indice du point du nuage le plus proche de `point`."""
+        if not len(self):
+            raise ValueError("nuage vide")
+        return int(np.argmin(self.distances(point)))
+
+    def boite_englobante(self) -> tuple[PointPlan, PointPlan]:
+        """Coins minimal et maximal de la boîte alignée sur les axes qui contient tout le nuage."""
+        if not len(self):
+            raise ValueError("nuage vide")
+        colonnes = self._colonnes()
+        return self._point(c.min() for c in colonnes), self._point(c.max() for c in colonnes)
+
+    def dans_boite(self, minimum: PointPlan, maximum: PointPlan) -> np.ndarray:
+        """Masque des points situés dans la boîte [minimum, maximum] (bornes incluses)."""
+        masque = (self.abscisses >= minimum.abscisse) & (self.abscisses <= maximum.abscisse)
+        masque &= (self.ordonnees >= minimum.ordonnee) & (self.ordonnees <= maximum.ordonnee)
+        if self.azimuts is not None:
+            masque &= (self.azimuts >= minimum.azimut) & (self.azimuts <= maximum.azimut)
+        return masque
+
+    def _point(self, coordonnees) -> PointPlan:
+        coordonnees = [float(c) for c in coordonnees]
+        return Point3D(*coordonnees) if self.azimuts is not None else PointPlan(*coordonnees)
@@ -0,0 +1,31 @@
+class PointPlan:
+    """Point du plan ; abscisse et ordonnée sont laissées à None par défaut et ne sont pas validées."""
+
+    __slots__ = ("_abscisse", "_ordonnee")
+
+    def __init__(self, abscisse=None, ordonnee=None):
+        self._abscisse = abscisse
+        self._ordonnee = ordonnee
+
+    @classmethod
+    def from_point(cls, point: "PointPlan") -> "PointPlan":
+        return cls(point.abscisse, point.ordonnee)
+
+    @property
+    def abscisse(self):
+        return self._abscisse
+
+    @abscisse.setter
+    def abscisse(self, abscisse) -> None:
+        self._abscisse = abscisse
+
+    @property
+    def ordonnee(self):
+        return self._ordonnee
+
+    @ordonnee.setter
+    def ordonnee(self, ordonnee) -> None:
+        self._ordonnee = ordonnee
+
+    def __str__(self) -> str:
+        return f"\nabscisse = {self._abscisse}, ordonnee={self._ordonnee}"
@@ -0,0 +1,211 @@
+"""
+Ingestion en flux des événements d'alimentation (id de vache, quantité, TypeNourriture).
+
+Chaque étape est un générateur qui consomme et produit des LotEvenements :
+
+    analyser -> resoudre -> valider -> appliquer -> router_rejets
+
+Les événements circulent par lots de `taille_lot` pour amortir le coût des
+générateurs ; un seul lot par étape est en vol, la mémoire ne dépend donc
+pas de la longueur du flux. Un lot est entièrement appliqué avant que le
+suivant ne soit validé : l'ordre des broutements est celui du flux.
+"""
+import time
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from dataclasses import dataclass, field
+from itertools import islice
+
+from src.vaches.domain.errors.codes import CodeErreur
+from src.vaches.domain.errors.exceptions import InvalidVacheException
+from src.vaches.domain.nourriture.TypeNourriture import TypeNourriture
+from src.vaches.domain.vache import Vache
+from src.vaches.infrastructure.chargement import Rejet, en_reel
+from src.vaches.troupeau.cheptel import Cheptel
+
+TAILLE_LOT: int = 1024
+
+# nom ou valeur ("herbe", "HERBE") -> TypeNourriture
+_NOURRITURES = {
+    **{t.name: t for t in TypeNourriture},
+    **{t.value: t for t in TypeNourriture},
+}
+
+
+@dataclass(slots=True)
+class Evenement:
+    ligne: int
+    ident: int
+    quantite: float
+    nourriture: TypeNourriture | None = None
+    vache: Vache | None = None
+
+
+@dataclass(slots=True)
+class LotEvenements:
+    evenements: list[Evenement] = field(default_factory=list)
+    rejets: list[Rejet] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class BilanAlimentation:
+    evenements: int = 0
+    appliques: int = 0
+    rejetes: int = 0
+    duree: float = 0.0
+
+    @property
+    def evenements_par_seconde(self) -> float:
+        return self.evenements / self.duree if self.duree else 0.0
+
+
+# -------------------------
+# Étapes
+# -------------------------
+
+def analyser(source: Iterable, taille_lot: int = TAILLE_LOT) -> Iterator[LotEvenements]:
+    """
+    Découpe `source` en lots d'événements.
+
+    Un élément est une ligne "id,quantite[,nourriture]" ou un tuple
+    (id, quantite[, nourriture]) ; la nourriture est un TypeNourriture, son nom
+    ou sa valeur, et vide ou absente pour un broutement primaire.
+    """
+    elements = iter(source)
+    numero = 1
+    while True:
+        bruts = list(islice(elements, taille_lot))
+        if not bruts:
+            return
+
+        lot = LotEvenements()
+        for ligne, brut in enumerate(bruts, numero):
+            champs = brut.split(",") if isinstance(brut, str) else brut
+            evenement = _analyser_champs(ligne, champs, lot.rejets)
+            if evenement is not None:
+                lot.evenements.append(evenement)
+        numero += len(bruts)
+        yield lot
+
+
+def _analyser_champs(ligne: int, champs, rejets: list[Rejet]) -> Evenement | None:
+    ident_brut = champs[0] if len(champs) > 0 else None
+    quantite_brute = champs[1] if len(champs) > 1 else None
+    nourriture_brute = champs[2] if len(champs) > 2 else None
+
+    try:
+        ident = int(ident_brut)
+    except (TypeError, ValueError):
+        rejets.append(Rejet(ligne, "id", CodeErreur.VACHE_INCONNUE, ident_brut))
+        return None
+
+    quantite = en_reel(quantite_brute.strip() if isinstance(quantite_brute, str) else quantite_brute)
+    if quantite != quantite:
+        rejets.append(Rejet(ligne, "quantite", CodeErreur.QUANTITE_NON_NUMERIQUE, quantite_brute))
+        return None
+
+    nourriture = None
+    if isinstance(nourriture_brute, TypeNourriture):
+        nourriture = nourriture_brute
+    elif nourriture_brute is not None and str(nourriture_brute).strip():
+        nourriture = _NOURRITURES.get(str(nourriture_brute).strip())
+        if nourriture is None:
+            rejets.append(Rejet(ligne, "nourriture", CodeErreur.NOURRITURE_INTERDITE, nourriture_brute))
+            return None
+
+    return Evenement(ligne, ident, quantite, nourriture)
+
+
+def resoudre(lots: Iterable[LotEvenements], vaches: Mapping[int, Vache] | Cheptel) -> Iterator[LotEvenements]:
+    """Associe chaque événement à sa vache ; `vaches` est une table id -> vache (dict, Cheptel, Registre)."""
+    trouver = vaches.get
+    for lot in lots:
+        connus = []
+        for evenement in lot.evenements:
+            vache = trouver(evenement.ident)
+            if vache is None:
+                lot.rejets.append(Rejet(evenement.ligne, "id", CodeErreur.VACHE_INCONNUE, evenement.ident))
+            else:
+                evenement.vache = vache
+                connus.append(evenement)
+        lot.evenements = connus
+        yield lot
+
+
+def valider(lots: Iterable[LotEvenements]) -> Iterator[LotEvenements]:
+    """
+    Écarte les événements que brouter refuserait, sans lever d'exception.
+
+    La panse de chaque vache est suivie le long du lot (mêmes additions que
+    les broutements successifs) : PANSE_MAX est vérifié comme si les
+    événements précédents du lot étaient déjà appliqués. Un broutement
+    différé en tampon compte, sans être appliqué : valider ne modifie aucune vache.
+    """
+    for lot in lots:
+        panses: dict[int, float] = {}
+        valides = []
+        for evenement in lot.evenements:
+            vache = evenement.vache
+            code = vache.check_brouter(evenement.quantite, evenement.nourriture)
+            if not code:
+                panse = panses.get(vache.id)
+                if panse is None:
+                    tampon = getattr(vache, "_tampon", None)
+                    panse = vache.panse if tampon is None else tampon.panse
+                panse += evenement.quantite
+                if panse > vache.PANSE_MAX:
+                    code = CodeErreur.PANSE_DEPASSEE
+                else:
+                    panses[vache.id] = panse
+            if code:
+                lot.rejets.append(Rejet(evenement.ligne, "quantite", code, evenement.quantite))
+            else:
+                valides.append(evenement)
+        lot.evenements = valides
+        yield lot
+
+
+def appliquer(lots: Iterable[LotEvenements]) -> Iterator[LotEvenements]:
+    """Appelle brouter pour chaque événement du lot, dans l'ordre du flux."""
+    for lot in lots:
+        appliques = []
+        for evenement in lot.evenements:
+            try:
+                evenement.vache.brouter(evenement.quantite, evenement.nourriture)
+            except InvalidVacheException as erreur:
+                # état modifié hors du flux depuis la validation
+                lot.rejets.append(Rejet(evenement.ligne, "quantite", erreur.code, evenement.quantite))
+            else:
+                appliques.append(evenement)
+        lot.evenements = appliques
+        yield lot
+
+
+def router_rejets(lots: Iterable[LotEvenements], destination: Callable[[Rejet], object]) -> Iterator[LotEvenements]:
+    """Envoie chaque rejet à `destination` (fichier, file, compteur...) dans l'ordre des lignes."""
+    for lot in lots:
+        lot.rejets.sort(key=lambda r: r.ligne)
+        for rejet in lot.rejets:
+            destination(rejet)
+        yield lot
+
+
+# -------------------------
+# Exécution
+# -------------------------
+
+def executer(source: Iterable, vaches: Mapping[int, Vache] | Cheptel,
+             destination_rejets: Callable[[Rejet], object] | None = None,
+             taille_lot: int = TAILLE_LOT) -> BilanAlimentation:
+    """Fait passer tout le flux dans le pipeline complet et renvoie le bilan (dont événements/s)."""
+    lots = appliquer(valider(resoudre(analyser(source, taille_lot), vaches)))
+    if destination_rejets is not None:
+        lots = router_rejets(lots, destination_rejets)
+
+    bilan = BilanAlimentation()
+    debut = time.perf_counter()
+    for lot in lots:
+        bilan.appliques += len(lot.evenements)
+        bilan.rejetes += len(lot.rejets)
+    bilan.evenements = bilan.appliques + bilan.rejetes
+    bilan.duree = time.perf_counter() - debut
+    return bilan
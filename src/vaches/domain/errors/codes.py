@@ -0,0 +1,48 @@
+from enum import IntEnum
+
+
+class CodeErreur(IntEnum):
+    """Règle métier violée. OK (0) est faux en contexte booléen : `if code:` signale une violation."""
+
+    OK = 0
+    PETIT_NOM_VIDE = 1
+    POIDS_NEGATIF = 2
+    AGE_NAISSANCE_INVALIDE = 3
+    TACHES_NON_ENTIERES = 4
+    TACHES_NON_POSITIVES = 5
+    NOURRITURE_INTERDITE = 6
+    QUANTITE_NON_POSITIVE = 7
+    PANSE_DEPASSEE = 8
+    PANSE_VIDE = 9
+    PRODUCTION_LAIT_DEPASSEE = 10
+    LITRES_NON_POSITIFS = 11
+    LAIT_INSUFFISANT = 12
+    AGE_MAX_ATTEINT = 13
+    POIDS_NON_NUMERIQUE = 14
+    QUANTITE_NON_NUMERIQUE = 15
+    VACHE_INCONNUE = 16
+    CONSTANTE_RACE_INVALIDE = 17
+    LIGNE_ILLISIBLE = 18
+
+
+MESSAGES: dict[CodeErreur, str] = {
+    CodeErreur.OK: "aucune règle violée",
+    CodeErreur.PETIT_NOM_VIDE: "le petit nom ne doit pas être vide",
+    CodeErreur.POIDS_NEGATIF: "le poids doit être >= 0",
+    CodeErreur.AGE_NAISSANCE_INVALIDE: "AGE_NAISSANCE doit être dans [0, AGE_MAX]",
+    CodeErreur.TACHES_NON_ENTIERES: "le nombre de taches doit être un int",
+    CodeErreur.TACHES_NON_POSITIVES: "le nombre de taches doit être > 0",
+    CodeErreur.NOURRITURE_INTERDITE: "type de nourriture refusé par cette vache",
+    CodeErreur.QUANTITE_NON_POSITIVE: "la quantité broutée doit être > 0",
+    CodeErreur.PANSE_DEPASSEE: "la panse dépasserait PANSE_MAX",
+    CodeErreur.PANSE_VIDE: "impossible de ruminer avec une panse vide",
+    CodeErreur.PRODUCTION_LAIT_DEPASSEE: "le lait disponible dépasserait PRODUCTION_LAIT_MAX",
+    CodeErreur.LITRES_NON_POSITIFS: "les litres traits doivent être > 0",
+    CodeErreur.LAIT_INSUFFISANT: "pas assez de lait disponible",
+    CodeErreur.AGE_MAX_ATTEINT: "la vache a déjà atteint AGE_MAX",
+    CodeErreur.POIDS_NON_NUMERIQUE: "le poids doit être un nombre",
+    CodeErreur.QUANTITE_NON_NUMERIQUE: "la quantité doit être un nombre",
+    CodeErreur.VACHE_INCONNUE: "aucune vache avec cet identifiant",
+    CodeErreur.CONSTANTE_RACE_INVALIDE: "constante de race invalide",
+    CodeErreur.LIGNE_ILLISIBLE: "ligne illisible : JSON invalide ou pas un objet",
+}
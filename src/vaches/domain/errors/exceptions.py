@@ -1,2 +1,9 @@
+from src.vaches.domain.errors.codes import MESSAGES, CodeErreur
+
+
 class InvalidVacheException(Exception):
-    pass
\ No newline at end of file
+    def __init__(self, code: CodeErreur | None = None, message: str | None = None):
+        self.code = code
+        if message is None and code is not None:
+            message = MESSAGES[code]
+        super().__init__(*(() if message is None else (message,)))
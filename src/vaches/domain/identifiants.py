@@ -0,0 +1,148 @@
+import os
+import threading
+import weakref
+from math import inf
+
+
+class AllocateurIdentifiants:
+    """
+    Distribue les identifiants des vaches par blocs réservés.
+
+    Chaque thread puise dans son propre bloc sans verrou : le verrou n'est pris
+    qu'une fois par bloc. Les blocs d'un processus forment la suite
+    prochain_bloc, prochain_bloc + pas, ... bornée par fin (exclue).
+
+    À chaque fork, le parent cède à l'enfant les BLOCS_PAR_ENFANT prochains
+    blocs de sa suite (au plus la moitié de ce qui lui reste) et reprend
+    après : parent et enfants ne distribuent jamais le même identifiant, sans
+    aucune coordination ultérieure. Un processus lancé par spawn repart d'un
+    allocateur neuf ; on lui transmet un espace obtenu par ceder_espace() dans
+    le parent, à adopter dans son initialiseur.
+    """
+
+    TAILLE_BLOC: int = 1024
+    # 2**22 blocs de 1024 : 2**32 identifiants par processus enfant
+    BLOCS_PAR_ENFANT: int = 1 << 22
+
+    def __init__(self, premier: int = 1, taille_bloc: int = TAILLE_BLOC):
+        if taille_bloc <= 0:
+            raise ValueError("taille_bloc doit être > 0")
+
+        self._verrou = threading.Lock()
+        self._local = threading.local()
+        self._taille_bloc = taille_bloc
+        self._prochain_bloc = premier
+        self._pas = taille_bloc
+        self._fin = inf
+        # incrémentée à chaque changement d'espace : invalide les blocs déjà distribués aux threads
+        self._generation = 0
+        _ALLOCATEURS.add(self)
+
+    def prochain(self) -> int:
+        try:
+            bloc = self._local.bloc
+        except AttributeError:
+            bloc = self._local.bloc = [0, 0, -1]
+
+        ident = bloc[0]
+        if ident < bloc[1] and bloc[2] == self._generation:
+            bloc[0] = ident + 1
+            return ident
+        return self._reserver(bloc)
+
+    def _reserver(self, bloc: list) -> int:
+        with self._verrou:
+            debut = self._prochain_bloc
+            if debut >= self._fin:
+                raise RuntimeError("espace d'identifiants épuisé")
+            self._prochain_bloc = debut + self._pas
+            bloc[0] = debut + 1
+            bloc[1] = debut + self._taille_bloc
+            bloc[2] = self._generation
+        return debut
+
+    def partitionner(self, index: int, nombre: int, base: int | None = None) -> None:
+        """
+        Réserve au processus `index` (sur `nombre`) un bloc sur `nombre` de sa suite à partir de `base`.
+
+        À appeler dans l'initialiseur de chaque travailleur, avec la même base.
+        Par défaut, la base est le prochain bloc de l'espace du processus :
+        après un fork, c'est l'espace cédé à l'enfant, que le parent ne
+        distribuera plus.
+        """
+        if not 0 <= index < nombre:
+            raise ValueError("index doit être dans [0, nombre[")
+
+        with self._verrou:
+            if base is None:
+                base = self._prochain_bloc
+            self._prochain_bloc = base + index * self._pas
+            self._pas *= nombre
+            self._generation += 1
+
+    def ceder_espace(self, nb_blocs: int = BLOCS_PAR_ENFANT) -> tuple[int, int, float]:
+        """
+        Retire de la suite de ce processus ses `nb_blocs` prochains blocs (au plus la moitié du reste).
+
+        Renvoie l'espace cédé (prochain_bloc, pas, fin), à passer à adopter()
+        dans un autre processus.
+        """
+        with self._verrou:
+            return self._ceder(nb_blocs)
+
+    def _ceder(self, nb_blocs: int) -> tuple[int, int, float]:
+        debut = self._prochain_bloc
+        if self._fin != inf:
+            nb_blocs = min(nb_blocs, (self._fin - debut) // self._pas // 2)
+        fin = debut + max(nb_blocs, 0) * self._pas
+        self._prochain_bloc = fin
+        return debut, self._pas, fin
+
+    def adopter(self, espace: tuple[int, int, float]) -> None:
+        """Ne distribue plus que les blocs de `espace`, obtenu par ceder_espace()."""
+        with self._verrou:
+            self._prochain_bloc, self._pas, self._fin = espace
+            self._generation += 1
+
+    def etat(self) -> int:
+        """Plus petit identifiant dont ce processus garantit qu'il n'a pas été distribué."""
+        with self._verrou:
+            return self._prochain_bloc
+
+    def restaurer(self, prochain: int) -> None:
+        """Reprend la numérotation à `prochain` (ex. après rechargement d'un instantané)."""
+        with self._verrou:
+            self._prochain_bloc = prochain
+            self._pas = self._taille_bloc
+            self._generation += 1
+
+
+# allocateurs vivants, pour les crochets de fork (un seul enregistrement par processus)
+_ALLOCATEURS: "weakref.WeakSet[AllocateurIdentifiants]" = weakref.WeakSet()
+# espace cédé à l'enfant par chaque allocateur, entre _avant_fork et les crochets d'après
+_ESPACES_ENFANT: dict[AllocateurIdentifiants, tuple[int, int, float]] = {}
+
+
+def _avant_fork() -> None:
+    # verrous pris pendant le fork : l'enfant ne les hérite jamais au milieu d'une réservation
+    for allocateur in list(_ALLOCATEURS):
+        allocateur._verrou.acquire()
+        _ESPACES_ENFANT[allocateur] = allocateur._ceder(AllocateurIdentifiants.BLOCS_PAR_ENFANT)
+
+
+def _apres_fork_parent() -> None:
+    for allocateur in _ESPACES_ENFANT:
+        allocateur._verrou.release()
+    _ESPACES_ENFANT.clear()
+
+
+def _apres_fork_enfant() -> None:
+    for allocateur, (debut, pas, fin) in _ESPACES_ENFANT.items():
+        allocateur._verrou = threading.Lock()
+        allocateur._prochain_bloc, allocateur._pas, allocateur._fin = debut, pas, fin
+        # les blocs des threads du parent ne doivent pas être réutilisés par l'enfant
+        allocateur._generation += 1
+    _ESPACES_ENFANT.clear()
+
+
+os.register_at_fork(before=_avant_fork, after_in_parent=_apres_fork_parent, after_in_child=_apres_fork_enfant)
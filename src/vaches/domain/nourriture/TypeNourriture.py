@@ -8,3 +8,11 @@ class TypeNourriture(Enum):
     PAILLE = "paille"
     CEREALES = "cereales"
 
+    # Enum hache le nom en Python à chaque recherche dans un dict ; l'égalité des
+    # membres étant l'identité, le hachage par identité (en C) est équivalent
+    __hash__ = object.__hash__
+
+
+# position de chaque type dans l'énumération : sert d'indice aux rations stockées en tableau
+INDEX_NOURRITURE: dict[TypeNourriture, int] = {t: i for i, t in enumerate(TypeNourriture)}
+NB_TYPES_NOURRITURE: int = len(INDEX_NOURRITURE)
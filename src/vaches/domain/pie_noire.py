@@ -1,9 +1,28 @@
+from array import array
+
+from src.vaches.domain.errors.codes import CodeErreur
 from src.vaches.domain.errors.exceptions import InvalidVacheException
-from src.vaches.domain.nourriture.TypeNourriture import TypeNourriture
-from src.vaches.domain.vache import Vache
+from src.vaches.domain.nourriture.TypeNourriture import INDEX_NOURRITURE, NB_TYPES_NOURRITURE, TypeNourriture
+from src.vaches.domain.strategies.production_lait import LaitNutritionnel
 from src.vaches.domain.vache_a_lait import VacheALait
 
+_RATION_VIDE = memoryview(array("d", bytes(8 * NB_TYPES_NOURRITURE))).toreadonly()
+
+
+class _Tampon:
+    """Broutements différés d'une PieNoire : état prévu après application, dans l'ordre des appels."""
+
+    __slots__ = ("panse", "ration", "increments")
+
+    def __init__(self, panse: float, ration):
+        self.panse = panse
+        self.ration = ration
+        # (quantite, indice) de chaque appel, conservés seulement pour le journal
+        self.increments = []
+
+
 class PieNoire(VacheALait):
+    __slots__ = ("nb_taches_blanches", "_nb_taches_noires", "_ration", "_tampon")
 
     COEFFICIENT_NUTRITIONNEL = {
         TypeNourriture.HERBE: 1.0,
@@ -13,19 +32,23 @@ class PieNoire(VacheALait):
         TypeNourriture.CEREALES: 2.0
     }
 
+    STRATEGIE_LAIT = LaitNutritionnel
+
     def __init__(self, petit_nom: str, poids: float, nb_taches_blanches: int, nb_taches_noires: int):
 
         if type(nb_taches_blanches) is not int or type(nb_taches_noires) is not int:
-            raise InvalidVacheException()
+            raise InvalidVacheException(CodeErreur.TACHES_NON_ENTIERES)
 
         if nb_taches_blanches <= 0 or nb_taches_noires <= 0:
-            raise InvalidVacheException()
+            raise InvalidVacheException(CodeErreur.TACHES_NON_POSITIVES)
 
         super().__init__(petitNom=petit_nom, poids=poids)
 
         self.nb_taches_blanches = nb_taches_blanches
         self._nb_taches_noires = nb_taches_noires
-        self._ration = {}
+        # allouée au premier broutement typé seulement
+        self._ration = None
+        self._tampon = None
 
     @property
     def nb_taches_noires(self):
@@ -33,36 +56,146 @@ class PieNoire(VacheALait):
 
     @property
     def ration(self):
-        return self._ration.copy()
-
-    def brouter(self, quantite: float, nourriture=None):
+        if self._tampon is not None:
+            self.appliquer_tampon()
+        if self._ration is None:
+            return {}
+        return {t: q for t, q in zip(INDEX_NOURRITURE, self._ration) if q}
 
-        super().brouter(quantite, nourriture=None)
-
-        if nourriture:
-            q_actuelle = self._ration.get(nourriture, 0.0)
-            self._ration[nourriture] = q_actuelle + quantite
-
-    def ruminer(self):
-        if self.panse <= 0:
-            raise InvalidVacheException()
-
-        if not self._ration:
-            production = self.panse * self.RENDEMENT_LAIT
+    @property
+    def quantites_ration(self) -> memoryview:
+        """Vue en lecture seule de la ration, indexée par position dans TypeNourriture."""
+        if self._tampon is not None:
+            self.appliquer_tampon()
+        if self._ration is None:
+            return _RATION_VIDE
+        return memoryview(self._ration).toreadonly()
+
+    # check_* ne modifie rien : avec un tampon, les règles portent sur l'état
+    # prévu après son application (tampon.panse, tampon.ration), sans l'appliquer
+
+    def check_brouter(self, quantite: float, nourriture=None) -> CodeErreur:
+        if nourriture is not None and nourriture not in INDEX_NOURRITURE:
+            return CodeErreur.NOURRITURE_INTERDITE
+        tampon = self._tampon
+        if tampon is None:
+            return self._check_panse(quantite)
+        if quantite <= 0:
+            return CodeErreur.QUANTITE_NON_POSITIVE
+        if tampon.panse + quantite > self.PANSE_MAX:
+            return CodeErreur.PANSE_DEPASSEE
+        return CodeErreur.OK
+
+    def check_ruminer(self) -> CodeErreur:
+        tampon = self._tampon
+        if tampon is None:
+            return super().check_ruminer()
+        if tampon.panse <= 0:
+            return CodeErreur.PANSE_VIDE
+        if type(self)._calculer_lait is LaitNutritionnel.calculer:
+            lait = LaitNutritionnel.pour_ration(self, tampon.panse, tampon.ration)
         else:
-            facteur_nutritionnel = 0.0
-            for type_n, qte in self._ration.items():
-                coeff = self.COEFFICIENT_NUTRITIONNEL.get(type_n, 0.0)
-                facteur_nutritionnel += qte * coeff
-
-            production = facteur_nutritionnel * self.RENDEMENT_LAIT
+            # les autres stratégies ne lisent pas la ration
+            lait = self._calculer_lait(tampon.panse)
+        if self.lait_disponible + lait > self.PRODUCTION_LAIT_MAX:
+            return CodeErreur.PRODUCTION_LAIT_DEPASSEE
+        return CodeErreur.OK
 
-        if self.lait_disponible + production > self.PRODUCTION_LAIT_MAX:
-            raise InvalidVacheException()
-
-        Vache.ruminer(self)
-
-        self.lait_disponible += production
-        self.lait_total_produit += production
-
-        self._ration = {}
\ No newline at end of file
+    def brouter(self, quantite: float, nourriture=None):
+        if self._tampon is not None:
+            self.appliquer_tampon()
+
+        index = None
+        if nourriture is not None:
+            index = INDEX_NOURRITURE.get(nourriture)
+            if index is None:
+                raise InvalidVacheException(CodeErreur.NOURRITURE_INTERDITE)
+
+        self._remplir_panse(quantite)
+
+        if index is not None:
+            ration = self._ration
+            if ration is None:
+                ration = self._ration = array("d", bytes(8 * NB_TYPES_NOURRITURE))
+            ration[index] += quantite
+
+        if self._journal is not None:
+            self._journal.brouter(self.id, quantite, -1 if index is None else index)
+        for observateur in self._observateurs:
+            observateur.apres_brouter(self, quantite)
+
+    # -------------------------
+    # Broutement différé
+    # -------------------------
+
+    def brouter_differe(self, quantite: float, nourriture=None) -> None:
+        """
+        Broutement mis en tampon, pour les apports fréquents et petits (auges connectées).
+
+        Les règles sont vérifiées à l'appel, dans le même ordre que brouter et
+        sur l'état prévu après les apports déjà en tampon : un apport refusé lève
+        InvalidVacheException tout de suite et n'entre pas dans le tampon.
+        panse et ration ne sont mises à jour qu'à appliquer_tampon(), appelée
+        aussi par brouter, ruminer, ration et quantites_ration ; check_brouter
+        et check_ruminer vérifient l'état prévu sans appliquer le tampon.
+        L'état obtenu est, au bit près, celui d'appels successifs à brouter.
+        """
+        index = None
+        if nourriture is not None:
+            index = INDEX_NOURRITURE.get(nourriture)
+            if index is None:
+                raise InvalidVacheException(CodeErreur.NOURRITURE_INTERDITE)
+
+        if quantite <= 0:
+            raise InvalidVacheException(CodeErreur.QUANTITE_NON_POSITIVE)
+
+        tampon = self._tampon
+        if tampon is None:
+            tampon = self._tampon = _Tampon(self.panse, self._ration)
+
+        panse = tampon.panse + quantite
+        if panse > self.PANSE_MAX:
+            raise InvalidVacheException(CodeErreur.PANSE_DEPASSEE)
+        tampon.panse = panse
+
+        if index is not None:
+            ration = tampon.ration
+            if ration is None:
+                ration = tampon.ration = array("d", bytes(8 * NB_TYPES_NOURRITURE))
+            elif ration is self._ration:
+                # la ration courante reste intacte jusqu'à l'application
+                ration = tampon.ration = array("d", ration)
+            ration[index] += quantite
+
+        if self._journal is not None:
+            tampon.increments.append((quantite, -1 if index is None else index))
+
+    def appliquer_tampon(self) -> None:
+        """Applique d'un coup les broutements différés (sans effet si le tampon est vide)."""
+        tampon = self._tampon
+        if tampon is None:
+            return
+
+        self._tampon = None
+        panse_avant = self.panse
+        self.panse = tampon.panse
+        self._ration = tampon.ration
+
+        if self._journal is not None:
+            for quantite, index in tampon.increments:
+                self._journal.brouter(self.id, quantite, index)
+        for observateur in self._observateurs:
+            observateur.apres_brouter(self, tampon.panse - panse_avant)
+
+    def _pre_rumination(self) -> None:
+        if self._tampon is not None:
+            self.appliquer_tampon()
+
+    def _definir_ration(self, quantites) -> None:
+        """Remplace la ration par `quantites` (indexées comme TypeNourriture), pour les restaurations."""
+        self._tampon = None
+        self._ration = array("d", quantites) if any(quantites) else None
+
+    def _post_rumination(self, panse_avant: float, lait: float) -> None:
+        # la ration typée est consommée par la rumination
+        self._ration = None
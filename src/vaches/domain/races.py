@@ -0,0 +1,129 @@
+"""
+Registre des races : chaque sous-classe de Vache y est inscrite à sa création.
+
+L'inscription vérifie une fois pour toutes les constantes de la race, puis les
+fige : valeurs recopiées dans la classe elle-même, coefficients nutritionnels
+rangés en tuple indexé comme TypeNourriture et exposés en lecture seule. Aucune
+vérification ni construction de table n'a plus lieu par instance ou par appel.
+Une fois la race inscrite, ses constantes ne peuvent plus être réaffectées
+(métaclasse Race) : la classe et sa fiche ne divergent jamais.
+"""
+from collections.abc import Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
+
+from src.vaches.domain.errors.codes import CodeErreur
+from src.vaches.domain.errors.exceptions import InvalidVacheException
+from src.vaches.domain.nourriture.TypeNourriture import INDEX_NOURRITURE, TypeNourriture
+
+# constantes figées dans chaque race : nom -> (attribut de FicheRace, type)
+CONSTANTES = {
+    "AGE_MAX": ("age_max", int),
+    "AGE_NAISSANCE": ("age_naissance", int),
+    "POIDS_MAX": ("poids_max", float),
+    "PANSE_MAX": ("panse_max", float),
+    "RENDEMENT_RUMINATION": ("rendement_rumination", float),
+    "RENDEMENT_LAIT": ("rendement_lait", float),
+    "PRODUCTION_LAIT_MAX": ("production_lait_max", float),
+}
+# attributs de classe posés par enregistrer, en lecture seule ensuite
+FIGES = frozenset(CONSTANTES) | {"COEFFICIENT_NUTRITIONNEL", "_COEFFICIENTS", "_FICHE"}
+
+
+@dataclass(frozen=True, slots=True)
+class FicheRace:
+    # nom qualifié (module.classe) : deux classes homonymes restent distinctes
+    nom: str
+    classe: type
+    age_max: int
+    age_naissance: int
+    poids_max: float
+    panse_max: float
+    rendement_rumination: float
+    rendement_lait: float
+    production_lait_max: float
+    # coefficient de chaque TypeNourriture, rangés comme INDEX_NOURRITURE
+    coefficients: tuple[float, ...]
+    coefficients_par_type: MappingProxyType
+
+
+_FICHES: dict[type, FicheRace] = {}
+
+
+class Race(type):
+    """Métaclasse de Vache : refuse de réaffecter ou supprimer une constante figée d'une race inscrite."""
+
+    def __setattr__(cls, nom, valeur):
+        cls._verifier_modifiable(nom)
+        super().__setattr__(nom, valeur)
+
+    def __delattr__(cls, nom):
+        cls._verifier_modifiable(nom)
+        super().__delattr__(nom)
+
+    def _verifier_modifiable(cls, nom):
+        if nom in FIGES and cls in _FICHES:
+            raise AttributeError(f"{cls.__name__}.{nom} est figée par le registre des races")
+
+
+def enregistrer(classe: type) -> FicheRace:
+    """Valide et fige les constantes de `classe` ; lève InvalidVacheException si l'une est incohérente."""
+    valeurs = {}
+    for constante, (champ, genre) in CONSTANTES.items():
+        valeur = getattr(classe, constante, 0)
+        if isinstance(valeur, bool) or not isinstance(valeur, (int, float)):
+            _refuser(classe, f"{constante} doit être un nombre")
+        valeurs[champ] = genre(valeur)
+
+    if not 0 <= valeurs["age_naissance"] <= valeurs["age_max"]:
+        _refuser(classe, "AGE_NAISSANCE doit être dans [0, AGE_MAX]", CodeErreur.AGE_NAISSANCE_INVALIDE)
+    if valeurs["panse_max"] <= 0 or valeurs["poids_max"] <= 0:
+        _refuser(classe, "PANSE_MAX et POIDS_MAX doivent être > 0")
+    if not 0 < valeurs["rendement_rumination"] <= 1:
+        _refuser(classe, "RENDEMENT_RUMINATION doit être dans ]0, 1]")
+    if valeurs["rendement_lait"] < 0 or valeurs["production_lait_max"] < 0:
+        _refuser(classe, "RENDEMENT_LAIT et PRODUCTION_LAIT_MAX doivent être >= 0")
+
+    coefficients = getattr(classe, "COEFFICIENT_NUTRITIONNEL", {})
+    if not isinstance(coefficients, Mapping):
+        _refuser(classe, "COEFFICIENT_NUTRITIONNEL doit être un dictionnaire")
+    coefficients = dict(coefficients)
+    for nourriture, coefficient in coefficients.items():
+        if not isinstance(nourriture, TypeNourriture):
+            _refuser(classe, f"COEFFICIENT_NUTRITIONNEL : {nourriture!r} n'est pas un TypeNourriture")
+        if isinstance(coefficient, bool) or not isinstance(coefficient, (int, float)):
+            _refuser(classe, f"COEFFICIENT_NUTRITIONNEL[{nourriture.name}] doit être un nombre")
+        if coefficient < 0:
+            _refuser(classe, f"COEFFICIENT_NUTRITIONNEL[{nourriture.name}] doit être >= 0")
+
+    fiche = FicheRace(
+        nom=f"{classe.__module__}.{classe.__qualname__}",
+        classe=classe,
+        coefficients=tuple(float(coefficients.get(t, 0.0)) for t in INDEX_NOURRITURE),
+        coefficients_par_type=MappingProxyType({t: float(c) for t, c in coefficients.items()}),
+        **valeurs,
+    )
+
+    # type.__setattr__ : les attributs figés ne passent pas par le garde de Race
+    for constante, (champ, _) in CONSTANTES.items():
+        if hasattr(classe, constante):
+            type.__setattr__(classe, constante, getattr(fiche, champ))
+    if hasattr(classe, "COEFFICIENT_NUTRITIONNEL"):
+        type.__setattr__(classe, "COEFFICIENT_NUTRITIONNEL", fiche.coefficients_par_type)
+    type.__setattr__(classe, "_COEFFICIENTS", fiche.coefficients)
+    type.__setattr__(classe, "_FICHE", fiche)
+    _FICHES[classe] = fiche
+    return fiche
+
+
+def fiche(classe: type) -> FicheRace:
+    return _FICHES[classe]
+
+
+def races() -> dict[str, type]:
+    """Races inscrites, par nom qualifié (module.classe)."""
+    return {f.nom: f.classe for f in _FICHES.values()}
+
+
+def _refuser(classe: type, detail: str, code: CodeErreur = CodeErreur.CONSTANTE_RACE_INVALIDE) -> None:
+    raise InvalidVacheException(code, f"{classe.__name__} : {detail}")
@@ -0,0 +1,49 @@
+from abc import ABC, abstractmethod
+from operator import mul
+
+
+class StrategieLait(ABC):
+    """
+    Calcul du lait produit par une rumination.
+
+    `calculer(vache, panse_avant)` est installée telle quelle comme hook
+    `_calculer_lait` de la race qui la déclare (Vache.STRATEGIE_LAIT) : la
+    stratégie est résolue une fois à la création de la classe, pas à chaque cycle.
+    """
+
+    @staticmethod
+    @abstractmethod
+    def calculer(vache, panse_avant: float) -> float:
+        ...
+
+
+class SansLait(StrategieLait):
+    @staticmethod
+    def calculer(vache, panse_avant: float) -> float:
+        return 0.0
+
+
+class LaitProportionnel(StrategieLait):
+    """lait = RENDEMENT_LAIT * panse_avant"""
+
+    @staticmethod
+    def calculer(vache, panse_avant: float) -> float:
+        return panse_avant * vache.RENDEMENT_LAIT
+
+
+class LaitNutritionnel(StrategieLait):
+    """lait = RENDEMENT_LAIT * somme(quantite * coefficient), proportionnel sans ration typée."""
+
+    @staticmethod
+    def calculer(vache, panse_avant: float) -> float:
+        ration = vache._ration
+        if ration is None:
+            return panse_avant * vache.RENDEMENT_LAIT
+        return sum(map(mul, ration, vache._COEFFICIENTS)) * vache.RENDEMENT_LAIT
+
+    @staticmethod
+    def pour_ration(vache, panse_avant: float, ration) -> float:
+        """Comme calculer, avec `ration` au lieu de vache._ration (état prévu d'un broutement différé)."""
+        if ration is None:
+            return panse_avant * vache.RENDEMENT_LAIT
+        return sum(map(mul, ration, vache._COEFFICIENTS)) * vache.RENDEMENT_LAIT
@@ -1,6 +1,12 @@
+from src.vaches.domain.errors.codes import CodeErreur
 from src.vaches.domain.errors.exceptions import InvalidVacheException
+from src.vaches.domain.identifiants import AllocateurIdentifiants
+from src.vaches.domain.races import Race, enregistrer
+from src.vaches.domain.strategies.production_lait import SansLait
+
+class Vache(metaclass=Race):
+    __slots__ = ("id", "petit_nom", "poids", "age", "panse", "_observateurs")
 
-class Vache:
     AGE_MAX:int = 25
     POIDS_MAX:float = 1000.0
     PANSE_MAX:float = 50.0
@@ -9,50 +15,171 @@ class Vache:
     RENDEMENT_RUMINATION:float = 0.25
     AGE_NAISSANCE:int = 0
 
-    _NEXT_ID = 1
+    # stratégie de production de lait, installée comme hook _calculer_lait
+    STRATEGIE_LAIT = SansLait
+    _calculer_lait = SansLait.calculer
+
+    # hooks effectifs de la race, résolus une fois dans __init_subclass__ :
+    # ruminer n'appelle que ceux qui font quelque chose
+    _PRE_RUMINATION = False
+    _PRODUIT_LAIT = False
+    _POST_RUMINATION = False
+
+    _ALLOCATEUR_ID = AllocateurIdentifiants()
+    _journal = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # constantes validées et figées une fois par race, pas à chaque instance
+        enregistrer(cls)
+        if "_calculer_lait" not in cls.__dict__:
+            cls._calculer_lait = cls.STRATEGIE_LAIT.calculer
+        cls._PRE_RUMINATION = cls._pre_rumination is not Vache._pre_rumination
+        cls._PRODUIT_LAIT = cls._calculer_lait is not SansLait.calculer
+        cls._POST_RUMINATION = cls._post_rumination is not Vache._post_rumination
 
     def __init__(self, petit_nom: str, poids: float):
         if not petit_nom or not petit_nom.strip():
-            raise InvalidVacheException()
-
-        if not (0 <= self.AGE_NAISSANCE <= self.AGE_MAX):
-            raise InvalidVacheException()
+            raise InvalidVacheException(CodeErreur.PETIT_NOM_VIDE)
 
         if poids < 0:
-            raise InvalidVacheException()
+            raise InvalidVacheException(CodeErreur.POIDS_NEGATIF)
 
-        self.id = Vache._NEXT_ID
-        Vache._NEXT_ID += 1
+        self.id = Vache._ALLOCATEUR_ID.prochain()
 
         self.petit_nom = petit_nom
         self.poids = float(poids)
         self.age = self.AGE_NAISSANCE
         self.panse = self.PENSE_VIDE
+        # conteneurs notifiés après chaque opération réussie (voir observer)
+        self._observateurs = ()
 
 
-    def brouter(self, quantite: float, nourriture=None):
+    @staticmethod
+    def utiliser_allocateur(allocateur) -> None:
+        """Remplace l'allocateur d'identifiants partagé par toute la hiérarchie."""
+        Vache._ALLOCATEUR_ID = allocateur
+
+    @staticmethod
+    def allocateur():
+        return Vache._ALLOCATEUR_ID
+
+    def observer(self, observateur) -> None:
+        """
+        Abonne `observateur` aux opérations de la vache : apres_brouter,
+        apres_ruminer, apres_traire et apres_vieillir ne sont appelées
+        qu'une fois l'opération entièrement appliquée.
+        """
+        if observateur not in self._observateurs:
+            self._observateurs += (observateur,)
+
+    def ne_plus_observer(self, observateur) -> None:
+        self._observateurs = tuple(o for o in self._observateurs if o is not observateur)
+
+    @staticmethod
+    def journaliser(journal) -> None:
+        """Active (ou désactive avec None) le journal des opérations de toute la hiérarchie."""
+        Vache._journal = journal
+
+    # -------------------------
+    # Validation sans exception : renvoie la règle qui serait violée (CodeErreur.OK sinon)
+    # -------------------------
+
+    def check_brouter(self, quantite: float, nourriture=None) -> CodeErreur:
         if nourriture is not None:
-            raise InvalidVacheException()
+            return CodeErreur.NOURRITURE_INTERDITE
+        return self._check_panse(quantite)
 
+    def _check_panse(self, quantite: float) -> CodeErreur:
         if quantite <= 0:
-            raise InvalidVacheException()
-
+            return CodeErreur.QUANTITE_NON_POSITIVE
         if self.panse + quantite > self.PANSE_MAX:
-            raise InvalidVacheException()
-
-        self.panse += quantite
+            return CodeErreur.PANSE_DEPASSEE
+        return CodeErreur.OK
 
-    def ruminer(self):
+    def check_ruminer(self) -> CodeErreur:
         if self.panse <= 0:
-            raise InvalidVacheException()
+            return CodeErreur.PANSE_VIDE
+        return CodeErreur.OK
 
-        gain = self.panse * self.RENDEMENT_RUMINATION
-        self.poids += gain
+    def check_vieillir(self) -> CodeErreur:
+        if self.age >= self.AGE_MAX:
+            return CodeErreur.AGE_MAX_ATTEINT
+        return CodeErreur.OK
+
+    # -------------------------
+    # Opérations
+    # -------------------------
+
+    def brouter(self, quantite: float, nourriture=None):
+        if nourriture is not None:
+            raise InvalidVacheException(CodeErreur.NOURRITURE_INTERDITE)
+
+        self._remplir_panse(quantite)
+
+        if self._journal is not None:
+            self._journal.brouter(self.id, quantite)
+        for observateur in self._observateurs:
+            observateur.apres_brouter(self, quantite)
 
+    def _remplir_panse(self, quantite: float) -> None:
+        code = self._check_panse(quantite)
+        if code:
+            raise InvalidVacheException(code)
+
+        self.panse += quantite
+
+    def ruminer(self) -> float:
+        """
+        Template method : définie ici seulement, les races agissent via les hooks
+        _pre_rumination, _calculer_lait, _stocker_lait et _post_rumination.
+        Renvoie le lait produit.
+        """
+        if self._PRE_RUMINATION:
+            self._pre_rumination()
+
+        panse_avant = self.panse
+        if panse_avant <= 0:
+            raise InvalidVacheException(CodeErreur.PANSE_VIDE)
+
+        lait = 0.0
+        if self._PRODUIT_LAIT:
+            lait = self._calculer_lait(panse_avant)
+            # seul hook qui peut refuser : il valide avant de modifier quoi que ce soit
+            self._stocker_lait(lait)
+
+        gain = panse_avant * self.RENDEMENT_RUMINATION
+        self.poids += gain
         self.panse = 0.0
 
+        if self._POST_RUMINATION:
+            self._post_rumination(panse_avant, lait)
+
+        if self._journal is not None:
+            self._journal.ruminer(self.id, gain, lait)
+        for observateur in self._observateurs:
+            observateur.apres_ruminer(self, panse_avant, gain, lait)
+        return lait
+
+    def _pre_rumination(self) -> None:
+        pass
+
+    def _stocker_lait(self, lait: float) -> None:
+        pass
+
+    def _post_rumination(self, panse_avant: float, lait: float) -> None:
+        pass
+
     def vieillir(self):
         if self.age >= self.AGE_MAX:
-            raise InvalidVacheException()
+            raise InvalidVacheException(CodeErreur.AGE_MAX_ATTEINT)
+
+        self.age += 1
+
+        if self._journal is not None:
+            self._journal.vieillir(self.id)
+        for observateur in self._observateurs:
+            observateur.apres_vieillir(self)
+
 
-        self.age += 1
\ No newline at end of file
+enregistrer(Vache)
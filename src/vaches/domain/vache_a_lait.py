@@ -1,36 +1,56 @@
+from src.vaches.domain.errors.codes import CodeErreur
 from src.vaches.domain.errors.exceptions import InvalidVacheException
+from src.vaches.domain.strategies.production_lait import LaitProportionnel
 from src.vaches.domain.vache import Vache
 
 class VacheALait(Vache):
+    __slots__ = ("lait_disponible", "lait_total_produit", "lait_total_traite")
+
     RENDEMENT_LAIT = 1.1
     PRODUCTION_LAIT_MAX = 40.0
 
+    STRATEGIE_LAIT = LaitProportionnel
+
     def __init__(self, petitNom: str, poids: float):
         super().__init__(petit_nom=petitNom, poids=poids)
         self.lait_disponible = 0.0
         self.lait_total_produit = 0.0
         self.lait_total_traite = 0.0
 
-    def ruminer(self):
+    def check_ruminer(self) -> CodeErreur:
         if self.panse <= 0:
-            raise InvalidVacheException()
-
-        production = self.panse * self.RENDEMENT_LAIT
-
-        if self.lait_disponible + production > self.PRODUCTION_LAIT_MAX:
-            raise InvalidVacheException()
-
-        super().ruminer()
-
-        self.lait_disponible += production
-        self.lait_total_produit += production
+            return CodeErreur.PANSE_VIDE
+        if self.lait_disponible + self._calculer_lait(self.panse) > self.PRODUCTION_LAIT_MAX:
+            return CodeErreur.PRODUCTION_LAIT_DEPASSEE
+        return CodeErreur.OK
+
+    def check_traire(self, litres: float) -> CodeErreur:
+        if litres <= 0:
+            return CodeErreur.LITRES_NON_POSITIFS
+        if litres > self.lait_disponible:
+            return CodeErreur.LAIT_INSUFFISANT
+        return CodeErreur.OK
+
+    def _stocker_lait(self, lait: float) -> None:
+        disponible = self.lait_disponible + lait
+        if disponible > self.PRODUCTION_LAIT_MAX:
+            raise InvalidVacheException(CodeErreur.PRODUCTION_LAIT_DEPASSEE)
+
+        self.lait_disponible = disponible
+        self.lait_total_produit += lait
 
     def traire(self, litres: float) -> float:
-        if litres <= 0 or litres > self.lait_disponible:
-            raise InvalidVacheException()
+        code = self.check_traire(litres)
+        if code:
+            raise InvalidVacheException(code)
 
         self.lait_disponible -= litres
         self.lait_total_traite += litres
+
+        if self._journal is not None:
+            self._journal.traire(self.id, litres)
+        for observateur in self._observateurs:
+            observateur.apres_traire(self, litres)
         return litres
 
     def __str__(self):
@@ -0,0 +1,154 @@
+import csv
+import json
+import math
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Iterator
+
+import numpy as np
+
+from src.vaches.domain.errors.codes import CodeErreur
+from src.vaches.domain.pie_noire import PieNoire
+from src.vaches.domain.vache import Vache
+from src.vaches.domain.vache_a_lait import VacheALait
+
+TAILLE_LOT: int = 10_000
+
+
+
+@dataclass(frozen=True, slots=True)
+class Rejet:
+    ligne: int
+    champ: str
+    code: CodeErreur
+    valeur: object
+
+
+@dataclass(slots=True)
+class Lot:
+    vaches: list = field(default_factory=list)
+    rejets: list[Rejet] = field(default_factory=list)
+
+
+def charger(chemin: str, race: type = VacheALait, taille_lot: int = TAILLE_LOT, format: str | None = None) -> Iterator[Lot]:
+    """
+    Lit un fichier de troupeau (CSV avec en-tête ou JSON lines) par lots de `taille_lot` lignes.
+
+    Colonnes attendues : petit_nom, poids, et pour PieNoire nb_taches_blanches,
+    nb_taches_noires. Les invariants des constructeurs sont vérifiés sur tout le
+    lot d'un coup ; chaque lot contient les vaches valides et un Rejet par règle
+    violée. La mémoire utilisée ne dépend que de `taille_lot`.
+
+    Une ligne illisible (JSON invalide ou qui n'est pas un objet) devient un
+    Rejet LIGNE_ILLISIBLE sans interrompre le chargement. Les Rejet sont
+    numérotés par enregistrement en CSV (en-tête exclu) et par ligne physique
+    du fichier en JSON lines (lignes vides comprises).
+    """
+    if not issubclass(race, Vache):
+        raise ValueError("race doit être une sous-classe de Vache")
+
+    if format is None:
+        format = "csv" if chemin.endswith(".csv") else "jsonl"
+
+    with open(chemin, newline="", encoding="utf-8") as fichier:
+        if format == "csv":
+            lignes = enumerate(csv.DictReader(fichier), 1)
+        elif format == "jsonl":
+            lignes = _lire_jsonl(fichier)
+        else:
+            raise ValueError(f"format inconnu : {format}")
+
+        while True:
+            lot = list(islice(lignes, taille_lot))
+            if not lot:
+                return
+            yield _valider_lot(lot, race, texte=format == "csv")
+
+
+def _lire_jsonl(fichier) -> Iterator[tuple[int, dict | Rejet]]:
+    """(numéro de ligne physique, objet lu ou Rejet) pour chaque ligne non vide."""
+    for numero, texte in enumerate(fichier, 1):
+        if not texte.strip():
+            continue
+        try:
+            contenu = json.loads(texte)
+        except ValueError:
+            yield numero, Rejet(numero, "ligne", CodeErreur.LIGNE_ILLISIBLE, texte.rstrip("\r\n"))
+            continue
+        if isinstance(contenu, dict):
+            yield numero, contenu
+        else:
+            yield numero, Rejet(numero, "ligne", CodeErreur.LIGNE_ILLISIBLE, contenu)
+
+
+def _valider_lot(entrees: list[tuple[int, dict | Rejet]], race: type, texte: bool) -> Lot:
+    lot = Lot()
+    numeros = []
+    lignes = []
+    for numero, contenu in entrees:
+        if isinstance(contenu, Rejet):
+            lot.rejets.append(contenu)
+        else:
+            numeros.append(numero)
+            lignes.append(contenu)
+
+    noms = [l.get("petit_nom") for l in lignes]
+    poids_bruts = [l.get("poids") for l in lignes]
+
+    # un nom absent ou non textuel est traité comme vide
+    noms_texte = np.array([n if isinstance(n, str) else "" for n in noms], dtype=str)
+    poids = np.array([en_reel(p) for p in poids_bruts])
+
+    regles = [
+        ("petit_nom", CodeErreur.PETIT_NOM_VIDE, np.char.str_len(np.char.strip(noms_texte)) == 0, noms),
+        ("poids", CodeErreur.POIDS_NON_NUMERIQUE, np.isnan(poids), poids_bruts),
+        ("poids", CodeErreur.POIDS_NEGATIF, poids < 0, poids_bruts),
+    ]
+
+    taches = []
+    if issubclass(race, PieNoire):
+        for champ in ("nb_taches_blanches", "nb_taches_noires"):
+            bruts = [l.get(champ) for l in lignes]
+            # entiers Python, sans borne : PieNoire accepte tout int
+            valeurs = [_en_entier(b, texte) for b in bruts]
+            non_entier = np.array([v is None for v in valeurs], dtype=bool)
+            non_positif = np.array([v is not None and v <= 0 for v in valeurs], dtype=bool)
+            regles.append((champ, CodeErreur.TACHES_NON_ENTIERES, non_entier, bruts))
+            regles.append((champ, CodeErreur.TACHES_NON_POSITIVES, non_positif, bruts))
+            taches.append(valeurs)
+
+    invalides = np.zeros(len(lignes), dtype=bool)
+    for champ, code, masque, bruts in regles:
+        invalides |= masque
+        for i in np.flatnonzero(masque):
+            lot.rejets.append(Rejet(numeros[i], champ, code, bruts[i]))
+    lot.rejets.sort(key=lambda r: r.ligne)
+
+    for i in np.flatnonzero(~invalides).tolist():
+        if taches:
+            lot.vaches.append(race(noms[i], float(poids[i]), taches[0][i], taches[1][i]))
+        else:
+            lot.vaches.append(race(noms[i], float(poids[i])))
+    return lot
+
+
+def en_reel(valeur) -> float:
+    """`valeur` en float, NaN si elle n'est pas numérique (booléens compris)."""
+    if isinstance(valeur, bool):
+        return math.nan
+    try:
+        return float(valeur)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+def _en_entier(valeur, texte: bool) -> int | None:
+    # même exigence que PieNoire : un vrai int (en CSV, où tout est texte, un littéral entier)
+    if type(valeur) is int:
+        return valeur
+    if texte and isinstance(valeur, str):
+        try:
+            return int(valeur)
+        except ValueError:
+            return None
+    return None
@@ -0,0 +1,198 @@
+"""
+Instantané binaire d'un troupeau : colonnes typées, contiguës, projetables en mémoire.
+
+Format (petit-boutiste) :
+- en-tête : magic, version, nombre de sections, nombre de vaches, race
+  (nom qualifié du registre des races) ;
+- table des sections : nom, dtype NumPy, décalage dans le fichier, nombre d'éléments ;
+- données de chaque section, alignées sur 64 octets.
+
+Sections : les colonnes de Troupeau.COLONNES (dont la matrice ration), les
+petits noms (octets UTF-8 concaténés + décalages) et, pour une race à taches,
+nb_taches_blanches / nb_taches_noires. Un TroupeauExact se reconnaît au dtype
+entier de sa colonne poids.
+"""
+import os
+import struct
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import numpy as np
+
+from src.vaches.domain.pie_noire import PieNoire
+from src.vaches.domain.races import fiche, races
+from src.vaches.domain.vache import Vache
+from src.vaches.troupeau.troupeau import Troupeau
+from src.vaches.troupeau.troupeau_exact import TroupeauExact
+
+MAGIC = b"VACHSNAP"
+VERSION = 2
+ALIGNEMENT = 64
+
+# en-tête : magic, version, nombre de sections, nombre de vaches, nom qualifié de la race
+_EN_TETE = struct.Struct("<8sIIq128s")
+# section : nom, dtype (np.dtype.str), décalage, nombre d'éléments
+_SECTION = struct.Struct("<24s8sqq")
+
+
+@dataclass(slots=True)
+class Instantane:
+    """Troupeau restauré, adossé sans copie au fichier projeté."""
+
+    troupeau: Troupeau
+    nb_taches_blanches: np.ndarray | None = None
+    nb_taches_noires: np.ndarray | None = None
+
+    def vaches(self) -> list[Vache]:
+        """Recrée les objets (O(n) en Python : à réserver aux petits troupeaux)."""
+        t = self.troupeau
+        race = t.race
+        poids, panse = t.reels("poids"), t.reels("panse")
+        if t.laitiere:
+            disponible, produit, traite = (t.reels(nom) for nom in
+                                           ("lait_disponible", "lait_total_produit", "lait_total_traite"))
+        ration = t.reels("ration")
+        vaches = []
+        for i in range(len(t)):
+            vache = race.__new__(race)
+            vache.id = int(t.ids[i])
+            vache.petit_nom = t.petits_noms[i]
+            vache.poids = float(poids[i])
+            vache.age = int(t.age[i])
+            vache.panse = float(panse[i])
+            vache._observateurs = ()
+            if t.laitiere:
+                vache.lait_disponible = float(disponible[i])
+                vache.lait_total_produit = float(produit[i])
+                vache.lait_total_traite = float(traite[i])
+            if isinstance(vache, PieNoire):
+                vache.nb_taches_blanches = int(self.nb_taches_blanches[i])
+                vache._nb_taches_noires = int(self.nb_taches_noires[i])
+                vache._tampon = None
+                vache._definir_ration(ration[i].tolist())
+            vaches.append(vache)
+        return vaches
+
+
+class PetitsNoms(Sequence):
+    """Petits noms décodés à la demande depuis les octets UTF-8 projetés."""
+
+    def __init__(self, octets: np.ndarray, decalages: np.ndarray):
+        self._octets = octets
+        self._decalages = decalages
+
+    def __len__(self) -> int:
+        return len(self._decalages) - 1
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError(i)
+        return self._octets[self._decalages[i]:self._decalages[i + 1]].tobytes().decode("utf-8")
+
+
+def sauvegarder(chemin: str, troupeau: Troupeau, nb_taches_blanches=None, nb_taches_noires=None) -> None:
+    """
+    Écrit l'instantané de `troupeau` dans `chemin`.
+
+    Pour une race à taches, `nb_taches_blanches` et `nb_taches_noires` sont
+    obligatoires (un entier par vache) : sans eux, l'instantané ne pourrait
+    pas recréer les vaches. Le fichier est écrit à côté puis renommé : un
+    instantané existant n'est jamais laissé à moitié réécrit.
+    """
+    race = fiche(troupeau.race).nom.encode()
+    if len(race) > _EN_TETE.size - struct.calcsize("<8sIIq"):
+        raise ValueError(f"nom de race trop long pour l'en-tête : {fiche(troupeau.race).nom}")
+    sections = dict(troupeau.colonnes())
+
+    noms = [nom.encode("utf-8") for nom in troupeau.petits_noms]
+    decalages = np.zeros(len(noms) + 1, dtype=np.int64)
+    np.cumsum(np.fromiter(map(len, noms), dtype=np.int64, count=len(noms)), out=decalages[1:])
+    sections["noms_octets"] = np.frombuffer(b"".join(noms), dtype=np.uint8)
+    sections["noms_decalages"] = decalages
+
+    if issubclass(troupeau.race, PieNoire):
+        for nom, taches in (("nb_taches_blanches", nb_taches_blanches), ("nb_taches_noires", nb_taches_noires)):
+            if taches is None:
+                raise ValueError(f"{nom} est requis pour un troupeau de {troupeau.race.__name__}")
+            taches = np.asarray(taches, dtype=np.int64)
+            if taches.shape != (len(troupeau),):
+                raise ValueError(f"{nom} doit contenir un entier par vache ({len(troupeau)})")
+            sections[nom] = taches
+
+    table = []
+    decalage = _aligner(_EN_TETE.size + len(sections) * _SECTION.size)
+    for nom, tableau in sections.items():
+        table.append((nom, tableau, decalage))
+        decalage = _aligner(decalage + tableau.nbytes)
+
+    provisoire = chemin + ".tmp"
+    with open(provisoire, "wb") as f:
+        f.write(_EN_TETE.pack(MAGIC, VERSION, len(sections), len(troupeau), race))
+        for nom, tableau, position in table:
+            f.write(_SECTION.pack(nom.encode(), tableau.dtype.str.encode(), position, tableau.size))
+        for nom, tableau, position in table:
+            f.seek(position)
+            f.write(np.ascontiguousarray(tableau).data)
+        f.truncate(decalage)
+    os.replace(provisoire, chemin)
+
+
+def sauvegarder_vaches(chemin: str, vaches) -> None:
+    """Instantané d'une liste de vaches d'une même race (passe par Troupeau.depuis_vaches : TypeError si races mêlées)."""
+    vaches = list(vaches)
+    troupeau = Troupeau.depuis_vaches(vaches)
+    if issubclass(troupeau.race, PieNoire):
+        sauvegarder(chemin, troupeau,
+                    [v.nb_taches_blanches for v in vaches], [v.nb_taches_noires for v in vaches])
+    else:
+        sauvegarder(chemin, troupeau)
+
+
+def restaurer(chemin: str, mode: str = "c", reprendre_identifiants: bool = True) -> Instantane:
+    """
+    Projette l'instantané en mémoire sans le copier.
+
+    mode "c" (défaut) : copie à l'écriture, le fichier n'est jamais modifié ;
+    "r+" : les opérations du troupeau écrivent dans le fichier ; "r" : lecture seule.
+    Avec `reprendre_identifiants`, l'allocateur de Vache reprend après le plus
+    grand id de l'instantané, pour ne jamais redonner un id existant.
+    """
+    with open(chemin, "rb") as f:
+        brut = f.read(_EN_TETE.size)
+        if len(brut) < _EN_TETE.size:
+            raise ValueError(f"{chemin} : en-tête d'instantané tronqué")
+        magic, version, nb_sections, nombre, race = _EN_TETE.unpack(brut)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{chemin} : instantané de format inconnu")
+        table = [_SECTION.unpack(f.read(_SECTION.size)) for _ in range(nb_sections)]
+
+    race = races().get(race.rstrip(b"\0").decode())
+    if race is None:
+        raise ValueError(f"{chemin} : race inconnue")
+
+    projection = np.memmap(chemin, dtype=np.uint8, mode=mode)
+    sections = {}
+    for nom, dtype, position, taille in table:
+        dtype = np.dtype(dtype.rstrip(b"\0").decode())
+        sections[nom.rstrip(b"\0").decode()] = np.ndarray((taille,), dtype=dtype, buffer=projection, offset=position)
+
+    classe = TroupeauExact if sections["poids"].dtype.kind == "i" else Troupeau
+    colonnes = {nom: sections[nom].reshape(nombre, *forme) for nom, _, forme in classe.COLONNES}
+    noms = PetitsNoms(sections["noms_octets"], sections["noms_decalages"])
+    troupeau = classe.sur_colonnes(race, colonnes, noms)
+
+    if reprendre_identifiants and nombre:
+        allocateur = Vache.allocateur()
+        prochain = int(colonnes["ids"].max()) + 1
+        if prochain > allocateur.etat():
+            allocateur.restaurer(prochain)
+
+    return Instantane(troupeau, sections.get("nb_taches_blanches"), sections.get("nb_taches_noires"))
+
+
+def _aligner(decalage: int) -> int:
+    return -(-decalage // ALIGNEMENT) * ALIGNEMENT
@@ -0,0 +1,198 @@
+import os
+import struct
+from enum import IntEnum
+
+import numpy as np
+
+from src.vaches.domain.nourriture.TypeNourriture import NB_TYPES_NOURRITURE
+from src.vaches.domain.pie_noire import PieNoire
+from src.vaches.domain.vache_a_lait import VacheALait
+
+MAGIC = b"VACHJRNL"
+VERSION = 1
+
+# en-tête : magic, version, taille d'un enregistrement
+_EN_TETE = struct.Struct("<8sII")
+# enregistrement : opération, indice de nourriture (-1 = aucune), id, valeur, gain de poids
+_ENREGISTREMENT = struct.Struct("<Bb6xqdd")
+
+DTYPE_ENREGISTREMENT = np.dtype([
+    ("operation", "u1"),
+    ("nourriture", "i1"),
+    ("_", "V6"),
+    ("id", "<i8"),
+    ("valeur", "<f8"),
+    ("gain", "<f8"),
+])
+
+SANS_NOURRITURE = -1
+
+
+class Operation(IntEnum):
+    BROUTER = 1
+    RUMINER = 2
+    TRAIRE = 3
+    VIEILLIR = 4
+
+
+class Journal:
+    """
+    Journal binaire en ajout seul des opérations sur les vaches.
+
+    Un enregistrement fait 32 octets. Ils sont accumulés dans un tampon et
+    écrits par lots de `taille_lot`. À activer avec Vache.journaliser(journal).
+    """
+
+    TAILLE_LOT: int = 4096
+
+    def __init__(self, chemin: str, taille_lot: int = TAILLE_LOT):
+        nouveau = not os.path.exists(chemin) or os.path.getsize(chemin) == 0
+        if not nouveau:
+            _verifier_en_tete(chemin)
+            # après un arrêt brutal, on écarte l'éventuel enregistrement à moitié écrit
+            os.truncate(chemin, _EN_TETE.size + _nombre_enregistrements(chemin) * _ENREGISTREMENT.size)
+
+        self.chemin = chemin
+        self._fichier = open(chemin, "ab")
+        if nouveau:
+            self._fichier.write(_EN_TETE.pack(MAGIC, VERSION, _ENREGISTREMENT.size))
+
+        self._tampon = bytearray(taille_lot * _ENREGISTREMENT.size)
+        self._position = 0
+
+    def brouter(self, ident: int, quantite: float, nourriture: int = SANS_NOURRITURE) -> None:
+        self._ajouter(Operation.BROUTER, nourriture, ident, quantite, 0.0)
+
+    def ruminer(self, ident: int, gain: float, lait: float) -> None:
+        self._ajouter(Operation.RUMINER, SANS_NOURRITURE, ident, lait, gain)
+
+    def traire(self, ident: int, litres: float) -> None:
+        self._ajouter(Operation.TRAIRE, SANS_NOURRITURE, ident, litres, 0.0)
+
+    def vieillir(self, ident: int) -> None:
+        self._ajouter(Operation.VIEILLIR, SANS_NOURRITURE, ident, 0.0, 0.0)
+
+    def _ajouter(self, operation: int, nourriture: int, ident: int, valeur: float, gain: float) -> None:
+        _ENREGISTREMENT.pack_into(self._tampon, self._position, operation, nourriture, ident, valeur, gain)
+        self._position += _ENREGISTREMENT.size
+        if self._position == len(self._tampon):
+            self.vider()
+
+    def vider(self) -> None:
+        if self._position:
+            self._fichier.write(memoryview(self._tampon)[: self._position])
+            self._position = 0
+        self._fichier.flush()
+
+    def fermer(self) -> None:
+        if not self._fichier.closed:
+            self.vider()
+            self._fichier.close()
+
+    def __enter__(self) -> "Journal":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.fermer()
+
+
+def _verifier_en_tete(chemin: str) -> None:
+    with open(chemin, "rb") as f:
+        brut = f.read(_EN_TETE.size)
+    if len(brut) < _EN_TETE.size:
+        raise ValueError(f"{chemin} : en-tête de journal tronqué")
+
+    magic, version, taille = _EN_TETE.unpack(brut)
+    if magic != MAGIC or version != VERSION or taille != _ENREGISTREMENT.size:
+        raise ValueError(f"{chemin} : journal de format inconnu")
+
+
+def _nombre_enregistrements(chemin: str) -> int:
+    return (os.path.getsize(chemin) - _EN_TETE.size) // _ENREGISTREMENT.size
+
+
+def lire(chemin: str) -> np.ndarray:
+    """Projette le journal en mémoire (sans copie) ; un enregistrement final tronqué est ignoré."""
+    _verifier_en_tete(chemin)
+    nombre = _nombre_enregistrements(chemin)
+    if nombre == 0:
+        return np.empty(0, dtype=DTYPE_ENREGISTREMENT)
+    return np.memmap(chemin, dtype=DTYPE_ENREGISTREMENT, mode="r", offset=_EN_TETE.size, shape=(nombre,))
+
+
+def rejouer(chemin: str, vaches) -> int:
+    """
+    Réapplique le journal sur `vaches` (dans l'état où elles étaient à l'ouverture du journal).
+
+    Les enregistrements sont agrégés par vache avec NumPy plutôt que rejoués appel
+    par appel. np.add.at cumule dans l'ordre du journal : les sommes obtenues sont
+    les mêmes, au bit près, que celles des appels successifs. Les enregistrements
+    de vaches absentes de `vaches` sont ignorés. Renvoie le nombre d'enregistrements appliqués.
+    """
+    vaches = list(vaches)
+    enregistrements = lire(chemin)
+    if not vaches or len(enregistrements) == 0:
+        return 0
+
+    ids = np.fromiter((v.id for v in vaches), dtype=np.int64, count=len(vaches))
+    ordre = np.argsort(ids)
+    ids_tries = ids[ordre]
+    rang = np.minimum(np.searchsorted(ids_tries, enregistrements["id"]), len(ids) - 1)
+    connus = ids_tries[rang] == enregistrements["id"]
+
+    lignes = ordre[rang[connus]]
+    operation = enregistrements["operation"][connus]
+    nourriture = enregistrements["nourriture"][connus]
+    valeur = enregistrements["valeur"][connus]
+    gain = enregistrements["gain"][connus]
+    positions = np.arange(len(lignes))
+
+    broute = operation == Operation.BROUTER
+    rumine = operation == Operation.RUMINER
+    trait = operation == Operation.TRAIRE
+    vieilli = operation == Operation.VIEILLIR
+
+    n = len(vaches)
+    laitieres = [isinstance(v, VacheALait) for v in vaches]
+    poids = np.fromiter((v.poids for v in vaches), dtype=np.float64, count=n)
+    age = np.fromiter((v.age for v in vaches), dtype=np.int64, count=n)
+    panse = np.fromiter((v.panse for v in vaches), dtype=np.float64, count=n)
+    lait_disponible = np.array([v.lait_disponible if l else 0.0 for v, l in zip(vaches, laitieres)])
+    lait_total_produit = np.array([v.lait_total_produit if l else 0.0 for v, l in zip(vaches, laitieres)])
+    lait_total_traite = np.array([v.lait_total_traite if l else 0.0 for v, l in zip(vaches, laitieres)])
+    ration = np.zeros((n, NB_TYPES_NOURRITURE))
+    for i, v in enumerate(vaches):
+        if isinstance(v, PieNoire):
+            ration[i] = v.quantites_ration
+
+    np.add.at(poids, lignes[rumine], gain[rumine])
+    np.add.at(age, lignes[vieilli], 1)
+    np.add.at(lait_total_produit, lignes[rumine], valeur[rumine])
+    np.add.at(lait_total_traite, lignes[trait], valeur[trait])
+    mouvements = rumine | trait
+    np.add.at(lait_disponible, lignes[mouvements], np.where(rumine, valeur, -valeur)[mouvements])
+
+    # la panse et la ration repartent de zéro après la dernière rumination de chaque vache
+    derniere_rumination = np.full(n, -1)
+    np.maximum.at(derniere_rumination, lignes[rumine], positions[rumine])
+    videes = derniere_rumination >= 0
+    panse[videes] = 0.0
+    ration[videes] = 0.0
+
+    apres = broute & (positions > derniere_rumination[lignes])
+    np.add.at(panse, lignes[apres], valeur[apres])
+    typees = apres & (nourriture != SANS_NOURRITURE)
+    np.add.at(ration, (lignes[typees], nourriture[typees].astype(np.intp)), valeur[typees])
+
+    for i, vache in enumerate(vaches):
+        vache.poids = float(poids[i])
+        vache.age = int(age[i])
+        vache.panse = float(panse[i])
+        if laitieres[i]:
+            vache.lait_disponible = float(lait_disponible[i])
+            vache.lait_total_produit = float(lait_total_produit[i])
+            vache.lait_total_traite = float(lait_total_traite[i])
+        if isinstance(vache, PieNoire):
+            vache._definir_ration(ration[i])
+
+    return int(connus.sum())
@@ -0,0 +1,185 @@
+"""
+Profilage à la demande des chemins de rumination et de traite.
+
+Profileur.activer() remplace sur place les méthodes ciblées par des enveloppes
+qui comptent les appels, mesurent leur durée et classent les échecs par
+CodeErreur ; desactiver() remet les fonctions d'origine. Profileur désactivé,
+les classes sont strictement celles du domaine : aucun test, aucun appel en plus.
+"""
+import time
+from array import array
+from functools import wraps
+
+from src.vaches.domain.errors.exceptions import InvalidVacheException
+from src.vaches.domain.nourriture.TypeNourriture import INDEX_NOURRITURE
+from src.vaches.domain.pie_noire import PieNoire
+from src.vaches.domain.vache import Vache
+from src.vaches.domain.vache_a_lait import VacheALait
+
+# ruminer n'est définie que dans Vache (template method) : ses mesures sont
+# ventilées par race, sous la clé "<race>.ruminer"
+CIBLES = (
+    (Vache, "ruminer"),
+    (VacheALait, "traire"),
+    (PieNoire, "brouter"),
+)
+
+# bornes hautes des seaux d'histogramme : puissances de 2 de 128 ns à ~16 ms
+PREMIER_SEAU = 7
+DERNIER_SEAU = 24
+BORNES_NS = tuple(1 << n for n in range(PREMIER_SEAU, DERNIER_SEAU + 1))
+
+# lait produit sans ration typée (broutement sans TypeNourriture, races non PieNoire)
+SANS_NOURRITURE = "NON_TYPEE"
+
+
+class Profileur:
+    """
+    Compteurs, histogrammes de durée, échecs par règle et lait par TypeNourriture.
+
+    Un seul profileur peut être actif à la fois ; il s'utilise aussi comme
+    gestionnaire de contexte (with Profileur() as p: ...).
+    """
+
+    _actif = None
+
+    def __init__(self, cibles=CIBLES):
+        self.cibles = tuple(cibles)
+        self._originales = {}
+        self.appels = {}
+        self.echecs = {}
+        self.durees = {}
+        self.lait_par_nourriture = {}
+
+    def reinitialiser(self) -> None:
+        """Remet les mesures à zéro sur place : les enveloppes actives gardent leurs références."""
+        self.appels.clear()
+        self.durees.clear()
+        self.echecs.clear()
+        self.lait_par_nourriture.clear()
+
+    @property
+    def actif(self) -> bool:
+        return Profileur._actif is self
+
+    def activer(self) -> "Profileur":
+        if Profileur._actif is not None:
+            raise RuntimeError("un profileur est déjà actif")
+
+        for classe, nom in self.cibles:
+            originale = classe.__dict__[nom]
+            self._originales[(classe, nom)] = originale
+            setattr(classe, nom, self._envelopper(originale, nom))
+        Profileur._actif = self
+        return self
+
+    def desactiver(self) -> None:
+        if Profileur._actif is not self:
+            return
+        for (classe, nom), originale in self._originales.items():
+            setattr(classe, nom, originale)
+        self._originales.clear()
+        Profileur._actif = None
+
+    def __enter__(self) -> "Profileur":
+        return self.activer()
+
+    def __exit__(self, *exc) -> None:
+        self.desactiver()
+
+    def _envelopper(self, methode, nom: str):
+        appels = self.appels
+        echecs = self.echecs
+        durees = self.durees
+        mesurer_lait = nom == "ruminer"
+        debordement = len(BORNES_NS)
+
+        @wraps(methode)
+        def enveloppe(vache, *args, **kwargs):
+            cle = f"{type(vache).__name__}.{nom}"
+            avant = _avant_rumination(vache) if mesurer_lait else None
+            debut = time.perf_counter_ns()
+            try:
+                resultat = methode(vache, *args, **kwargs)
+            except InvalidVacheException as erreur:
+                par_code = echecs.setdefault(cle, {})
+                par_code[erreur.code] = par_code.get(erreur.code, 0) + 1
+                raise
+            finally:
+                duree = time.perf_counter_ns() - debut
+                appels[cle] = appels.get(cle, 0) + 1
+                # seaux..., débordement, somme des durées en ns
+                seaux = durees.get(cle)
+                if seaux is None:
+                    seaux = durees[cle] = [0] * (debordement + 2)
+                index = (duree - 1).bit_length() - PREMIER_SEAU
+                seaux[0 if index < 0 else min(index, debordement)] += 1
+                seaux[-1] += duree
+            if avant is not None:
+                self._attribuer_lait(vache, *avant)
+            return resultat
+
+        return enveloppe
+
+    def _attribuer_lait(self, vache, produit_avant: float, ration) -> None:
+        production = vache.lait_total_produit - produit_avant
+        if not production:
+            return
+        lait = self.lait_par_nourriture
+        if ration is None:
+            lait[SANS_NOURRITURE] = lait.get(SANS_NOURRITURE, 0.0) + production
+            return
+        for nourriture, quantite, coefficient in zip(INDEX_NOURRITURE, ration, vache._COEFFICIENTS):
+            if quantite:
+                part = quantite * coefficient * vache.RENDEMENT_LAIT
+                lait[nourriture.name] = lait.get(nourriture.name, 0.0) + part
+
+    def instantane(self) -> dict:
+        """Copie des mesures, sérialisable en JSON."""
+        return {
+            "appels": dict(self.appels),
+            "echecs": {cle: {code.name: n for code, n in par_code.items()} for cle, par_code in self.echecs.items()},
+            "durees_ns": {
+                cle: {
+                    "seaux": {str(borne): n for borne, n in zip(BORNES_NS + ("+Inf",), seaux)},
+                    "somme": seaux[-1],
+                }
+                for cle, seaux in self.durees.items()
+            },
+            "lait_par_nourriture": dict(self.lait_par_nourriture),
+        }
+
+    def prometheus(self) -> str:
+        """Mesures au format texte d'exposition Prometheus."""
+        lignes = [
+            "# TYPE vaches_appels_total counter",
+            *(f'vaches_appels_total{{methode="{cle}"}} {n}' for cle, n in self.appels.items()),
+            "# TYPE vaches_echecs_total counter",
+        ]
+        for cle, par_code in self.echecs.items():
+            lignes.extend(f'vaches_echecs_total{{methode="{cle}",code="{code.name}"}} {n}' for code, n in par_code.items())
+
+        lignes.append("# TYPE vaches_duree_secondes histogram")
+        for cle, seaux in self.durees.items():
+            cumul = 0
+            for borne, n in zip(BORNES_NS, seaux):
+                cumul += n
+                lignes.append(f'vaches_duree_secondes_bucket{{methode="{cle}",le="{borne / 1e9:g}"}} {cumul}')
+            lignes.append(f'vaches_duree_secondes_bucket{{methode="{cle}",le="+Inf"}} {self.appels[cle]}')
+            lignes.append(f'vaches_duree_secondes_sum{{methode="{cle}"}} {seaux[-1] / 1e9:g}')
+            lignes.append(f'vaches_duree_secondes_count{{methode="{cle}"}} {self.appels[cle]}')
+
+        lignes.append("# TYPE vaches_lait_litres_total counter")
+        lignes.extend(f'vaches_lait_litres_total{{nourriture="{nom}"}} {litres:g}' for nom, litres in self.lait_par_nourriture.items())
+        return "\n".join(lignes) + "\n"
+
+
+def _avant_rumination(vache):
+    """Lait déjà produit et copie de la ration, lus avant que ruminer ne les remette à zéro."""
+    if not isinstance(vache, VacheALait):
+        return None
+    if getattr(vache, "_tampon", None) is not None:
+        # les broutements différés font partie de la ration que ruminer va consommer
+        vache.appliquer_tampon()
+    ration = getattr(vache, "_ration", None)
+    return vache.lait_total_produit, None if ration is None else array("d", ration)
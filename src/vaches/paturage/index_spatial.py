@@ -0,0 +1,196 @@
+import heapq
+import math
+
+from point_plan.point_plan import PointPlan
+from src.vaches.domain.vache import Vache
+
+# (abscisse, ordonnee) -> indices de la cellule de grille qui contient le point
+Cellule = tuple[int, int]
+
+
+class IndexSpatial:
+    """
+    Positions des vaches rangées dans une grille uniforme de cellules carrées.
+
+    Chaque cellule contient les vaches qui s'y trouvent avec leurs coordonnées.
+    Placer ou déplacer une vache coûte O(1) : seule la vache est retirée de
+    son ancienne cellule et rangée dans la nouvelle, sans reconstruire l'index.
+    Une requête ne visite que les cellules qui recoupent la zone cherchée ;
+    avec une taille de cellule de l'ordre du rayon des requêtes, elle examine
+    quelques cellules au lieu de tout le troupeau.
+
+    Les distances sont mesurées dans le plan (abscisse, ordonnee) du pâturage ;
+    l'azimut d'un Point3D est conservé et rendu par position(), pas comparé.
+    """
+
+    TAILLE_CELLULE: float = 25.0
+
+    def __init__(self, taille_cellule: float = TAILLE_CELLULE):
+        if not taille_cellule > 0:
+            raise ValueError("la taille de cellule doit être > 0")
+
+        self._taille = float(taille_cellule)
+        # cellule -> {id: (abscisse, ordonnee)}
+        self._cellules: dict[Cellule, dict[int, tuple[float, float]]] = {}
+        self._cellule_de: dict[int, Cellule] = {}
+        self._positions: dict[int, PointPlan] = {}
+        self._vaches: dict[int, Vache] = {}
+
+    # -------------------------
+    # Mise à jour
+    # -------------------------
+
+    def placer(self, vache: Vache, position: PointPlan) -> None:
+        """Ajoute la vache à l'index, ou la déplace si elle y est déjà."""
+        x, y = float(position.abscisse), float(position.ordonnee)
+        cellule = self._cellule(x, y)
+
+        ancienne = self._cellule_de.get(vache.id)
+        if ancienne is not None and ancienne != cellule:
+            self._quitter(vache.id, ancienne)
+        self._cellules.setdefault(cellule, {})[vache.id] = (x, y)
+        self._cellule_de[vache.id] = cellule
+        self._positions[vache.id] = position.from_point(position)
+        self._vaches[vache.id] = vache
+
+    def retirer(self, vache: Vache) -> None:
+        cellule = self._cellule_de.pop(vache.id, None)
+        if cellule is None:
+            raise KeyError(vache.id)
+
+        self._quitter(vache.id, cellule)
+        del self._positions[vache.id]
+        del self._vaches[vache.id]
+
+    def _quitter(self, ident: int, cellule: Cellule) -> None:
+        occupants = self._cellules[cellule]
+        del occupants[ident]
+        if not occupants:
+            del self._cellules[cellule]
+
+    def position(self, vache: Vache) -> PointPlan:
+        """Copie de la position enregistrée (PointPlan ou Point3D, comme donnée à placer)."""
+        return self._positions[vache.id].from_point(self._positions[vache.id])
+
+    def __len__(self) -> int:
+        return len(self._vaches)
+
+    def __contains__(self, vache) -> bool:
+        return self._vaches.get(getattr(vache, "id", None)) is vache
+
+    # -------------------------
+    # Requêtes
+    # -------------------------
+
+    def dans_rayon(self, centre: PointPlan, rayon: float) -> list[Vache]:
+        """Vaches à une distance <= `rayon` de `centre`, de la plus proche à la plus lointaine."""
+        cx, cy = float(centre.abscisse), float(centre.ordonnee)
+        rayon2 = rayon * rayon
+        trouvees = []
+        for occupants in self._cellules_recoupant(cx - rayon, cy - rayon, cx + rayon, cy + rayon):
+            for ident, (x, y) in occupants.items():
+                dx = x - cx
+                dy = y - cy
+                d2 = dx * dx + dy * dy
+                if d2 <= rayon2:
+                    trouvees.append((d2, ident))
+        trouvees.sort()
+        return [self._vaches[ident] for _, ident in trouvees]
+
+    def dans_boite(self, minimum: PointPlan, maximum: PointPlan) -> list[Vache]:
+        """Vaches dont la position est dans le rectangle [minimum, maximum] (bornes incluses)."""
+        x0, y0 = float(minimum.abscisse), float(minimum.ordonnee)
+        x1, y1 = float(maximum.abscisse), float(maximum.ordonnee)
+        return [
+            self._vaches[ident]
+            for occupants in self._cellules_recoupant(x0, y0, x1, y1)
+            for ident, (x, y) in occupants.items()
+            if x0 <= x <= x1 and y0 <= y <= y1
+        ]
+
+    def plus_proches(self, centre: PointPlan, k: int) -> list[Vache]:
+        """
+        Les `k` vaches les plus proches de `centre`, de la plus proche à la plus lointaine.
+
+        Les cellules sont visitées par anneaux concentriques autour de celle du
+        centre ; la recherche s'arrête dès qu'aucune cellule non visitée ne
+        peut contenir de vache plus proche que la k-ième trouvée.
+        """
+        if k <= 0 or not self._vaches:
+            return []
+
+        cx, cy = float(centre.abscisse), float(centre.ordonnee)
+        ci, cj = self._cellule(cx, cy)
+        t = self._taille
+        # tas max des k meilleures (distance négative, id)
+        meilleures: list[tuple[float, int]] = []
+
+        anneau = 0
+        while True:
+            if (2 * anneau + 1) ** 2 > len(self._cellules):
+                # l'anneau couvrirait plus de cellules qu'il n'en existe d'occupées :
+                # un seul passage sur toutes les cellules, en repartant de zéro
+                meilleures.clear()
+                self._retenir(meilleures, k, cx, cy, self._cellules.values())
+                break
+
+            self._retenir(meilleures, k, cx, cy, self._anneau(ci, cj, anneau))
+            # distance minimale du centre à une cellule hors du carré déjà visité
+            marge = min(cx - (ci - anneau) * t, (ci + anneau + 1) * t - cx,
+                        cy - (cj - anneau) * t, (cj + anneau + 1) * t - cy)
+            if len(meilleures) == k and -meilleures[0][0] <= marge * marge:
+                break
+            anneau += 1
+
+        return [self._vaches[ident] for _, ident in sorted((-d2, ident) for d2, ident in meilleures)]
+
+    def _retenir(self, meilleures: list[tuple[float, int]], k: int, cx: float, cy: float, cellules) -> None:
+        for occupants in cellules:
+            for ident, (x, y) in occupants.items():
+                dx = x - cx
+                dy = y - cy
+                d2 = dx * dx + dy * dy
+                if len(meilleures) < k:
+                    heapq.heappush(meilleures, (-d2, ident))
+                elif d2 < -meilleures[0][0]:
+                    heapq.heapreplace(meilleures, (-d2, ident))
+
+    def _anneau(self, ci: int, cj: int, anneau: int):
+        """Cellules occupées à exactement `anneau` cellules (distance de Tchebychev) de (ci, cj)."""
+        cellules = self._cellules
+        if anneau == 0:
+            occupants = cellules.get((ci, cj))
+            if occupants:
+                yield occupants
+            return
+
+        for i in range(ci - anneau, ci + anneau + 1):
+            for j in (cj - anneau, cj + anneau):
+                occupants = cellules.get((i, j))
+                if occupants:
+                    yield occupants
+        for j in range(cj - anneau + 1, cj + anneau):
+            for i in (ci - anneau, ci + anneau):
+                occupants = cellules.get((i, j))
+                if occupants:
+                    yield occupants
+
+    def _cellules_recoupant(self, x0: float, y0: float, x1: float, y1: float):
+        i0, j0 = self._cellule(x0, y0)
+        i1, j1 = self._cellule(x1, y1)
+        cellules = self._cellules
+        if (i1 - i0 + 1) * (j1 - j0 + 1) > len(cellules):
+            # zone plus large que la partie occupée de la grille
+            for (i, j), occupants in cellules.items():
+                if i0 <= i <= i1 and j0 <= j <= j1:
+                    yield occupants
+            return
+
+        for i in range(i0, i1 + 1):
+            for j in range(j0, j1 + 1):
+                occupants = cellules.get((i, j))
+                if occupants:
+                    yield occupants
+
+    def _cellule(self, x: float, y: float) -> Cellule:
+        return math.floor(x / self._taille), math.floor(y / self._taille)
@@ -0,0 +1,114 @@
+from collections.abc import Mapping
+
+import numpy as np
+
+from src.vaches.domain.nourriture.TypeNourriture import INDEX_NOURRITURE, NB_TYPES_NOURRITURE, TypeNourriture
+from src.vaches.domain.races import fiche
+from src.vaches.troupeau.troupeau import Troupeau
+
+
+class Paturage:
+    """
+    Champ découpé en cellules, chacune portant une quantité de chaque TypeNourriture.
+
+    quantites[t, ligne, colonne] est la quantité du type d'indice t
+    (INDEX_NOURRITURE) disponible dans la cellule. La repousse et le
+    prélèvement par les vaches sont calculés pour toutes les cellules et
+    toutes les vaches d'un coup ; le broutement passe par
+    Troupeau.brouter_all, donc par les mêmes règles que PieNoire.brouter
+    (type accepté, quantité > 0, PANSE_MAX).
+    """
+
+    def __init__(self, lignes: int, colonnes: int, capacites: Mapping[TypeNourriture, float],
+                 croissances: Mapping[TypeNourriture, float] | None = None):
+        """
+        `capacites` : quantité maximale de chaque type par cellule (le champ démarre plein) ;
+        `croissances` : fraction du manque regagnée à chaque repousse, dans [0, 1].
+        """
+        self.capacites = np.zeros((NB_TYPES_NOURRITURE, 1, 1))
+        self.croissances = np.zeros((NB_TYPES_NOURRITURE, 1, 1))
+        for nourriture, capacite in capacites.items():
+            if capacite < 0:
+                raise ValueError(f"capacité de {nourriture.name} négative")
+            self.capacites[INDEX_NOURRITURE[nourriture]] = capacite
+        for nourriture, croissance in (croissances or {}).items():
+            if not 0 <= croissance <= 1:
+                raise ValueError(f"croissance de {nourriture.name} hors de [0, 1]")
+            self.croissances[INDEX_NOURRITURE[nourriture]] = croissance
+
+        self.quantites = np.broadcast_to(self.capacites, (NB_TYPES_NOURRITURE, lignes, colonnes)).copy()
+        # types présents dans le champ : les autres ne sont jamais parcourus
+        self._types = np.flatnonzero(self.capacites.ravel() > 0)
+
+    @property
+    def forme(self) -> tuple[int, int]:
+        return self.quantites.shape[1:]
+
+    def total(self, nourriture: TypeNourriture) -> float:
+        return float(self.quantites[INDEX_NOURRITURE[nourriture]].sum())
+
+    # -------------------------
+    # Évolution du champ
+    # -------------------------
+
+    def repousser(self) -> None:
+        """Chaque cellule regagne la fraction `croissance` de ce qui lui manque pour atteindre sa capacité."""
+        for t in self._types:
+            croissance = self.croissances[t, 0, 0]
+            if croissance:
+                # q + g (c - q) calculé en place, sans tableau intermédiaire de la taille du champ
+                self.quantites[t] *= 1.0 - croissance
+                self.quantites[t] += croissance * self.capacites[t, 0, 0]
+
+    def brouter(self, troupeau: Troupeau, lignes, colonnes, appetit) -> np.ndarray:
+        """
+        Chaque vache du troupeau prélève jusqu'à `appetit` dans sa cellule (lignes[i], colonnes[i]).
+
+        Les types sont pris du plus nutritif au moins nutritif pour la race
+        (coefficients du registre des races), chacun par un brouter_all typé.
+        Une vache ne prend jamais plus que la place restant dans sa panse ;
+        quand les vaches d'une même cellule demandent plus qu'elle n'en porte,
+        chacune reçoit une part proportionnelle à sa demande. Seules les
+        quantités acceptées par brouter_all sont retirées du champ.
+        Renvoie la quantité broutée par chaque vache.
+        """
+        n = len(troupeau)
+        cellules = np.ravel_multi_index((np.asarray(lignes), np.asarray(colonnes)), self.forme)
+        # calculs par cellule limités aux cellules occupées
+        occupees, cellule_de = np.unique(cellules, return_inverse=True)
+        restant = np.array(np.broadcast_to(np.asarray(appetit, dtype=np.float64), (n,)))
+        broute = np.zeros(n)
+        panse_max = troupeau.race.PANSE_MAX
+        # quantités en kg, quel que soit le stockage du troupeau (TroupeauExact compris)
+        panse = troupeau.reels("panse")
+
+        coefficients = fiche(troupeau.race).coefficients
+        for t in sorted(self._types, key=lambda t: (-coefficients[t], t)):
+            champ = self.quantites[t].reshape(-1)
+            demandes = np.minimum(restant, panse_max - panse)
+            np.maximum(demandes, 0.0, out=demandes)
+
+            demande = np.bincount(cellule_de, weights=demandes, minlength=occupees.size)[cellule_de]
+            disponible = champ[cellules]
+            prises = np.where(demande > disponible, demandes * (disponible / np.where(demande > 0, demande, 1.0)),
+                              demandes)
+
+            actives = prises > 0
+            if not actives.any():
+                continue
+            refus = troupeau.brouter_all(prises, nourritures=int(t), selection=actives)
+            prises[refus] = 0.0
+
+            reste = champ[occupees] - np.bincount(cellule_de, weights=prises, minlength=occupees.size)
+            # un reste négatif ne peut venir que d'un arrondi sur le partage
+            champ[occupees] = np.maximum(reste, 0.0)
+            restant -= prises
+            broute += prises
+            panse = troupeau.reels("panse")
+        return broute
+
+    def avancer(self, troupeau: Troupeau, lignes, colonnes, appetit) -> np.ndarray:
+        """Un pas de simulation : broutement de tout le troupeau puis repousse ; renvoie les quantités broutées."""
+        broute = self.brouter(troupeau, lignes, colonnes, appetit)
+        self.repousser()
+        return broute
@@ -0,0 +1,254 @@
+"""
+Moteur de simulation à événements discrets pour les journées d'un troupeau.
+
+Le temps est compté en heures. Chaque entrée de la file (un tas) porte un
+instant, une Operation et une cible : un Troupeau (toutes ses vaches en un
+appel *_all) ou une liste de vaches objets. Les entrées de même instant et de
+même opération sont dépilées ensemble et traitées par lot, race par race :
+une seule résolution de méthode par race et par lot, quel que soit le nombre
+de vaches. À instant égal, l'ordre est celui de Operation (brouter, ruminer,
+traire, vieillir), puis celui de planification.
+"""
+import heapq
+import time
+from dataclasses import dataclass, field
+from itertools import count
+
+import numpy as np
+
+from src.vaches.domain.errors.exceptions import InvalidVacheException
+from src.vaches.domain.vache import Vache
+from src.vaches.infrastructure.journal import Operation
+from src.vaches.troupeau.troupeau import Troupeau
+
+HEURE: float = 1.0
+JOUR: float = 24 * HEURE
+AN: float = 365 * JOUR
+
+
+@dataclass(slots=True)
+class RapportSimulation:
+    evenements: int = 0
+    lots: int = 0
+    temps_simule: float = 0.0
+    duree: float = 0.0
+    par_operation: dict[Operation, int] = field(default_factory=dict)
+    refus: dict[Operation, int] = field(default_factory=dict)
+
+    @property
+    def evenements_par_seconde(self) -> float:
+        return self.evenements / self.duree if self.duree else 0.0
+
+    @property
+    def acceleration(self) -> float:
+        """Secondes simulées par seconde réelle."""
+        return self.temps_simule * 3600 / self.duree if self.duree else 0.0
+
+    def __str__(self) -> str:
+        return (f"{self.temps_simule / JOUR:.1f} jours simulés en {self.duree:.3f} s "
+                f"(x{self.acceleration:,.0f}) : {self.evenements} événements en {self.lots} lots, "
+                f"{self.evenements_par_seconde:,.0f} événements/s, refus {dict(self.refus)}")
+
+
+class MoteurEvenements:
+    """
+    File d'événements et gestionnaires appelant brouter / ruminer / traire / vieillir.
+
+    Avec `delai_rumination`, chaque broutement réussi déclenche une rumination
+    des mêmes vaches `delai_rumination` heures plus tard. Une opération refusée
+    (InvalidVacheException, masque de refus) est comptée dans le rapport et
+    ne modifie pas la vache, comme partout ailleurs.
+    """
+
+    def __init__(self, delai_rumination: float | None = None):
+        # entrées (instant, operation, numéro, cible, argument, periode, fin)
+        self._tas: list[tuple] = []
+        self._numeros = count()
+        self.instant = 0.0
+        self.delai_rumination = delai_rumination
+        # vaches mises à la retraite par vieillir_all, par troupeau
+        self.archives: dict[Troupeau, Troupeau] = {}
+        self._gestionnaires = {
+            Operation.BROUTER: (self._brouter_troupeau, self._brouter_vaches),
+            Operation.RUMINER: (self._ruminer_troupeau, self._ruminer_vaches),
+            Operation.TRAIRE: (self._traire_troupeau, self._traire_vaches),
+            Operation.VIEILLIR: (self._vieillir_troupeau, self._vieillir_vaches),
+        }
+
+    def __len__(self) -> int:
+        return len(self._tas)
+
+    # -------------------------
+    # Planification
+    # -------------------------
+
+    def planifier(self, instant: float, operation: Operation, cible, argument=None,
+                  periode: float | None = None, fin: float = float("inf")) -> None:
+        """
+        Ajoute l'opération sur `cible` (Troupeau, vache ou vaches) à `instant`.
+
+        `argument` : (quantite, nourriture) ou quantite pour BROUTER ; litres pour
+        TRAIRE (None : tout le lait disponible) ; pour RUMINER sur un Troupeau,
+        ids des vaches qui ruminent (None : toutes). Avec `periode`, l'événement
+        se répète jusqu'à `fin` ; une seule entrée reste dans la file.
+        """
+        if instant < self.instant:
+            raise ValueError(f"instant {instant} déjà passé ({self.instant})")
+        if periode is not None and periode <= 0:
+            raise ValueError("la période doit être > 0")
+
+        if operation is Operation.BROUTER and not isinstance(argument, tuple):
+            argument = (argument, None)
+        if not isinstance(cible, Troupeau):
+            cible = [cible] if isinstance(cible, Vache) else list(cible)
+        heapq.heappush(self._tas, (instant, operation, next(self._numeros), cible, argument, periode, fin))
+
+    def planifier_journees(self, cible, repas=((6.0, 10.0, None), (16.0, 10.0, None)), traites=(8.0, 18.0),
+                           debut: float = 0.0) -> None:
+        """
+        Journée type répétée chaque jour : `repas` (heure, quantite, nourriture), traites
+        complètes aux heures `traites`, vieillissement chaque année à partir de `debut + AN`.
+        """
+        for heure, quantite, nourriture in repas:
+            self.planifier(debut + heure, Operation.BROUTER, cible, (quantite, nourriture), periode=JOUR)
+        for heure in traites:
+            self.planifier(debut + heure, Operation.TRAIRE, cible, periode=JOUR)
+        self.planifier(debut + AN, Operation.VIEILLIR, cible, periode=AN)
+
+    # -------------------------
+    # Exécution
+    # -------------------------
+
+    def executer(self, jusqu_a: float) -> RapportSimulation:
+        """Traite tous les événements d'instant <= `jusqu_a`, puis avance l'horloge à `jusqu_a`."""
+        rapport = RapportSimulation(temps_simule=max(jusqu_a - self.instant, 0.0))
+        tas = self._tas
+        debut = time.perf_counter()
+
+        while tas and tas[0][0] <= jusqu_a:
+            entree = heapq.heappop(tas)
+            instant, operation = entree[0], entree[1]
+            lot = [entree]
+            while tas and tas[0][0] == instant and tas[0][1] == operation:
+                lot.append(heapq.heappop(tas))
+
+            self.instant = instant
+            self._traiter(operation, lot, rapport)
+            rapport.lots += 1
+
+            for _, _, _, cible, argument, periode, fin in lot:
+                if periode is not None and instant + periode <= fin:
+                    heapq.heappush(tas, (instant + periode, operation, next(self._numeros), cible, argument,
+                                         periode, fin))
+
+        self.instant = max(self.instant, jusqu_a)
+        rapport.duree = time.perf_counter() - debut
+        return rapport
+
+    def _traiter(self, operation: Operation, lot: list[tuple], rapport: RapportSimulation) -> None:
+        pour_troupeau, pour_vaches = self._gestionnaires[operation]
+
+        # regroupement par race : Troupeau tel quel, vaches objets par classe
+        par_race: dict[type, list] = {}
+        evenements = refus = 0
+        for entree in lot:
+            cible, argument = entree[3], entree[4]
+            # une rumination de Troupeau restreinte à des ids ne compte que ces vaches
+            evenements += len(argument) if operation is Operation.RUMINER and argument is not None else len(cible)
+            if isinstance(cible, Troupeau):
+                refus += pour_troupeau(cible, argument)
+            else:
+                for vache in cible:
+                    par_race.setdefault(type(vache), []).append((vache, argument))
+
+        for race, paires in par_race.items():
+            refus += pour_vaches(race, paires)
+
+        rapport.evenements += evenements
+        rapport.par_operation[operation] = rapport.par_operation.get(operation, 0) + evenements
+        if refus:
+            rapport.refus[operation] = rapport.refus.get(operation, 0) + refus
+
+    def _ruminer_plus_tard(self, cible, ids=None) -> None:
+        if self.delai_rumination is not None:
+            self.planifier(self.instant + self.delai_rumination, Operation.RUMINER, cible, ids)
+
+    # -------------------------
+    # Gestionnaires : chacun renvoie le nombre de refus
+    # -------------------------
+
+    def _brouter_troupeau(self, troupeau: Troupeau, argument) -> int:
+        quantite, nourriture = argument
+        refus = troupeau.brouter_all(quantite, nourritures=nourriture)
+        if not refus.all():
+            # seules les vaches nourries ruminent ; désignées par id, les lignes
+            # pouvant bouger (vieillir_all) d'ici la rumination
+            self._ruminer_plus_tard(troupeau, troupeau.ids[~refus].copy())
+        return int(refus.sum())
+
+    def _brouter_vaches(self, race: type, paires: list) -> int:
+        brouter = race.brouter
+        nourries = []
+        for vache, (quantite, nourriture) in paires:
+            try:
+                brouter(vache, quantite, nourriture)
+            except InvalidVacheException:
+                continue
+            nourries.append(vache)
+        if nourries:
+            self._ruminer_plus_tard(nourries)
+        return len(paires) - len(nourries)
+
+    def _ruminer_troupeau(self, troupeau: Troupeau, argument) -> int:
+        selection = None if argument is None else np.isin(troupeau.ids, argument)
+        return int(troupeau.ruminer_all(selection).sum())
+
+    def _ruminer_vaches(self, race: type, paires: list) -> int:
+        ruminer = race.ruminer
+        refus = 0
+        for vache, _ in paires:
+            try:
+                ruminer(vache)
+            except InvalidVacheException:
+                refus += 1
+        return refus
+
+    def _traire_troupeau(self, troupeau: Troupeau, argument) -> int:
+        if not troupeau.laitiere:
+            return len(troupeau)
+        if argument is None:
+            lait = troupeau.reels("lait_disponible").copy()
+            return int(troupeau.traire_all(lait, selection=lait > 0).sum())
+        return int(troupeau.traire_all(argument).sum())
+
+    def _traire_vaches(self, race: type, paires: list) -> int:
+        traire = getattr(race, "traire", None)
+        if traire is None:
+            # race non laitière : traite refusée
+            return len(paires)
+        refus = 0
+        for vache, litres in paires:
+            if litres is None:
+                litres = vache.lait_disponible
+                if not litres > 0:
+                    continue
+            try:
+                traire(vache, litres)
+            except InvalidVacheException:
+                refus += 1
+        return refus
+
+    def _vieillir_troupeau(self, troupeau: Troupeau, argument) -> int:
+        # les vaches à AGE_MAX partent dans l'archive au lieu d'être refusées
+        self.archives[troupeau] = troupeau.vieillir_all(self.archives.get(troupeau))
+        return 0
+
+    def _vieillir_vaches(self, race: type, paires: list) -> int:
+        vieillir = race.vieillir
+        refus = 0
+        for vache, _ in paires:
+            try:
+                vieillir(vache)
+            except InvalidVacheException:
+                refus += 1
+        return refus
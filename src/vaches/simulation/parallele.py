@@ -0,0 +1,133 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from src.vaches.domain.nourriture.TypeNourriture import TypeNourriture
+from src.vaches.troupeau.troupeau import Troupeau
+
+
+@dataclass(slots=True)
+class Bilan:
+    """Totaux d'une simulation, fusionnables d'un shard à l'autre."""
+
+    jours: int = 0
+    lait_produit: float = 0.0
+    lait_traite: float = 0.0
+    refus_broutement: int = 0
+    refus_rumination: int = 0
+    duree: float = 0.0
+
+    def fusionner(self, autre: "Bilan") -> "Bilan":
+        return Bilan(
+            jours=max(self.jours, autre.jours),
+            lait_produit=self.lait_produit + autre.lait_produit,
+            lait_traite=self.lait_traite + autre.lait_traite,
+            refus_broutement=self.refus_broutement + autre.refus_broutement,
+            refus_rumination=self.refus_rumination + autre.refus_rumination,
+            duree=max(self.duree, autre.duree),
+        )
+
+
+def simuler_journees(troupeau: Troupeau, jours: int, quantite: float, nourriture: TypeNourriture | None = None) -> Bilan:
+    """
+    Fait passer `jours` journées au troupeau : broutement de `quantite`, rumination,
+    puis traite de tout le lait disponible. Version mono-processus de SimulationParallele.
+    """
+    debut = time.perf_counter()
+    produit_avant = troupeau.total("lait_total_produit")
+    traite_avant = troupeau.total("lait_total_traite")
+    bilan = Bilan(jours=jours)
+
+    for _ in range(jours):
+        bilan.refus_broutement += int(troupeau.brouter_all(quantite, nourritures=nourriture).sum())
+        bilan.refus_rumination += int(troupeau.ruminer_all().sum())
+        if troupeau.laitiere:
+            lait = troupeau.reels("lait_disponible").copy()
+            troupeau.traire_all(lait, selection=lait > 0)
+
+    bilan.lait_produit = troupeau.total("lait_total_produit") - produit_avant
+    bilan.lait_traite = troupeau.total("lait_total_traite") - traite_avant
+    bilan.duree = time.perf_counter() - debut
+    return bilan
+
+
+class SimulationParallele:
+    """
+    Découpe un Troupeau en shards et les fait avancer en parallèle dans un pool de processus.
+
+    Les colonnes sont copiées une fois dans un bloc multiprocessing.shared_memory ;
+    chaque travailleur y ouvre des vues NumPy sur sa tranche de lignes et les
+    modifie sur place. Aucune vache n'est sérialisée : seuls le nom du bloc, les
+    bornes du shard et les Bilan transitent entre processus. À la fin, l'état
+    partagé est recopié dans le troupeau d'origine.
+    """
+
+    def __init__(self, troupeau: Troupeau, nb_processus: int | None = None, nb_shards: int | None = None):
+        self.troupeau = troupeau
+        self.nb_processus = nb_processus or os.cpu_count() or 1
+        self.nb_shards = max(1, min(nb_shards or self.nb_processus, len(troupeau)))
+
+    def executer(self, jours: int, quantite: float, nourriture: TypeNourriture | None = None) -> Bilan:
+        debut = time.perf_counter()
+        colonnes = self.troupeau.colonnes()
+        disposition, taille_bloc = _disposition(colonnes)
+
+        bloc = shared_memory.SharedMemory(create=True, size=max(taille_bloc, 1))
+        try:
+            for nom, vue in _vues(bloc, disposition).items():
+                vue[...] = colonnes[nom]
+
+            bornes = np.linspace(0, len(self.troupeau), self.nb_shards + 1).astype(int)
+            taches = [
+                (bloc.name, disposition, type(self.troupeau), self.troupeau.race, int(a), int(b), jours, quantite,
+                 nourriture)
+                for a, b in zip(bornes[:-1], bornes[1:])
+            ]
+            bilan = Bilan(jours=jours)
+            with ProcessPoolExecutor(max_workers=min(self.nb_processus, self.nb_shards)) as pool:
+                for resultat in pool.map(_simuler_shard, taches):
+                    bilan = bilan.fusionner(resultat)
+
+            for nom, vue in _vues(bloc, disposition).items():
+                colonnes[nom][...] = vue
+        finally:
+            bloc.close()
+            bloc.unlink()
+
+        bilan.duree = time.perf_counter() - debut
+        return bilan
+
+
+def _disposition(colonnes: dict[str, np.ndarray]) -> tuple[list, int]:
+    """Position de chaque colonne dans le bloc partagé, alignée sur 64 octets."""
+    disposition = []
+    decalage = 0
+    for nom, colonne in colonnes.items():
+        disposition.append((nom, colonne.dtype.str, colonne.shape, decalage))
+        decalage += -(-colonne.nbytes // 64) * 64
+    return disposition, decalage
+
+
+def _vues(bloc: shared_memory.SharedMemory, disposition: list, debut: int = 0, fin: int | None = None) -> dict[str, np.ndarray]:
+    vues = {}
+    for nom, dtype, forme, decalage in disposition:
+        colonne = np.ndarray(forme, dtype=dtype, buffer=bloc.buf, offset=decalage)
+        vues[nom] = colonne[debut:fin]
+    return vues
+
+
+def _simuler_shard(tache: tuple) -> Bilan:
+    nom_bloc, disposition, classe, race, debut, fin, jours, quantite, nourriture = tache
+    bloc = shared_memory.SharedMemory(name=nom_bloc)
+    try:
+        troupeau = classe.sur_colonnes(race, _vues(bloc, disposition, debut, fin))
+        bilan = simuler_journees(troupeau, jours, quantite, nourriture)
+        # les vues doivent disparaître avant de fermer le bloc
+        del troupeau
+        return bilan
+    finally:
+        bloc.close()
@@ -0,0 +1,153 @@
+import asyncio
+import time
+from dataclasses import dataclass, field
+
+from src.vaches.domain.errors.codes import CodeErreur
+from src.vaches.domain.errors.exceptions import InvalidVacheException
+from src.vaches.domain.vache_a_lait import VacheALait
+
+
+class Tank:
+    """
+    Tank à lait de capacité finie.
+
+    Un poste réserve la place avant de traire : s'il n'y en a pas assez, il
+    attend qu'un ramassage vide le tank (contre-pression sur la salle de traite).
+    """
+
+    def __init__(self, capacite: float):
+        if capacite <= 0:
+            raise ValueError("capacite doit être > 0")
+
+        self.capacite = capacite
+        self.volume = 0.0
+        self.total_collecte = 0.0
+        self.attentes = 0
+        self._en_attente = 0
+        self._condition = asyncio.Condition()
+
+    async def reserver(self, litres: float) -> None:
+        async with self._condition:
+            if self.capacite - self.volume < litres:
+                self.attentes += 1
+                self._en_attente += 1
+                self._condition.notify_all()
+                await self._condition.wait_for(lambda: self.capacite - self.volume >= litres)
+                self._en_attente -= 1
+            self.volume += litres
+            self._condition.notify_all()
+
+    async def collecter(self, seuil: float | None = None) -> float:
+        """Attend que le tank atteigne `seuil` (ou qu'un poste soit bloqué), puis le vide."""
+        seuil = self.capacite if seuil is None else seuil
+        async with self._condition:
+            await self._condition.wait_for(
+                lambda: self.volume >= seuil or (self._en_attente and self.volume > 0)
+            )
+            collecte, self.volume = self.volume, 0.0
+            self.total_collecte += collecte
+            self._condition.notify_all()
+            return collecte
+
+    async def collecter_en_continu(self, seuil: float | None = None) -> None:
+        while True:
+            await self.collecter(seuil)
+
+
+@dataclass(slots=True)
+class RapportTraite:
+    vaches_traites: int = 0
+    litres: float = 0.0
+    duree: float = 0.0
+    refus: dict[CodeErreur, int] = field(default_factory=dict)
+    latences: list[float] = field(default_factory=list, repr=False)
+    attentes_tank: int = 0
+
+    @property
+    def vaches_par_seconde(self) -> float:
+        return self.vaches_traites / self.duree if self.duree else 0.0
+
+    @property
+    def litres_par_seconde(self) -> float:
+        return self.litres / self.duree if self.duree else 0.0
+
+    @property
+    def latence_moyenne(self) -> float:
+        return sum(self.latences) / len(self.latences) if self.latences else 0.0
+
+    @property
+    def latence_p95(self) -> float:
+        if not self.latences:
+            return 0.0
+        triees = sorted(self.latences)
+        return triees[min(len(triees) - 1, int(0.95 * len(triees)))]
+
+
+class SalleDeTraite:
+    """
+    Salle de traite à `nb_postes` postes simulés par des tâches asyncio.
+
+    Chaque poste prend la prochaine vache de la file et la trait avec
+    VacheALait.traire pendant au plus `budget` secondes à `debit` L/s. La durée
+    de traite est simulée par asyncio.sleep(durée * echelle_temps) :
+    echelle_temps = 0 enchaîne les traites aussi vite que possible.
+    """
+
+    def __init__(self, nb_postes: int, tank: Tank, debit: float = 0.03, budget: float = 480.0,
+                 echelle_temps: float = 0.0, seuil_collecte: float | None = None):
+        if nb_postes <= 0:
+            raise ValueError("nb_postes doit être > 0")
+
+        self.nb_postes = nb_postes
+        self.tank = tank
+        self.debit = debit
+        self.budget = budget
+        self.echelle_temps = echelle_temps
+        self.seuil_collecte = seuil_collecte
+
+    async def traire(self, vaches) -> RapportTraite:
+        rapport = RapportTraite()
+        file: asyncio.Queue = asyncio.Queue()
+        horloge = asyncio.get_running_loop().time
+        for vache in vaches:
+            if not isinstance(vache, VacheALait):
+                raise TypeError(f"seule une VacheALait se trait : {type(vache).__name__}")
+            file.put_nowait((vache, horloge()))
+
+        debut = time.perf_counter()
+        attentes_avant = self.tank.attentes
+        taches = [asyncio.create_task(self._poste(file, rapport)) for _ in range(self.nb_postes)]
+        taches.append(asyncio.create_task(self.tank.collecter_en_continu(self.seuil_collecte)))
+        try:
+            await file.join()
+        finally:
+            for tache in taches:
+                tache.cancel()
+            await asyncio.gather(*taches, return_exceptions=True)
+
+        rapport.duree = time.perf_counter() - debut
+        rapport.attentes_tank = self.tank.attentes - attentes_avant
+        return rapport
+
+    async def _poste(self, file: asyncio.Queue, rapport: RapportTraite) -> None:
+        horloge = asyncio.get_running_loop().time
+        litres_par_session = min(self.budget * self.debit, self.tank.capacite)
+        while True:
+            vache, entree = await file.get()
+            try:
+                rapport.latences.append(horloge() - entree)
+                litres = min(vache.lait_disponible, litres_par_session)
+                code = vache.check_traire(litres)
+                if code:
+                    rapport.refus[code] = rapport.refus.get(code, 0) + 1
+                    continue
+
+                await self.tank.reserver(litres)
+                vache.traire(litres)
+                await asyncio.sleep(litres / self.debit * self.echelle_temps)
+                rapport.vaches_traites += 1
+                rapport.litres += litres
+            except InvalidVacheException as erreur:
+                rapport.refus[erreur.code] = rapport.refus.get(erreur.code, 0) + 1
+            finally:
+                file.task_done()
@@ -0,0 +1,133 @@
+from src.vaches.domain.vache import Vache
+
+
+class Cheptel:
+    """
+    Conteneur de vaches (objets) tenant ses agrégats à jour au fil des opérations.
+
+    Le cheptel observe chacune de ses vaches : brouter, ruminer, traire et
+    vieillir lui notifient leur effet une fois l'opération réussie, et il
+    applique le delta en O(1). Une opération qui lève InvalidVacheException
+    n'a rien modifié et ne notifie rien, les totaux restent donc exacts.
+    Lire un agrégat ne parcourt jamais les vaches.
+
+    Les écritures directes d'attributs (rejouer un journal, restaurer un
+    instantané) contournent les notifications : appeler recalculer() ensuite.
+    """
+
+    def __init__(self, vaches=()):
+        self._vaches: dict[int, Vache] = {}
+        self._remettre_a_zero()
+        for vache in vaches:
+            self.ajouter(vache)
+
+    def _remettre_a_zero(self) -> None:
+        self._poids_total = 0.0
+        self._panse_totale = 0.0
+        self._lait_disponible = 0.0
+        self._lait_total_produit = 0.0
+        self._lait_total_traite = 0.0
+        self._ages: dict[int, int] = {}
+
+    # -------------------------
+    # Composition
+    # -------------------------
+
+    def ajouter(self, vache: Vache) -> None:
+        if vache.id in self._vaches:
+            raise ValueError(f"vache {vache.id} déjà dans le cheptel")
+
+        self._vaches[vache.id] = vache
+        self._compter(vache, 1)
+        vache.observer(self)
+
+    def retirer(self, vache: Vache) -> None:
+        if self._vaches.pop(vache.id, None) is None:
+            raise KeyError(vache.id)
+
+        vache.ne_plus_observer(self)
+        self._compter(vache, -1)
+
+    def recalculer(self) -> None:
+        """Recalcule tous les agrégats depuis les vaches (O(n))."""
+        self._remettre_a_zero()
+        for vache in self._vaches.values():
+            self._compter(vache, 1)
+
+    def _compter(self, vache: Vache, signe: int) -> None:
+        self._poids_total += signe * vache.poids
+        self._panse_totale += signe * vache.panse
+        self._lait_disponible += signe * getattr(vache, "lait_disponible", 0.0)
+        self._lait_total_produit += signe * getattr(vache, "lait_total_produit", 0.0)
+        self._lait_total_traite += signe * getattr(vache, "lait_total_traite", 0.0)
+        self._deplacer_age(vache.age, signe)
+
+    def _deplacer_age(self, age: int, signe: int) -> None:
+        effectif = self._ages.get(age, 0) + signe
+        if effectif:
+            self._ages[age] = effectif
+        else:
+            del self._ages[age]
+
+    def __len__(self) -> int:
+        return len(self._vaches)
+
+    def __iter__(self):
+        return iter(self._vaches.values())
+
+    def __contains__(self, vache) -> bool:
+        return self._vaches.get(getattr(vache, "id", None)) is vache
+
+    def get(self, ident: int, defaut: Vache | None = None) -> Vache | None:
+        """Vache d'identifiant `ident`, ou `defaut` : même recherche qu'un dict id -> vache."""
+        return self._vaches.get(ident, defaut)
+
+    # -------------------------
+    # Notifications des vaches
+    # -------------------------
+
+    def apres_brouter(self, vache: Vache, quantite: float) -> None:
+        self._panse_totale += quantite
+
+    def apres_ruminer(self, vache: Vache, panse_avant: float, gain: float, lait: float) -> None:
+        self._panse_totale -= panse_avant
+        self._poids_total += gain
+        self._lait_disponible += lait
+        self._lait_total_produit += lait
+
+    def apres_traire(self, vache: Vache, litres: float) -> None:
+        self._lait_disponible -= litres
+        self._lait_total_traite += litres
+
+    def apres_vieillir(self, vache: Vache) -> None:
+        self._deplacer_age(vache.age - 1, -1)
+        self._deplacer_age(vache.age, 1)
+
+    # -------------------------
+    # Agrégats
+    # -------------------------
+
+    @property
+    def lait_disponible(self) -> float:
+        return self._lait_disponible
+
+    @property
+    def lait_total_produit(self) -> float:
+        return self._lait_total_produit
+
+    @property
+    def lait_total_traite(self) -> float:
+        return self._lait_total_traite
+
+    @property
+    def panse_totale(self) -> float:
+        return self._panse_totale
+
+    @property
+    def poids_moyen(self) -> float:
+        return self._poids_total / len(self._vaches) if self._vaches else 0.0
+
+    @property
+    def repartition_ages(self) -> dict[int, int]:
+        """Effectif par âge (âges présents seulement, au plus AGE_MAX + 1 entrées)."""
+        return dict(self._ages)
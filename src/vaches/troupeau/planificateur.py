@@ -0,0 +1,100 @@
+import heapq
+from itertools import count
+
+from src.vaches.domain.vache_a_lait import VacheALait
+
+
+class PlanificateurTraite:
+    """
+    File de priorité des vaches à traire : la plus proche de PRODUCTION_LAIT_MAX d'abord.
+
+    La clé est la marge restante (PRODUCTION_LAIT_MAX - lait_disponible). Le
+    planificateur observe ses vaches et pousse une nouvelle entrée à chaque
+    ruminer / traire réussi ; l'ancienne entrée devient périmée (numéro de
+    version remplacé) et est écartée quand elle remonte en tête du tas.
+    Le tas est reconstruit dès que les entrées périmées y sont majoritaires.
+    """
+
+    def __init__(self, vaches=()):
+        # entrées (marge, id, version)
+        self._tas: list[tuple[float, int, int]] = []
+        self._vaches: dict[int, VacheALait] = {}
+        self._versions: dict[int, int] = {}
+        # versions tirées d'une seule suite croissante : une vache retirée puis
+        # rajoutée ne peut pas redonner vie à l'une de ses anciennes entrées
+        self._sequence = count()
+        for vache in vaches:
+            self.ajouter(vache)
+
+    def ajouter(self, vache: VacheALait) -> None:
+        if not isinstance(vache, VacheALait):
+            raise TypeError(f"seule une VacheALait se trait : {type(vache).__name__}")
+        if vache.id in self._vaches:
+            raise ValueError(f"vache {vache.id} déjà planifiée")
+
+        self._vaches[vache.id] = vache
+        self._versions[vache.id] = next(self._sequence)
+        self._pousser(vache)
+        vache.observer(self)
+
+    def retirer(self, vache: VacheALait) -> None:
+        if self._vaches.pop(vache.id, None) is None:
+            raise KeyError(vache.id)
+
+        del self._versions[vache.id]
+        vache.ne_plus_observer(self)
+
+    def __len__(self) -> int:
+        return len(self._vaches)
+
+    @staticmethod
+    def marge(vache: VacheALait) -> float:
+        return vache.PRODUCTION_LAIT_MAX - vache.lait_disponible
+
+    def _pousser(self, vache: VacheALait) -> None:
+        version = self._versions[vache.id]
+        heapq.heappush(self._tas, (self.marge(vache), vache.id, version))
+
+        if len(self._tas) > 2 * len(self._vaches) + 64:
+            self._reconstruire()
+
+    def _rafraichir(self, vache: VacheALait) -> None:
+        if vache.id in self._versions:
+            self._versions[vache.id] = next(self._sequence)
+            self._pousser(vache)
+
+    def _reconstruire(self) -> None:
+        self._tas = [entree for entree in self._tas if self._valide(entree)]
+        heapq.heapify(self._tas)
+
+    def _valide(self, entree: tuple[float, int, int]) -> bool:
+        return self._versions.get(entree[1]) == entree[2]
+
+    def prochaines(self, k: int) -> list[VacheALait]:
+        """Les `k` vaches de plus faible marge, de la plus urgente à la moins urgente (O(k log n))."""
+        tas = self._tas
+        retenues = []
+        while tas and len(retenues) < k:
+            entree = heapq.heappop(tas)
+            if self._valide(entree):
+                retenues.append(entree)
+        for entree in retenues:
+            heapq.heappush(tas, entree)
+        return [self._vaches[ident] for _, ident, _ in retenues]
+
+    # -------------------------
+    # Notifications des vaches
+    # -------------------------
+
+    def apres_brouter(self, vache, quantite: float) -> None:
+        pass
+
+    def apres_ruminer(self, vache, panse_avant: float, gain: float, lait: float) -> None:
+        if lait:
+            self._rafraichir(vache)
+
+    def apres_traire(self, vache, litres: float) -> None:
+        self._rafraichir(vache)
+
+    def apres_vieillir(self, vache) -> None:
+        pass
@@ -0,0 +1,147 @@
+from bisect import bisect_right, insort
+from math import inf
+
+from src.vaches.domain.vache import Vache
+from src.vaches.domain.vache_a_lait import VacheALait
+from src.vaches.troupeau.cheptel import Cheptel
+
+
+class Registre(Cheptel):
+    """
+    Cheptel doublé d'index secondaires tenus à jour par les notifications des vaches.
+
+    - id et petit_nom : tables de hachage (égalité en O(1)) ;
+    - age : un seau par âge, au plus AGE_MAX + 1 seaux à parcourir ;
+    - lait_disponible (vaches laitières) : un seau par tranche de PAS_LAIT
+      litres, plus la liste triée des tranches occupées (au plus
+      PRODUCTION_LAIT_MAX / PAS_LAIT + 1). Une mise à jour coûte O(1), plus
+      O(nombre de tranches) quand une tranche apparaît ou se vide ; une requête
+      parcourt les seaux des tranches recoupées et trie le résultat.
+
+    petit_nom n'est modifié par aucune opération : le renommer sur une vache
+    déjà enregistrée demande de la retirer puis de la rajouter.
+    """
+
+    PAS_LAIT: float = 1.0
+
+    def __init__(self, vaches=()):
+        self._par_nom: dict[str, dict[int, Vache]] = {}
+        self._par_age: dict[int, dict[int, Vache]] = {}
+        # tranche -> {id: litres indexés}, et tranches occupées triées
+        self._par_lait: dict[int, dict[int, float]] = {}
+        self._tranches: list[int] = []
+        # tranche de chaque vache, pour la retrouver sans recalcul flottant
+        self._tranche_de: dict[int, int] = {}
+        super().__init__(vaches)
+
+    # -------------------------
+    # Composition
+    # -------------------------
+
+    def ajouter(self, vache: Vache) -> None:
+        super().ajouter(vache)
+        self._par_nom.setdefault(vache.petit_nom, {})[vache.id] = vache
+        self._par_age.setdefault(vache.age, {})[vache.id] = vache
+        if isinstance(vache, VacheALait):
+            self._indexer_lait(vache)
+
+    def retirer(self, vache: Vache) -> None:
+        super().retirer(vache)
+        self._oter(self._par_nom, vache.petit_nom, vache.id)
+        self._oter(self._par_age, vache.age, vache.id)
+        if vache.id in self._tranche_de:
+            self._desindexer_lait(vache.id)
+
+    @staticmethod
+    def _oter(index: dict, cle, ident: int) -> None:
+        seau = index[cle]
+        del seau[ident]
+        if not seau:
+            del index[cle]
+
+    def _indexer_lait(self, vache: VacheALait) -> None:
+        tranche = int(vache.lait_disponible // self.PAS_LAIT)
+        self._tranche_de[vache.id] = tranche
+        seau = self._par_lait.get(tranche)
+        if seau is None:
+            seau = self._par_lait[tranche] = {}
+            insort(self._tranches, tranche)
+        seau[vache.id] = vache.lait_disponible
+
+    def _desindexer_lait(self, ident: int) -> None:
+        tranche = self._tranche_de.pop(ident)
+        seau = self._par_lait[tranche]
+        del seau[ident]
+        if not seau:
+            del self._par_lait[tranche]
+            self._tranches.remove(tranche)
+
+    # -------------------------
+    # Notifications des vaches
+    # -------------------------
+
+    def apres_ruminer(self, vache: Vache, panse_avant: float, gain: float, lait: float) -> None:
+        super().apres_ruminer(vache, panse_avant, gain, lait)
+        if lait:
+            self._desindexer_lait(vache.id)
+            self._indexer_lait(vache)
+
+    def apres_traire(self, vache: Vache, litres: float) -> None:
+        super().apres_traire(vache, litres)
+        self._desindexer_lait(vache.id)
+        self._indexer_lait(vache)
+
+    def apres_vieillir(self, vache: Vache) -> None:
+        super().apres_vieillir(vache)
+        self._oter(self._par_age, vache.age - 1, vache.id)
+        self._par_age.setdefault(vache.age, {})[vache.id] = vache
+
+    def recalculer(self) -> None:
+        """Recalcule agrégats et index depuis les vaches (O(n))."""
+        super().recalculer()
+        self._par_age = {}
+        self._par_lait = {}
+        self._tranches = []
+        self._tranche_de = {}
+        for vache in self:
+            self._par_age.setdefault(vache.age, {})[vache.id] = vache
+            if isinstance(vache, VacheALait):
+                self._indexer_lait(vache)
+
+    # -------------------------
+    # Requêtes
+    # -------------------------
+
+    def par_id(self, ident: int) -> Vache | None:
+        return self._vaches.get(ident)
+
+    def par_nom(self, petit_nom: str) -> list[Vache]:
+        return list(self._par_nom.get(petit_nom, {}).values())
+
+    def par_age(self, age_min: int = 0, age_max: int | None = None) -> list[Vache]:
+        """Vaches dont l'âge est dans [age_min, age_max] (age_max None : sans borne haute)."""
+        return [
+            vache
+            for age, seau in self._par_age.items()
+            if age >= age_min and (age_max is None or age <= age_max)
+            for vache in seau.values()
+        ]
+
+    def par_lait(self, minimum: float = -inf, maximum: float = inf, inclus: bool = True) -> list[VacheALait]:
+        """
+        Vaches laitières dont lait_disponible est entre `minimum` et `maximum`,
+        bornes comprises si `inclus`, exclues sinon ; triées par litres croissants.
+        """
+        # tranches t recoupant l'intervalle : t * PAS_LAIT <= maximum et (t + 1) * PAS_LAIT > minimum
+        tranches = self._tranches
+        debut = bisect_right(tranches, minimum / self.PAS_LAIT - 1)
+        fin = bisect_right(tranches, maximum / self.PAS_LAIT)
+
+        trouvees = []
+        for tranche in tranches[debut:fin]:
+            for ident, litres in self._par_lait[tranche].items():
+                if (minimum <= litres <= maximum) if inclus else (minimum < litres < maximum):
+                    trouvees.append((litres, ident))
+        trouvees.sort()
+        vaches = self._vaches
+        return [vaches[ident] for _, ident in trouvees]
@@ -0,0 +1,398 @@
+from collections.abc import Sequence
+
+import numpy as np
+
+from src.vaches.domain.errors.codes import CodeErreur
+from src.vaches.domain.errors.exceptions import InvalidVacheException
+from src.vaches.domain.nourriture.TypeNourriture import INDEX_NOURRITURE, NB_TYPES_NOURRITURE, TypeNourriture
+from src.vaches.domain.pie_noire import PieNoire
+from src.vaches.domain.races import fiche
+from src.vaches.domain.vache import Vache
+from src.vaches.domain.vache_a_lait import VacheALait
+
+SANS_NOURRITURE = -1
+
+
+class Troupeau:
+    """
+    Troupeau stocké en colonnes NumPy (une ligne par vache).
+
+    Les opérations *_all appliquent les mêmes règles que Vache / VacheALait /
+    PieNoire à toutes les vaches d'un coup. Une vache qui viole une règle n'est
+    pas modifiée : elle est signalée dans le masque de refus renvoyé au lieu de
+    lever InvalidVacheException.
+    """
+
+    CAPACITE_INITIALE: int = 1024
+
+    # nom, dtype, forme d'une ligne
+    COLONNES = (
+        ("ids", np.int64, ()),
+        ("poids", np.float64, ()),
+        ("panse", np.float64, ()),
+        ("age", np.int64, ()),
+        ("lait_disponible", np.float64, ()),
+        ("lait_total_produit", np.float64, ()),
+        ("lait_total_traite", np.float64, ()),
+        ("ration", np.float64, (NB_TYPES_NOURRITURE,)),
+    )
+
+    def __init__(self, race: type = VacheALait, capacite: int = CAPACITE_INITIALE):
+        if not (isinstance(race, type) and issubclass(race, Vache)):
+            raise TypeError(f"race doit être une sous-classe de Vache, pas {race!r}")
+
+        self.race = race
+        self._laitiere = issubclass(race, VacheALait)
+        self._typee = issubclass(race, PieNoire)
+        self._coefficients = np.array(fiche(race).coefficients)
+        # seuils de la race dans l'unité des colonnes
+        self._panse_max = self._en_unites(race.PANSE_MAX)
+        self._production_lait_max = self._en_unites(getattr(race, "PRODUCTION_LAIT_MAX", 0.0))
+
+        self._taille = 0
+        self._extensible = True
+        self.petits_noms: list[str] = []
+        capacite = max(int(capacite), 1)
+        for nom, dtype, forme in self.COLONNES:
+            setattr(self, "_" + nom, np.zeros((capacite, *forme), dtype=dtype))
+
+    # -------------------------
+    # Construction
+    # -------------------------
+
+    @classmethod
+    def depuis_vaches(cls, vaches, race: type | None = None) -> "Troupeau":
+        """
+        Copie des vaches, toutes exactement de la race `race` (par défaut celle de la première).
+
+        Une sous-race (PieNoire dans un troupeau de VacheALait) est refusée
+        par TypeError : ses colonnes propres (ration, taches) seraient perdues.
+        """
+        vaches = list(vaches)
+        if race is None:
+            race = type(vaches[0]) if vaches else VacheALait
+
+        troupeau = cls(race=race, capacite=len(vaches))
+        for vache in vaches:
+            if type(vache) is not race:
+                raise TypeError(f"{type(vache).__name__} n'est pas de la race {race.__name__}")
+
+            if troupeau._typee:
+                vache.appliquer_tampon()
+            i = troupeau._nouvelle_ligne(vache.id, vache.petit_nom, vache.poids)
+            troupeau._panse[i] = troupeau._en_unites(vache.panse)
+            troupeau._age[i] = vache.age
+            if troupeau._laitiere:
+                troupeau._lait_disponible[i] = troupeau._en_unites(vache.lait_disponible)
+                troupeau._lait_total_produit[i] = troupeau._en_unites(vache.lait_total_produit)
+                troupeau._lait_total_traite[i] = troupeau._en_unites(vache.lait_total_traite)
+            if troupeau._typee:
+                troupeau._ration[i] = troupeau._en_unites(vache.quantites_ration)
+        return troupeau
+
+    @classmethod
+    def sur_colonnes(cls, race: type, colonnes: dict[str, np.ndarray], petits_noms: Sequence[str] | None = None) -> "Troupeau":
+        """
+        Troupeau adossé sans copie à des tableaux existants (mémoire partagée, fichier projeté).
+
+        Les opérations écrivent directement dans ces tableaux ; le troupeau ne peut pas grandir.
+        `petits_noms` est conservé tel quel (toute séquence indexable).
+        """
+        troupeau = cls(race=race, capacite=1)
+        taille = len(colonnes["ids"])
+        for nom, dtype, forme in cls.COLONNES:
+            colonne = colonnes[nom]
+            if colonne.dtype != dtype or colonne.shape != (taille, *forme):
+                raise ValueError(f"colonne {nom} : attendu {np.dtype(dtype)} {(taille, *forme)}")
+            setattr(troupeau, "_" + nom, colonne)
+
+        troupeau._taille = taille
+        troupeau._extensible = False
+        troupeau.petits_noms = petits_noms if petits_noms is not None else [""] * taille
+        return troupeau
+
+    def colonnes(self) -> dict[str, np.ndarray]:
+        """Vues (sans copie) de toutes les colonnes, limitées aux vaches présentes."""
+        return {nom: getattr(self, "_" + nom)[: self._taille] for nom, _, _ in self.COLONNES}
+
+    def ajouter(self, petit_nom: str, poids: float) -> int:
+        """Ajoute une vache neuve (mêmes invariants que Vache.__init__) et renvoie son id."""
+        if not petit_nom or not petit_nom.strip():
+            raise InvalidVacheException(CodeErreur.PETIT_NOM_VIDE)
+
+        if poids < 0:
+            raise InvalidVacheException(CodeErreur.POIDS_NEGATIF)
+
+        ident = Vache.allocateur().prochain()
+
+        i = self._nouvelle_ligne(ident, petit_nom, poids)
+        self._age[i] = self.race.AGE_NAISSANCE
+        self._panse[i] = self._en_unites(self.race.PENSE_VIDE)
+        return ident
+
+    def _nouvelle_ligne(self, ident: int, petit_nom: str, poids: float) -> int:
+        i = self._taille
+        if i == len(self._ids):
+            if not self._extensible:
+                raise ValueError("troupeau adossé à des tableaux externes : taille fixe")
+            self._agrandir(2 * i)
+
+        self._ids[i] = ident
+        self._poids[i] = self._en_unites(poids)
+        self.petits_noms.append(petit_nom)
+        self._taille = i + 1
+        return i
+
+    def _agrandir(self, capacite: int) -> None:
+        for nom, dtype, forme in self.COLONNES:
+            ancienne = getattr(self, "_" + nom)
+            nouvelle = np.zeros((capacite, *forme), dtype=dtype)
+            nouvelle[: self._taille] = ancienne[: self._taille]
+            setattr(self, "_" + nom, nouvelle)
+
+    # -------------------------
+    # Colonnes (vues sans copie sur les vaches présentes)
+    # -------------------------
+
+    def __len__(self) -> int:
+        return self._taille
+
+    @property
+    def laitiere(self) -> bool:
+        return self._laitiere
+
+    @property
+    def ids(self) -> np.ndarray:
+        return self._ids[: self._taille]
+
+    @property
+    def poids(self) -> np.ndarray:
+        return self._poids[: self._taille]
+
+    @property
+    def panse(self) -> np.ndarray:
+        return self._panse[: self._taille]
+
+    @property
+    def age(self) -> np.ndarray:
+        return self._age[: self._taille]
+
+    @property
+    def lait_disponible(self) -> np.ndarray:
+        return self._lait_disponible[: self._taille]
+
+    @property
+    def lait_total_produit(self) -> np.ndarray:
+        return self._lait_total_produit[: self._taille]
+
+    @property
+    def lait_total_traite(self) -> np.ndarray:
+        return self._lait_total_traite[: self._taille]
+
+    @property
+    def ration(self) -> np.ndarray:
+        """Matrice (vaches x TypeNourriture), colonnes dans l'ordre de l'énumération."""
+        return self._ration[: self._taille]
+
+    def reels(self, nom: str) -> np.ndarray:
+        """Colonne `nom` en kg / litres (la colonne elle-même, sans copie, ici)."""
+        return getattr(self, nom)
+
+    def total(self, nom: str) -> float:
+        """Somme de la colonne `nom` sur le troupeau, en kg / litres."""
+        return float(getattr(self, nom).sum())
+
+    # -------------------------
+    # Unités des colonnes
+    # -------------------------
+
+    def _en_unites(self, valeurs):
+        """kg / litres -> unité des colonnes : ici les mêmes, les colonnes sont en flottants."""
+        return valeurs
+
+    def _arrondir(self, valeurs):
+        """Résultat d'un calcul (gain, lait produit) ramené à l'unité des colonnes."""
+        return valeurs
+
+    # -------------------------
+    # Opérations vectorisées
+    # -------------------------
+
+    def check_brouter_all(self, quantites, nourritures=None, selection=None) -> np.ndarray:
+        """
+        CodeErreur de chaque vache pour brouter_all, sans rien modifier (OK hors sélection).
+
+        `nourritures` vaut None (broutement primaire), un TypeNourriture commun
+        ou un tableau d'indices dans TypeNourriture (SANS_NOURRITURE = primaire).
+        """
+        return self._codes_broutement(*self._entrees_broutement(quantites, nourritures, selection))
+
+    def brouter_all(self, quantites, nourritures=None, selection=None) -> np.ndarray:
+        """Broutement de chaque vache sélectionnée ; renvoie le masque des refus."""
+        quantites, index, actives = self._entrees_broutement(quantites, nourritures, selection)
+        refus = self._codes_broutement(quantites, index, actives) != CodeErreur.OK
+
+        acceptees = actives & ~refus
+        self.panse[acceptees] += quantites[acceptees]
+
+        if index is not None:
+            lignes = np.flatnonzero(acceptees & (index != SANS_NOURRITURE))
+            self.ration[lignes, index[lignes]] += quantites[lignes]
+
+        return refus
+
+    def _entrees_broutement(self, quantites, nourritures, selection) -> tuple:
+        index = None
+        if nourritures is not None:
+            if isinstance(nourritures, TypeNourriture):
+                nourritures = INDEX_NOURRITURE[nourritures]
+            index = self._par_vache(nourritures, np.int64)
+        return self._en_unites(self._par_vache(quantites, np.float64)), index, self._selection(selection)
+
+    def _codes_broutement(self, quantites, index, actives) -> np.ndarray:
+        # même ordre de vérification que Vache.brouter / PieNoire.brouter
+        interdites = False
+        if index is not None:
+            interdites = index != SANS_NOURRITURE
+            if self._typee:
+                # seul PieNoire accepte un broutement typé, et seulement sur un type connu
+                interdites &= (index < 0) | (index >= NB_TYPES_NOURRITURE)
+
+        return self._codes(actives, [
+            (interdites, CodeErreur.NOURRITURE_INTERDITE),
+            (~(quantites > 0), CodeErreur.QUANTITE_NON_POSITIVE),
+            (self.panse + quantites > self._panse_max, CodeErreur.PANSE_DEPASSEE),
+        ])
+
+    def check_ruminer_all(self, selection=None) -> np.ndarray:
+        return self._codes_rumination(self._selection(selection))[0]
+
+    def ruminer_all(self, selection=None) -> np.ndarray:
+        actives = self._selection(selection)
+        codes, production = self._codes_rumination(actives)
+        refus = codes != CodeErreur.OK
+
+        acceptees = actives & ~refus
+        panse = self.panse
+        self.poids[acceptees] += self._arrondir(panse[acceptees] * self.race.RENDEMENT_RUMINATION)
+        panse[acceptees] = 0.0
+
+        if production is not None:
+            self.lait_disponible[acceptees] += production[acceptees]
+            self.lait_total_produit[acceptees] += production[acceptees]
+        if self._typee:
+            self.ration[acceptees] = 0.0
+
+        return refus
+
+    def _codes_rumination(self, actives) -> tuple[np.ndarray, np.ndarray | None]:
+        panse = self.panse
+        regles = [(~(panse > 0), CodeErreur.PANSE_VIDE)]
+
+        production = None
+        if self._laitiere:
+            facteur = panse
+            if self._typee:
+                ration = self.ration
+                facteur = np.where(ration.any(axis=1), ration @ self._coefficients, panse)
+            production = self._arrondir(facteur * self.race.RENDEMENT_LAIT)
+            regles.append((self.lait_disponible + production > self._production_lait_max,
+                           CodeErreur.PRODUCTION_LAIT_DEPASSEE))
+
+        return self._codes(actives, regles), production
+
+    def check_traire_all(self, litres, selection=None) -> np.ndarray:
+        if not self._laitiere:
+            raise TypeError(f"un troupeau de {self.race.__name__} ne produit pas de lait")
+        return self._codes_traite(self._en_unites(self._par_vache(litres, np.float64)), self._selection(selection))
+
+    def traire_all(self, litres, selection=None) -> np.ndarray:
+        if not self._laitiere:
+            raise TypeError(f"un troupeau de {self.race.__name__} ne produit pas de lait")
+
+        litres = self._en_unites(self._par_vache(litres, np.float64))
+        actives = self._selection(selection)
+        refus = self._codes_traite(litres, actives) != CodeErreur.OK
+
+        acceptees = actives & ~refus
+        self.lait_disponible[acceptees] -= litres[acceptees]
+        self.lait_total_traite[acceptees] += litres[acceptees]
+        return refus
+
+    def _codes_traite(self, litres, actives) -> np.ndarray:
+        return self._codes(actives, [
+            (~(litres > 0), CodeErreur.LITRES_NON_POSITIFS),
+            (litres > self.lait_disponible, CodeErreur.LAIT_INSUFFISANT),
+        ])
+
+    def check_vieillir_all(self, selection=None) -> np.ndarray:
+        return self._codes(self._selection(selection), [
+            (self.age >= self.race.AGE_MAX, CodeErreur.AGE_MAX_ATTEINT),
+        ])
+
+    def vieillir_all(self, archive: "Troupeau | None" = None) -> "Troupeau":
+        """
+        Bascule annuelle : chaque vache vieillit d'un an en une passe.
+
+        Les vaches qui atteignent AGE_MAX (ou y étaient déjà, et que
+        Vache.vieillir refuserait) sont mises à la retraite : recopiées à la fin
+        de `archive` (créée au besoin, même race et même classe de troupeau),
+        puis retirées du troupeau, dont le stockage est compacté sans trou en
+        gardant l'ordre des vaches.
+        Renvoie l'archive.
+        """
+        if archive is None:
+            archive = type(self)(race=self.race)
+        elif archive.race is not self.race or type(archive) is not type(self):
+            raise ValueError("l'archive doit avoir la même race et la même classe de troupeau")
+
+        age = self.age
+        age_max = self.race.AGE_MAX
+        age[age < age_max] += 1
+
+        retraitees = age >= age_max
+        if retraitees.any():
+            archive._copier_lignes(self, np.flatnonzero(retraitees))
+            self._compacter(np.flatnonzero(~retraitees))
+        return archive
+
+    def _copier_lignes(self, source: "Troupeau", lignes: np.ndarray) -> None:
+        """Ajoute à la fin du troupeau les `lignes` de `source`, toutes colonnes comprises."""
+        debut = self._taille
+        fin = debut + len(lignes)
+        if fin > len(self._ids):
+            if not self._extensible:
+                raise ValueError("troupeau adossé à des tableaux externes : taille fixe")
+            self._agrandir(max(2 * len(self._ids), fin))
+
+        for nom, _, _ in self.COLONNES:
+            getattr(self, "_" + nom)[debut:fin] = getattr(source, "_" + nom)[lignes]
+        self.petits_noms.extend(source.petits_noms[i] for i in lignes.tolist())
+        self._taille = fin
+
+    def _compacter(self, lignes: np.ndarray) -> None:
+        """Ne garde que les `lignes` (triées), ramenées en tête des colonnes ; la fin est remise à zéro."""
+        taille = len(lignes)
+        for nom, _, _ in self.COLONNES:
+            colonne = getattr(self, "_" + nom)
+            colonne[:taille] = colonne[lignes]
+            colonne[taille:self._taille] = 0
+        noms = self.petits_noms
+        self.petits_noms = [noms[i] for i in lignes.tolist()]
+        self._taille = taille
+
+    def _codes(self, actives, regles) -> np.ndarray:
+        """La première règle violée l'emporte, comme dans les méthodes des classes."""
+        codes = np.zeros(self._taille, dtype=np.uint8)
+        for masque, code in reversed(regles):
+            codes[masque] = code
+        codes[~actives] = CodeErreur.OK
+        return codes
+
+    def _par_vache(self, valeurs, dtype) -> np.ndarray:
+        return np.broadcast_to(np.asarray(valeurs, dtype=dtype), (self._taille,))
+
+    def _selection(self, selection) -> np.ndarray:
+        if selection is None:
+            return np.ones(self._taille, dtype=bool)
+        return self._par_vache(selection, bool)
@@ -0,0 +1,44 @@
+import numpy as np
+
+from src.vaches.troupeau.troupeau import Troupeau
+
+
+class TroupeauExact(Troupeau):
+    """
+    Troupeau en virgule fixe : poids, panse et ration en grammes, lait en millilitres (int64).
+
+    L'interface reste en kg et en litres : chaque quantité reçue (broutement,
+    traite, poids initial) est arrondie une fois au gramme / millilitre, de
+    même que chaque gain de rumination et chaque production de lait. Toutes
+    les additions suivantes sont exactes : les totaux ne dérivent pas au fil
+    d'une saison, et les comparaisons à PANSE_MAX / PRODUCTION_LAIT_MAX
+    (converties une fois) ne basculent plus sur un bruit d'arrondi. Les
+    règles appliquées sont celles de Troupeau, donc de VacheALait / PieNoire.
+    Une quantité inférieure à un demi-gramme est arrondie à 0 et refusée.
+    """
+
+    # grammes par kg, millilitres par litre
+    UNITE: int = 1000
+
+    COLONNES = tuple(
+        (nom, np.int64 if dtype is np.float64 else dtype, forme) for nom, dtype, forme in Troupeau.COLONNES
+    )
+
+    def reels(self, nom: str) -> np.ndarray:
+        """Copie de la colonne `nom` convertie en kg / litres."""
+        return getattr(self, nom) / self.UNITE
+
+    def total(self, nom: str) -> float:
+        # somme entière exacte, convertie une seule fois
+        return int(getattr(self, nom).sum()) / self.UNITE
+
+    def total_exact(self, nom: str) -> int:
+        """Somme exacte de la colonne `nom`, en grammes / millilitres."""
+        return int(getattr(self, nom).sum())
+
+    def _en_unites(self, valeurs):
+        return self._arrondir(np.multiply(valeurs, self.UNITE, dtype=np.float64))
+
+    def _arrondir(self, valeurs):
+        # g x (L/kg) = mL : gain et lait calculés depuis les colonnes tombent déjà dans l'unité
+        return np.rint(valeurs).astype(np.int64)
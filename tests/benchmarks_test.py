@@ -0,0 +1,41 @@
+from benchmarks.suite import BAS, HAUT, comparer
+
+
+def _resultats(**valeurs) -> dict:
+    return {"resultats": {nom: {"valeur": v, "unite": "u", "sens": sens} for nom, (v, sens) in valeurs.items()}}
+
+
+def test_should_flag_slower_latency_given_threshold_exceeded():
+    # Arrange
+    baseline = _resultats(latence=(100.0, BAS), debit=(1000.0, HAUT))
+    actuel = _resultats(latence=(120.0, BAS), debit=(1000.0, HAUT))
+
+    # Act
+    regressions = comparer(actuel, baseline, seuil=0.10)
+
+    # Assert (1 assertion métier)
+    assert [ligne.split(" ")[0] for ligne in regressions] == ["latence"]
+
+
+def test_should_flag_lower_throughput_given_threshold_exceeded():
+    # Arrange
+    baseline = _resultats(debit=(1000.0, HAUT))
+    actuel = _resultats(debit=(850.0, HAUT))
+
+    # Act
+    regressions = comparer(actuel, baseline, seuil=0.10)
+
+    # Assert (1 assertion métier)
+    assert len(regressions) == 1
+
+
+def test_should_ignore_improvement_given_faster_results():
+    # Arrange
+    baseline = _resultats(latence=(100.0, BAS), debit=(1000.0, HAUT))
+    actuel = _resultats(latence=(50.0, BAS), debit=(2000.0, HAUT))
+
+    # Act
+    regressions = comparer(actuel, baseline, seuil=0.10)
+
+    # Assert (1 assertion métier)
+    assert regressions == []
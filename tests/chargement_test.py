@@ -0,0 +1,132 @@
+import json
+
+import pytest
+
+from src.vaches.domain.errors.codes import CodeErreur
+from src.vaches.domain.pie_noire import PieNoire
+from src.vaches.domain.vache_a_lait import VacheALait
+from src.vaches.infrastructure.chargement import Rejet, charger
+
+
+@pytest.fixture
+def csv_pies(tmp_path) -> str:
+    chemin = tmp_path / "pies.csv"
+    chemin.write_text(
+        "petit_nom,poids,nb_taches_blanches,nb_taches_noires\n"
+        "Bella,520,12,18\n"
+        "   ,500,3,4\n"
+        "Rosie,-1,3,4\n"
+        "Lola,480,12.0,0\n"
+        "Nina,abc,5,6\n",
+        encoding="utf-8",
+    )
+    return str(chemin)
+
+
+def test_should_emit_only_valid_cows_given_csv(csv_pies: str):
+    # Arrange / Act
+    vaches = [v for lot in charger(csv_pies, race=PieNoire) for v in lot.vaches]
+
+    # Assert (1 assertion métier)
+    assert [v.petit_nom for v in vaches] == ["Bella"]
+
+
+def test_should_report_every_violated_rule_given_csv(csv_pies: str):
+    # Arrange / Act
+    rejets = [r for lot in charger(csv_pies, race=PieNoire) for r in lot.rejets]
+
+    # Assert (1 assertion métier)
+    assert [(r.ligne, r.champ, r.code) for r in rejets] == [
+        (2, "petit_nom", CodeErreur.PETIT_NOM_VIDE),
+        (3, "poids", CodeErreur.POIDS_NEGATIF),
+        (4, "nb_taches_blanches", CodeErreur.TACHES_NON_ENTIERES),
+        (4, "nb_taches_noires", CodeErreur.TACHES_NON_POSITIVES),
+        (5, "poids", CodeErreur.POIDS_NON_NUMERIQUE),
+    ]
+
+
+def test_should_keep_raw_value_given_rejected_row(csv_pies: str):
+    # Arrange / Act
+    premier_rejet = next(charger(csv_pies, race=PieNoire)).rejets[0]
+
+    # Assert (1 assertion métier)
+    assert premier_rejet == Rejet(2, "petit_nom", CodeErreur.PETIT_NOM_VIDE, "   ")
+
+
+def test_should_stream_in_chunks_given_small_taille_lot(tmp_path):
+    # Arrange
+    chemin = tmp_path / "lolas.jsonl"
+    with open(chemin, "w", encoding="utf-8") as f:
+        for i in range(25):
+            f.write(json.dumps({"petit_nom": f"Lola{i}", "poids": 500.0}) + "\n")
+
+    # Act
+    tailles = [len(lot.vaches) for lot in charger(str(chemin), race=VacheALait, taille_lot=10)]
+
+    # Assert (1 assertion métier)
+    assert tailles == [10, 10, 5]
+
+
+@pytest.mark.parametrize("taches", [12.0, True, "12"])
+def test_should_apply_pie_noire_int_rule_given_json_spots(tmp_path, taches):
+    # Arrange
+    chemin = tmp_path / "pie.jsonl"
+    ligne = {"petit_nom": "Bella", "poids": 520, "nb_taches_blanches": taches, "nb_taches_noires": 3}
+    chemin.write_text(json.dumps(ligne) + "\n", encoding="utf-8")
+
+    # Act
+    lot = next(charger(str(chemin), race=PieNoire))
+
+    # Assert (1 assertion métier) : en JSON seul un vrai int est accepté
+    assert len(lot.vaches) == 0
+
+
+def test_should_reject_malformed_json_lines_and_keep_loading(tmp_path):
+    # Arrange
+    chemin = tmp_path / "lolas.jsonl"
+    chemin.write_text(
+        '{"petit_nom": "Lola", "poids": 500}\n'
+        '{"petit_nom": "Bel\n'
+        '[1, 2]\n'
+        '{"petit_nom": "Rosie", "poids": 480}\n',
+        encoding="utf-8",
+    )
+
+    # Act
+    lots = list(charger(str(chemin), race=VacheALait))
+
+    # Assert (1 assertion métier)
+    assert ([v.petit_nom for lot in lots for v in lot.vaches],
+            [(r.ligne, r.code) for lot in lots for r in lot.rejets]) == (
+        ["Lola", "Rosie"], [(2, CodeErreur.LIGNE_ILLISIBLE), (3, CodeErreur.LIGNE_ILLISIBLE)])
+
+
+def test_should_load_oversized_spot_count_given_json(tmp_path):
+    # Arrange
+    chemin = tmp_path / "pie.jsonl"
+    ligne = {"petit_nom": "Bella", "poids": 520, "nb_taches_blanches": 10 ** 30, "nb_taches_noires": 3}
+    chemin.write_text(json.dumps(ligne) + "\n", encoding="utf-8")
+
+    # Act
+    lot = next(charger(str(chemin), race=PieNoire))
+
+    # Assert (1 assertion métier)
+    assert ([v.nb_taches_blanches for v in lot.vaches], lot.rejets) == ([10 ** 30], [])
+
+
+def test_should_report_physical_line_numbers_given_blank_lines(tmp_path):
+    # Arrange
+    chemin = tmp_path / "lolas.jsonl"
+    chemin.write_text(
+        '{"petit_nom": "Lola", "poids": 500}\n'
+        '\n'
+        '\n'
+        '{"petit_nom": "Rosie", "poids": -1}\n',
+        encoding="utf-8",
+    )
+
+    # Act
+    rejets = [r for lot in charger(str(chemin), race=VacheALait) for r in lot.rejets]
+
+    # Assert (1 assertion métier)
+    assert [(r.ligne, r.code) for r in rejets] == [(4, CodeErreur.POIDS_NEGATIF)]
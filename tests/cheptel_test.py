@@ -0,0 +1,92 @@
+import pytest
+
+from src.vaches.domain.errors.exceptions import InvalidVacheException
+from src.vaches.domain.nourriture.TypeNourriture import TypeNourriture
+from src.vaches.domain.pie_noire import PieNoire
+from src.vaches.domain.vache import Vache
+from src.vaches.domain.vache_a_lait import VacheALait
+from src.vaches.troupeau.cheptel import Cheptel
+
+
+def _cheptel() -> Cheptel:
+    return Cheptel([
+        Vache(petit_nom="Marguerite", poids=400.0),
+        VacheALait(petitNom="Lola", poids=500.0),
+        PieNoire("Bella", 600.0, nb_taches_blanches=1, nb_taches_noires=1),
+    ])
+
+
+def _somme(cheptel: Cheptel, attribut: str) -> float:
+    return sum(getattr(v, attribut, 0.0) for v in cheptel)
+
+
+def test_should_match_recomputed_totals_given_daily_operations():
+    # Arrange
+    cheptel = _cheptel()
+
+    # Act
+    for vache in cheptel:
+        vache.brouter(10.0)
+        vache.ruminer()
+        if isinstance(vache, VacheALait):
+            vache.traire(3.0)
+
+    # Assert (1 assertion métier)
+    assert (cheptel.lait_disponible, cheptel.lait_total_traite) == pytest.approx(
+        (_somme(cheptel, "lait_disponible"), _somme(cheptel, "lait_total_traite"))
+    )
+
+
+def test_should_update_mean_weight_given_ruminer():
+    # Arrange
+    cheptel = _cheptel()
+    vache = next(iter(cheptel))
+    vache.brouter(12.0)
+
+    # Act
+    vache.ruminer()
+
+    # Assert (1 assertion métier) : gain de 3 kg réparti sur 3 vaches
+    assert cheptel.poids_moyen == pytest.approx(501.0)
+
+
+def test_should_keep_totals_given_operation_raising_invalid_vache_exception():
+    # Arrange
+    cheptel = _cheptel()
+    pie = [v for v in cheptel if isinstance(v, PieNoire)][0]
+    pie.lait_disponible = PieNoire.PRODUCTION_LAIT_MAX
+    cheptel.recalculer()
+    pie.brouter(5.0, TypeNourriture.CEREALES)
+    avant = (cheptel.lait_disponible, cheptel.poids_moyen, cheptel.panse_totale)
+
+    # Act
+    with pytest.raises(InvalidVacheException):
+        pie.ruminer()
+
+    # Assert (1 assertion métier)
+    assert (cheptel.lait_disponible, cheptel.poids_moyen, cheptel.panse_totale) == avant
+
+
+def test_should_move_cow_between_age_buckets_given_vieillir():
+    # Arrange
+    cheptel = _cheptel()
+
+    # Act
+    next(iter(cheptel)).vieillir()
+
+    # Assert (1 assertion métier)
+    assert cheptel.repartition_ages == {0: 2, 1: 1}
+
+
+def test_should_stop_tracking_given_removed_cow():
+    # Arrange
+    cheptel = _cheptel()
+    vache = [v for v in cheptel if isinstance(v, VacheALait)][0]
+    cheptel.retirer(vache)
+
+    # Act
+    vache.brouter(10.0)
+    vache.ruminer()
+
+    # Assert (1 assertion métier)
+    assert cheptel.lait_total_produit == 0.0
@@ -0,0 +1,104 @@
+import numpy as np
+
+from src.vaches.domain.pie_noire import PieNoire
+from src.vaches.domain.vache import Vache
+from src.vaches.domain.vache_a_lait import VacheALait
+from src.vaches.infrastructure.journal import Operation
+from src.vaches.simulation.evenements import AN, JOUR, MoteurEvenements
+from src.vaches.troupeau.troupeau import Troupeau
+
+
+def _vaches(n: int) -> list[VacheALait]:
+    return [VacheALait(petitNom=f"Lola{i}", poids=500.0 + i) for i in range(n)]
+
+
+def test_should_match_hand_written_loop_given_standard_days():
+    # Arrange
+    attendues = _vaches(5)
+    for _ in range(10):
+        for vache in attendues:
+            vache.brouter(10.0)
+            vache.ruminer()
+            vache.traire(vache.lait_disponible)
+    vaches = _vaches(5)
+    moteur = MoteurEvenements(delai_rumination=1.0)
+    moteur.planifier_journees(vaches, repas=((6.0, 10.0, None),), traites=(8.0,))
+
+    # Act
+    moteur.executer(10 * JOUR)
+
+    # Assert (1 assertion métier)
+    assert [(v.poids, v.lait_total_traite) for v in vaches] == [(v.poids, v.lait_total_traite) for v in attendues]
+
+
+def test_should_ruminate_only_fed_cows_given_troupeau_like_objects():
+    # Arrange
+    objets = [Vache("Pleine", 500.0), Vache("Vide", 500.0)]
+    objets[0].brouter(45.0)
+    troupeau = Troupeau.depuis_vaches([Vache("Pleine", 500.0), Vache("Vide", 500.0)])
+    troupeau.brouter_all(np.array([45.0, 0.0]), selection=np.array([True, False]))
+    moteur = MoteurEvenements(delai_rumination=1.0)
+    moteur.planifier(6.0, Operation.BROUTER, objets, 10.0)
+    moteur.planifier(6.0, Operation.BROUTER, troupeau, 10.0)
+
+    # Act
+    moteur.executer(JOUR)
+
+    # Assert (1 assertion métier) : la vache refusée (PANSE_DEPASSEE) garde sa panse
+    assert (troupeau.panse.tolist(), [v.panse for v in objets]) == ([45.0, 0.0], [45.0, 0.0])
+
+
+def test_should_process_same_instant_events_in_one_batch_given_individual_cows():
+    # Arrange
+    moteur = MoteurEvenements()
+    for vache in _vaches(50) + [PieNoire("Bella", 500.0, 1, 1) for _ in range(50)]:
+        moteur.planifier(6.0, Operation.BROUTER, vache, 5.0)
+
+    # Act
+    rapport = moteur.executer(JOUR)
+
+    # Assert (1 assertion métier)
+    assert (rapport.lots, rapport.evenements) == (1, 100)
+
+
+def test_should_run_brouter_before_ruminer_given_same_instant():
+    # Arrange
+    vache = Vache(petit_nom="Marguerite", poids=400.0)
+    moteur = MoteurEvenements()
+    moteur.planifier(6.0, Operation.RUMINER, vache)
+    moteur.planifier(6.0, Operation.BROUTER, vache, 8.0)
+
+    # Act
+    rapport = moteur.executer(JOUR)
+
+    # Assert (1 assertion métier)
+    assert (rapport.refus, vache.poids) == ({}, 402.0)
+
+
+def test_should_count_refusals_given_panse_overflow():
+    # Arrange
+    vache = Vache(petit_nom="Marguerite", poids=400.0)
+    moteur = MoteurEvenements()
+    moteur.planifier(0.0, Operation.BROUTER, vache, 30.0, periode=1.0)
+
+    # Act
+    rapport = moteur.executer(3.0)
+
+    # Assert (1 assertion métier)
+    assert rapport.refus == {Operation.BROUTER: 3}
+
+
+def test_should_retire_cows_at_age_max_given_yearly_aging_of_troupeau():
+    # Arrange
+    troupeau = Troupeau(race=VacheALait)
+    troupeau.ajouter("Lola", 500.0)
+    troupeau.ajouter("Bella", 500.0)
+    troupeau.age[0] = VacheALait.AGE_MAX - 1
+    moteur = MoteurEvenements()
+    moteur.planifier_journees(troupeau)
+
+    # Act
+    moteur.executer(AN)
+
+    # Assert (1 assertion métier)
+    assert (np.asarray(troupeau.age).tolist(), len(moteur.archives[troupeau])) == ([1], 1)
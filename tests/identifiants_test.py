@@ -0,0 +1,176 @@
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from src.vaches.domain.identifiants import AllocateurIdentifiants
+from src.vaches.domain.vache import Vache
+
+
+def _ids_par_thread(allocateur: AllocateurIdentifiants, nb_threads: int, nb_ids: int) -> list[int]:
+    resultats = [[] for _ in range(nb_threads)]
+
+    def travail(sortie: list[int]) -> None:
+        for _ in range(nb_ids):
+            sortie.append(allocateur.prochain())
+
+    threads = [threading.Thread(target=travail, args=(r,)) for r in resultats]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return [i for r in resultats for i in r]
+
+
+def _ids_de_vaches(nombre: int) -> list[int]:
+    return [Vache.allocateur().prochain() for _ in range(nombre)]
+
+
+def test_should_hand_out_sequential_ids_given_single_thread():
+    # Arrange
+    allocateur = AllocateurIdentifiants(premier=1, taille_bloc=2)
+
+    # Act
+    ids = [allocateur.prochain() for _ in range(5)]
+
+    # Assert (1 assertion métier)
+    assert ids == [1, 2, 3, 4, 5]
+
+
+def test_should_never_duplicate_ids_given_concurrent_threads():
+    # Arrange
+    allocateur = AllocateurIdentifiants(taille_bloc=16)
+
+    # Act
+    ids = _ids_par_thread(allocateur, nb_threads=8, nb_ids=1000)
+
+    # Assert (1 assertion métier)
+    assert len(set(ids)) == len(ids)
+
+
+def test_should_resume_from_seed_given_restaurer():
+    # Arrange
+    allocateur = AllocateurIdentifiants()
+    allocateur.prochain()
+
+    # Act
+    allocateur.restaurer(500)
+
+    # Assert (1 assertion métier)
+    assert allocateur.prochain() == 500
+
+
+def test_should_report_next_free_block_given_etat():
+    # Arrange
+    allocateur = AllocateurIdentifiants(premier=1, taille_bloc=10)
+    allocateur.prochain()
+
+    # Act
+    etat = allocateur.etat()
+
+    # Assert (1 assertion métier)
+    assert etat == 11
+
+
+def test_should_give_disjoint_id_spaces_given_partitioned_workers():
+    # Arrange : deux "processus" partant du même état
+    travailleurs = [AllocateurIdentifiants(taille_bloc=4) for _ in range(2)]
+    for index, allocateur in enumerate(travailleurs):
+        allocateur.partitionner(index, 2)
+
+    # Act
+    ids = [a.prochain() for a in travailleurs for _ in range(10)]
+
+    # Assert (1 assertion métier)
+    assert len(set(ids)) == len(ids)
+
+
+def test_should_raise_value_error_given_index_outside_partition():
+    # Arrange
+    allocateur = AllocateurIdentifiants()
+
+    # Act / Assert
+    with pytest.raises(ValueError):
+        allocateur.partitionner(2, 2)
+
+
+def test_should_use_plugged_allocator_given_new_vache():
+    # Arrange
+    precedent = Vache.allocateur()
+    Vache.utiliser_allocateur(AllocateurIdentifiants(premier=10_000))
+
+    # Act
+    try:
+        vache = Vache(petit_nom="Marguerite", poids=450.0)
+    finally:
+        Vache.utiliser_allocateur(precedent)
+
+    # Assert (1 assertion métier)
+    assert vache.id == 10_000
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="os.fork indisponible")
+def test_should_give_disjoint_ids_given_forked_child():
+    # Arrange
+    allocateur = AllocateurIdentifiants(taille_bloc=4)
+    avant = [allocateur.prochain() for _ in range(2)]
+    lecture, ecriture = os.pipe()
+
+    # Act
+    pid = os.fork()
+    if pid == 0:
+        os.close(lecture)
+        enfant = ",".join(str(allocateur.prochain()) for _ in range(10))
+        os.write(ecriture, enfant.encode())
+        os._exit(0)
+    os.close(ecriture)
+    parent = [allocateur.prochain() for _ in range(10)]
+    with os.fdopen(lecture) as flux:
+        enfant = [int(i) for i in flux.read().split(",")]
+    os.waitpid(pid, 0)
+    ids = avant + parent + enfant
+
+    # Assert (1 assertion métier)
+    assert len(set(ids)) == len(ids)
+
+
+@pytest.mark.skipif("fork" not in multiprocessing.get_all_start_methods(), reason="fork indisponible")
+def test_should_give_disjoint_ids_given_forked_process_pool():
+    # Arrange
+    parent = _ids_de_vaches(3)
+
+    # Act
+    with ProcessPoolExecutor(max_workers=3, mp_context=multiprocessing.get_context("fork")) as pool:
+        travailleurs = [i for ids in pool.map(_ids_de_vaches, [50] * 6) for i in ids]
+    ids = parent + travailleurs + _ids_de_vaches(3)
+
+    # Assert (1 assertion métier)
+    assert len(set(ids)) == len(ids)
+
+
+def test_should_give_disjoint_ids_given_adopted_space_in_fresh_allocator():
+    # Arrange : le travailleur spawn repart d'un allocateur neuf
+    parent = AllocateurIdentifiants(taille_bloc=4)
+    parent.prochain()
+    travailleur = AllocateurIdentifiants(taille_bloc=4)
+    travailleur.adopter(parent.ceder_espace(nb_blocs=3))
+
+    # Act
+    ids = [parent.prochain() for _ in range(20)] + [travailleur.prochain() for _ in range(12)]
+
+    # Assert (1 assertion métier)
+    assert len(set(ids)) == len(ids)
+
+
+def test_should_raise_runtime_error_given_exhausted_adopted_space():
+    # Arrange
+    travailleur = AllocateurIdentifiants(taille_bloc=4)
+    travailleur.adopter(AllocateurIdentifiants(taille_bloc=4).ceder_espace(nb_blocs=1))
+    for _ in range(4):
+        travailleur.prochain()
+
+    # Act / Assert
+    with pytest.raises(RuntimeError):
+        travailleur.prochain()
@@ -0,0 +1,82 @@
+import random
+
+import pytest
+
+from point_plan.point_3d import Point3D
+from point_plan.point_plan import PointPlan
+from src.vaches.domain.vache import Vache
+from src.vaches.paturage.index_spatial import IndexSpatial
+
+
+def _troupeau_place(nombre: int = 500) -> tuple[IndexSpatial, dict[int, PointPlan]]:
+    aleatoire = random.Random(42)
+    index = IndexSpatial(taille_cellule=10.0)
+    positions = {}
+    for _ in range(nombre):
+        vache = Vache(petit_nom="Marguerite", poids=450.0)
+        position = PointPlan(aleatoire.uniform(-100, 100), aleatoire.uniform(-100, 100))
+        index.placer(vache, position)
+        positions[vache.id] = position
+    return index, positions
+
+
+def _distance2(p: PointPlan, centre: PointPlan) -> float:
+    return (p.abscisse - centre.abscisse) ** 2 + (p.ordonnee - centre.ordonnee) ** 2
+
+
+def test_should_match_brute_force_when_dans_rayon_called():
+    # Arrange
+    index, positions = _troupeau_place()
+    centre = PointPlan(12.5, -30.0)
+
+    # Act
+    trouvees = {v.id for v in index.dans_rayon(centre, 25.0)}
+
+    # Assert (1 assertion métier)
+    assert trouvees == {i for i, p in positions.items() if _distance2(p, centre) <= 25.0 ** 2}
+
+
+def test_should_match_brute_force_when_plus_proches_called():
+    # Arrange
+    index, positions = _troupeau_place()
+    centre = PointPlan(250.0, 0.0)
+
+    # Act
+    trouvees = [v.id for v in index.plus_proches(centre, 7)]
+
+    # Assert (1 assertion métier)
+    assert trouvees == sorted(positions, key=lambda i: (_distance2(positions[i], centre), i))[:7]
+
+
+def test_should_match_brute_force_when_dans_boite_called():
+    # Arrange
+    index, positions = _troupeau_place()
+    minimum, maximum = PointPlan(-20.0, 5.0), PointPlan(35.0, 60.0)
+
+    # Act
+    trouvees = {v.id for v in index.dans_boite(minimum, maximum)}
+
+    # Assert (1 assertion métier)
+    assert trouvees == {i for i, p in positions.items() if -20 <= p.abscisse <= 35 and 5 <= p.ordonnee <= 60}
+
+
+def test_should_follow_cow_when_placer_called_again():
+    # Arrange
+    index = IndexSpatial(taille_cellule=10.0)
+    vache = Vache(petit_nom="Marguerite", poids=450.0)
+    index.placer(vache, Point3D(0.0, 0.0, 90.0))
+
+    # Act
+    index.placer(vache, Point3D(500.0, 500.0, 180.0))
+
+    # Assert (1 assertion métier)
+    assert (index.dans_rayon(PointPlan(0.0, 0.0), 50.0), index.plus_proches(PointPlan(0.0, 0.0), 1)) == ([], [vache])
+
+
+def test_should_raise_when_retirer_called_given_unknown_cow():
+    # Arrange
+    index = IndexSpatial()
+
+    # Act / Assert (1 assertion métier)
+    with pytest.raises(KeyError):
+        index.retirer(Vache(petit_nom="Marguerite", poids=450.0))
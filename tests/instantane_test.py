@@ -0,0 +1,116 @@
+import numpy as np
+import pytest
+
+from src.vaches.domain.nourriture.TypeNourriture import TypeNourriture
+from src.vaches.domain.pie_noire import PieNoire
+from src.vaches.domain.vache import Vache
+from src.vaches.domain.vache_a_lait import VacheALait
+from src.vaches.infrastructure.instantane import restaurer, sauvegarder, sauvegarder_vaches
+from src.vaches.troupeau.troupeau import Troupeau
+
+
+def _etat(vache: PieNoire) -> tuple:
+    return (vache.id, vache.petit_nom, vache.poids, vache.age, vache.panse, vache.lait_disponible,
+            vache.lait_total_produit, vache.lait_total_traite, vache.nb_taches_blanches,
+            vache.nb_taches_noires, vache.ration)
+
+
+def _pies() -> list[PieNoire]:
+    pies = [PieNoire("Bella", 520.0, nb_taches_blanches=12, nb_taches_noires=18),
+            PieNoire("Éloïse", 480.0, nb_taches_blanches=3, nb_taches_noires=7)]
+    pies[0].brouter(4.0, TypeNourriture.CEREALES)
+    pies[0].ruminer()
+    pies[0].traire(2.0)
+    pies[1].brouter(2.5, TypeNourriture.FOIN)
+    pies[1].vieillir()
+    return pies
+
+
+def test_should_restore_every_field_given_pie_noire_snapshot(tmp_path):
+    # Arrange
+    pies = _pies()
+    chemin = str(tmp_path / "troupeau.snap")
+    sauvegarder_vaches(chemin, pies)
+
+    # Act
+    restaurees = restaurer(chemin).vaches()
+
+    # Assert (1 assertion métier)
+    assert [_etat(v) for v in restaurees] == [_etat(v) for v in pies]
+
+
+def test_should_resume_id_counter_after_snapshot_ids_given_restore(tmp_path):
+    # Arrange
+    troupeau = Troupeau(race=PieNoire)
+    troupeau.ajouter("Bella", 500.0)
+    troupeau.ids[0] = Vache.allocateur().etat() + 10_000
+    chemin = str(tmp_path / "troupeau.snap")
+    sauvegarder(chemin, troupeau, [1], [1])
+
+    # Act
+    restaurer(chemin)
+
+    # Assert (1 assertion métier)
+    assert Vache(petit_nom="Rosie", poids=450.0).id > troupeau.ids[0]
+
+
+def test_should_leave_file_untouched_given_copy_on_write_restore(tmp_path):
+    # Arrange
+    troupeau = Troupeau(race=PieNoire)
+    troupeau.ajouter("Bella", 500.0)
+    chemin = str(tmp_path / "troupeau.snap")
+    sauvegarder(chemin, troupeau, [1], [1])
+    restaure = restaurer(chemin).troupeau
+
+    # Act
+    restaure.brouter_all(5.0)
+
+    # Assert (1 assertion métier)
+    assert np.array_equal(restaurer(chemin).troupeau.panse, [0.0])
+
+
+def test_should_raise_value_error_given_unknown_file(tmp_path):
+    # Arrange
+    chemin = tmp_path / "autre.bin"
+    chemin.write_bytes(b"\0" * 128)
+
+    # Act / Assert
+    with pytest.raises(ValueError):
+        restaurer(str(chemin))
+
+
+def test_should_raise_value_error_given_pie_noire_herd_without_spots(tmp_path):
+    # Arrange
+    troupeau = Troupeau.depuis_vaches(_pies())
+    chemin = tmp_path / "troupeau.snap"
+
+    # Act / Assert
+    with pytest.raises(ValueError):
+        sauvegarder(str(chemin), troupeau)
+
+
+def test_should_restore_own_breed_given_homonymous_breeds(tmp_path):
+    # Arrange
+    class PieNoire(Vache):
+        pass
+
+    homonymes = str(tmp_path / "homonymes.snap")
+    pies = str(tmp_path / "pies.snap")
+    sauvegarder_vaches(homonymes, [PieNoire("Homonyme", 400.0)])
+    sauvegarder_vaches(pies, _pies())
+
+    # Act
+    restaurees = (restaurer(homonymes).troupeau.race, restaurer(pies).troupeau.race)
+
+    # Assert (1 assertion métier)
+    assert restaurees == (PieNoire, type(_pies()[0]))
+
+
+def test_should_raise_type_error_given_mixed_breeds(tmp_path):
+    # Arrange
+    vaches = [VacheALait("Lola", 500.0), *_pies()]
+    chemin = tmp_path / "troupeau.snap"
+
+    # Act / Assert
+    with pytest.raises(TypeError):
+        sauvegarder_vaches(str(chemin), vaches)
@@ -0,0 +1,130 @@
+import copy
+
+import pytest
+
+from src.vaches.domain.errors.exceptions import InvalidVacheException
+from src.vaches.domain.nourriture.TypeNourriture import TypeNourriture
+from src.vaches.domain.pie_noire import PieNoire
+from src.vaches.domain.vache import Vache
+from src.vaches.domain.vache_a_lait import VacheALait
+from src.vaches.infrastructure.journal import Journal, Operation, lire, rejouer
+
+
+def _etat(vache: VacheALait) -> tuple:
+    return (
+        vache.poids, vache.age, vache.panse,
+        vache.lait_disponible, vache.lait_total_produit, vache.lait_total_traite,
+        getattr(vache, "ration", None),
+    )
+
+
+@pytest.fixture
+def chemin_journal(tmp_path) -> str:
+    return str(tmp_path / "troupeau.jrnl")
+
+
+@pytest.fixture
+def journal_actif(chemin_journal):
+    journal = Journal(chemin_journal, taille_lot=3)
+    Vache.journaliser(journal)
+    yield journal
+    Vache.journaliser(None)
+    journal.fermer()
+
+
+def _simuler(lola: VacheALait, bella: PieNoire) -> None:
+    lola.brouter(10.0)
+    bella.brouter(2.0, TypeNourriture.HERBE)
+    bella.brouter(1.5)
+    lola.ruminer()
+    bella.brouter(1.0, TypeNourriture.CEREALES)
+    bella.ruminer()
+    lola.traire(3.3)
+    bella.brouter(0.7, TypeNourriture.FOIN)
+    lola.brouter(4.2)
+    bella.vieillir()
+
+
+def test_should_record_one_entry_per_operation_given_active_journal(journal_actif: Journal, chemin_journal):
+    # Arrange
+    bella = PieNoire("Bella", 520.0, nb_taches_blanches=12, nb_taches_noires=18)
+
+    # Act
+    bella.brouter(2.0, TypeNourriture.HERBE)
+    bella.ruminer()
+    journal_actif.vider()
+
+    # Assert (1 assertion métier)
+    assert lire(chemin_journal)["operation"].tolist() == [Operation.BROUTER, Operation.RUMINER]
+
+
+def test_should_not_record_rejected_operation_given_active_journal(journal_actif: Journal, chemin_journal):
+    # Arrange
+    vache = VacheALait(petitNom="Lola", poids=500.0)
+
+    # Act
+    with pytest.raises(InvalidVacheException):
+        vache.traire(1.0)
+    journal_actif.vider()
+
+    # Assert (1 assertion métier)
+    assert len(lire(chemin_journal)) == 0
+
+
+def test_should_rebuild_exact_state_given_rejouer(journal_actif: Journal, chemin_journal):
+    # Arrange
+    lola = VacheALait(petitNom="Lola", poids=500.0)
+    bella = PieNoire("Bella", 520.0, nb_taches_blanches=12, nb_taches_noires=18)
+    copies = [copy.copy(lola), copy.copy(bella)]
+    _simuler(lola, bella)
+    journal_actif.fermer()
+
+    # Act
+    rejouer(chemin_journal, copies)
+
+    # Assert (1 assertion métier)
+    assert [_etat(v) for v in copies] == [_etat(lola), _etat(bella)]
+
+
+def test_should_ignore_truncated_tail_given_reopened_journal(chemin_journal):
+    # Arrange
+    with Journal(chemin_journal) as journal:
+        journal.traire(1, 2.0)
+    with open(chemin_journal, "ab") as f:
+        f.write(b"\x01\x02\x03")
+
+    # Act
+    with Journal(chemin_journal) as journal:
+        journal.traire(1, 3.0)
+
+    # Assert (1 assertion métier)
+    assert lire(chemin_journal)["valeur"].tolist() == [2.0, 3.0]
+
+
+def test_should_raise_value_error_given_foreign_file(chemin_journal):
+    # Arrange
+    with open(chemin_journal, "wb") as f:
+        f.write(b"pas un journal de vaches")
+
+    # Act / Assert
+    with pytest.raises(ValueError):
+        lire(chemin_journal)
+
+
+def test_should_log_each_buffered_increment_given_applied_buffer(tmp_path):
+    # Arrange
+    chemin = str(tmp_path / "vaches.jrnl")
+    pie = PieNoire("Bella", 500.0, nb_taches_blanches=1, nb_taches_noires=1)
+    with Journal(chemin) as journal:
+        Vache.journaliser(journal)
+        try:
+            pie.brouter_differe(1.0, TypeNourriture.HERBE)
+            pie.brouter_differe(2.0)
+
+            # Act
+            pie.appliquer_tampon()
+        finally:
+            Vache.journaliser(None)
+
+    # Assert (1 assertion métier)
+    assert lire(chemin)["valeur"].tolist() == [1.0, 2.0]
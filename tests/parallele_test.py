@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+
+from src.vaches.domain.nourriture.TypeNourriture import TypeNourriture
+from src.vaches.domain.pie_noire import PieNoire
+from src.vaches.simulation.parallele import SimulationParallele, simuler_journees
+from src.vaches.troupeau.troupeau import Troupeau
+
+
+def _troupeau(n: int) -> Troupeau:
+    troupeau = Troupeau(race=PieNoire)
+    for i in range(n):
+        troupeau.ajouter(f"Bella{i}", 500.0 + i)
+    return troupeau
+
+
+def test_should_match_single_process_state_given_parallel_run():
+    # Arrange
+    attendu = _troupeau(50)
+    simuler_journees(attendu, jours=3, quantite=7.5, nourriture=TypeNourriture.CEREALES)
+    troupeau = _troupeau(50)
+
+    # Act
+    SimulationParallele(troupeau, nb_processus=2, nb_shards=3).executer(3, 7.5, TypeNourriture.CEREALES)
+
+    # Assert (1 assertion métier)
+    assert np.array_equal(troupeau.poids, attendu.poids)
+
+
+def test_should_merge_shard_totals_given_parallel_run():
+    # Arrange
+    troupeau = _troupeau(50)
+
+    # Act
+    bilan = SimulationParallele(troupeau, nb_processus=2, nb_shards=4).executer(2, 10.0)
+
+    # Assert (1 assertion métier)
+    assert bilan.lait_traite == pytest.approx(troupeau.lait_total_traite.sum())
+
+
+def test_should_reject_growth_given_troupeau_over_external_columns():
+    # Arrange
+    troupeau = Troupeau.sur_colonnes(PieNoire, _troupeau(2).colonnes())
+
+    # Act / Assert
+    with pytest.raises(ValueError):
+        troupeau.ajouter("Rosie", 500.0)
@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+
+from src.vaches.domain.nourriture.TypeNourriture import INDEX_NOURRITURE, TypeNourriture
+from src.vaches.domain.pie_noire import PieNoire
+from src.vaches.paturage.paturage import Paturage
+from src.vaches.troupeau.troupeau import Troupeau
+
+
+def _troupeau(nombre: int, race: type = PieNoire) -> Troupeau:
+    troupeau = Troupeau(race=race, capacite=nombre)
+    for i in range(nombre):
+        troupeau.ajouter(f"Bella{i}", 500.0)
+    return troupeau
+
+
+def test_should_move_grazed_food_from_field_to_panse_when_brouter_called():
+    # Arrange
+    paturage = Paturage(4, 4, {TypeNourriture.HERBE: 3.0, TypeNourriture.FOIN: 1.0})
+    troupeau = _troupeau(6)
+    avant = paturage.quantites.sum()
+
+    # Act
+    paturage.brouter(troupeau, [0, 0, 1, 2, 3, 3], [0, 0, 1, 2, 3, 0], 2.5)
+
+    # Assert (1 assertion métier)
+    assert avant - paturage.quantites.sum() == pytest.approx(troupeau.panse.sum())
+
+
+def test_should_share_cell_proportionally_given_crowded_cell():
+    # Arrange
+    paturage = Paturage(1, 1, {TypeNourriture.HERBE: 3.0})
+    troupeau = _troupeau(2)
+
+    # Act
+    broute = paturage.brouter(troupeau, [0, 0], [0, 0], [4.0, 2.0])
+
+    # Assert (1 assertion métier)
+    assert broute.tolist() == pytest.approx([2.0, 1.0])
+
+
+def test_should_never_exceed_panse_max_given_large_appetite():
+    # Arrange
+    paturage = Paturage(1, 2, {TypeNourriture.HERBE: 1000.0, TypeNourriture.CEREALES: 1000.0})
+    troupeau = _troupeau(2)
+    troupeau.brouter_all([PieNoire.PANSE_MAX - 1.0, 0.0])
+
+    # Act
+    paturage.brouter(troupeau, [0, 0], [0, 1], 1000.0)
+
+    # Assert (1 assertion métier)
+    assert troupeau.panse.tolist() == pytest.approx([PieNoire.PANSE_MAX, PieNoire.PANSE_MAX])
+
+
+def test_should_take_most_nutritious_type_first_when_brouter_called():
+    # Arrange
+    paturage = Paturage(1, 1, {TypeNourriture.PAILLE: 5.0, TypeNourriture.CEREALES: 5.0})
+    troupeau = _troupeau(1)
+
+    # Act
+    paturage.brouter(troupeau, [0], [0], 4.0)
+
+    # Assert (1 assertion métier)
+    assert (paturage.total(TypeNourriture.CEREALES), paturage.total(TypeNourriture.PAILLE)) == (1.0, 5.0)
+
+
+def test_should_regrow_towards_capacity_when_repousser_called():
+    # Arrange
+    paturage = Paturage(2, 2, {TypeNourriture.HERBE: 2.0}, {TypeNourriture.HERBE: 0.5})
+    paturage.quantites[:] = 0.0
+
+    # Act
+    paturage.repousser()
+
+    # Assert (1 assertion métier)
+    assert np.all(paturage.quantites[INDEX_NOURRITURE[TypeNourriture.HERBE]] == 1.0)
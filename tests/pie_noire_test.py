@@ -1,11 +1,14 @@
 import pytest
 
+from src.vaches.domain.errors.codes import CodeErreur
 from src.vaches.domain.errors.exceptions import InvalidVacheException
 
 from src.vaches.domain.nourriture.TypeNourriture import TypeNourriture
 
 from src.vaches.domain.pie_noire import PieNoire
 
+from src.vaches.domain.strategies.production_lait import LaitProportionnel
+
 from src.vaches.domain.vache_a_lait import VacheALait
 
 from src.vaches.domain.vache import Vache
@@ -46,6 +49,14 @@ def test_should_return_copy_of_ration_given_ration_property(pie_ok: PieNoire):
     assert pie_ok.ration[TypeNourriture.HERBE] == 2.0
 
 
+def test_should_not_allocate_ration_given_new_pie_noire(pie_ok: PieNoire):
+    # Arrange / Act
+    ration_interne = pie_ok._ration
+
+    # Assert (1 assertion métier) : allouée au premier broutement typé seulement
+    assert ration_interne is None
+
+
 @pytest.mark.parametrize("val", [0, -1])
 def test_should_raise_invalid_vache_exception_given_non_positive_white_spots(val: int):
     # Arrange / Act / Assert
@@ -109,6 +120,33 @@ def test_should_accumulate_same_food_given_two_typed_brouter_calls(pie_ok: PieNo
     assert pie_ok.ration[TypeNourriture.HERBE] == 3.5
 
 
+def test_should_index_ration_view_by_type_position_given_typed_brouter(pie_ok: PieNoire):
+    # Arrange
+    pie_ok.brouter(2.0, TypeNourriture.FOIN)
+
+    # Act
+    vue = pie_ok.quantites_ration
+
+    # Assert (1 assertion métier)
+    assert vue[list(TypeNourriture).index(TypeNourriture.FOIN)] == 2.0
+
+
+def test_should_expose_read_only_ration_view(pie_ok: PieNoire):
+    # Arrange
+    pie_ok.brouter(2.0, TypeNourriture.FOIN)
+    vue = pie_ok.quantites_ration
+
+    # Act / Assert
+    with pytest.raises(TypeError):
+        vue[0] = 999.0
+
+
+def test_should_raise_invalid_vache_exception_given_unknown_food_type_when_brouter(pie_ok: PieNoire):
+    # Arrange / Act / Assert
+    with pytest.raises(InvalidVacheException):
+        pie_ok.brouter(2.0, "FOIN")
+
+
 # -------------------------
 # _calculer_lait : branche ration vide + ration non vide
 # -------------------------
@@ -179,3 +217,98 @@ def test_should_raise_invalid_vache_exception_given_panse_overflow_when_brouter(
     # Act / Assert
     with pytest.raises(InvalidVacheException):
         pie_ok.brouter(0.1)
+
+
+def test_should_use_declared_strategy_given_subclass_overriding_strategie_lait():
+    # Arrange
+    class PieNoireProportionnelle(PieNoire):
+        STRATEGIE_LAIT = LaitProportionnel
+
+    pie = PieNoireProportionnelle("Bella", 500.0, nb_taches_blanches=1, nb_taches_noires=1)
+    pie.brouter(4.0, TypeNourriture.CEREALES)
+
+    # Act
+    lait = pie.ruminer()
+
+    # Assert (1 assertion métier) : la ration typée est ignorée
+    assert lait == pytest.approx(4.0 * PieNoire.RENDEMENT_LAIT)
+
+
+# -------------------------
+# BROUTEMENT DIFFÉRÉ
+# -------------------------
+
+def _apports() -> list:
+    types = list(TypeNourriture)
+    return [(0.001 * (i % 7 + 1), types[i % len(types)] if i % 3 else None) for i in range(5000)]
+
+
+def test_should_match_successive_brouter_bit_for_bit_given_buffered_feeding():
+    # Arrange
+    directe = PieNoire("Bella", 500.0, nb_taches_blanches=1, nb_taches_noires=1)
+    differee = PieNoire("Bella", 500.0, nb_taches_blanches=1, nb_taches_noires=1)
+    for quantite, nourriture in _apports():
+        directe.brouter(quantite, nourriture)
+
+    # Act
+    for quantite, nourriture in _apports():
+        differee.brouter_differe(quantite, nourriture)
+    differee.appliquer_tampon()
+
+    # Assert (1 assertion métier)
+    assert (differee.panse, list(differee.quantites_ration)) == (directe.panse, list(directe.quantites_ration))
+
+
+def test_should_raise_at_call_given_buffered_feeding_over_panse_max(pie_ok: PieNoire):
+    # Arrange
+    pie_ok.brouter_differe(PieNoire.PANSE_MAX - 1.0, TypeNourriture.HERBE)
+
+    # Act / Assert
+    with pytest.raises(InvalidVacheException):
+        pie_ok.brouter_differe(2.0, TypeNourriture.HERBE)
+
+
+def test_should_apply_buffer_before_rumination_given_pending_feeding(pie_ok: PieNoire):
+    # Arrange
+    pie_ok.brouter_differe(2.0, TypeNourriture.CEREALES)
+
+    # Act
+    lait = pie_ok.ruminer()
+
+    # Assert (1 assertion métier)
+    assert lait == pytest.approx(2.0 * 2.0 * PieNoire.RENDEMENT_LAIT)
+
+
+def test_should_not_touch_panse_given_feeding_still_buffered(pie_ok: PieNoire):
+    # Act
+    pie_ok.brouter_differe(2.0, TypeNourriture.FOIN)
+
+    # Assert (1 assertion métier)
+    assert pie_ok.panse == 0.0
+
+
+def test_should_agree_with_ruminer_given_pending_buffered_feeding():
+    # Arrange
+    pie = PieNoire("Bella", 500.0, nb_taches_blanches=1, nb_taches_noires=1)
+    pie.brouter_differe(2.0, TypeNourriture.CEREALES)
+
+    # Act
+    code = pie.check_ruminer()
+
+    # Assert (1 assertion métier)
+    assert (code, pie.ruminer()) == (CodeErreur.OK, pytest.approx(4.4))
+
+
+def test_should_check_projected_state_without_applying_buffer():
+    # Arrange : 20 kg de céréales en tampon -> 44 L prévus, au-delà de PRODUCTION_LAIT_MAX
+    pie = PieNoire("Bella", 500.0, nb_taches_blanches=1, nb_taches_noires=1)
+    pie.brouter_differe(20.0, TypeNourriture.CEREALES)
+    notifications = []
+    pie.observer(type("Espion", (), {"apres_brouter": lambda self, v, q: notifications.append(q)})())
+
+    # Act
+    codes = (pie.check_brouter(31.0), pie.check_ruminer())
+
+    # Assert (1 assertion métier)
+    assert (codes, pie.panse, notifications) == (
+        (CodeErreur.PANSE_DEPASSEE, CodeErreur.PRODUCTION_LAIT_DEPASSEE), 0.0, [])
@@ -0,0 +1,118 @@
+import pytest
+
+from src.vaches.domain.errors.codes import CodeErreur
+from src.vaches.domain.nourriture.TypeNourriture import TypeNourriture
+from src.vaches.domain.pie_noire import PieNoire
+from src.vaches.domain.vache import Vache
+from src.vaches.alimentation.pipeline import analyser, executer, resoudre, valider
+from src.vaches.troupeau.registre import Registre
+
+
+def _vaches() -> dict:
+    pie = PieNoire("Bella", 500.0, nb_taches_blanches=1, nb_taches_noires=1)
+    vache = Vache(petit_nom="Marguerite", poids=450.0)
+    return {pie.id: pie, vache.id: vache}
+
+
+def test_should_feed_cows_given_stream_of_events():
+    # Arrange
+    vaches = _vaches()
+    pie, vache = vaches.values()
+    flux = [f"{pie.id},2.5,herbe", (pie.id, 1.0, TypeNourriture.CEREALES), f"{vache.id},4,"]
+
+    # Act
+    executer(flux, vaches, taille_lot=2)
+
+    # Assert (1 assertion métier)
+    assert (pie.ration, vache.panse) == ({TypeNourriture.HERBE: 2.5, TypeNourriture.CEREALES: 1.0}, 4.0)
+
+
+def test_should_feed_cows_given_registre_as_lookup():
+    # Arrange
+    registre = Registre(_vaches().values())
+    pie = next(v for v in registre if isinstance(v, PieNoire))
+    flux = [f"{pie.id},2.5,herbe", "999999999,1.0,"]
+
+    # Act
+    bilan = executer(flux, registre)
+
+    # Assert (1 assertion métier)
+    assert (pie.panse, bilan.appliques, registre.panse_totale) == (2.5, 1, 2.5)
+
+
+def test_should_route_rejects_with_reason_given_invalid_events():
+    # Arrange
+    vaches = _vaches()
+    pie, vache = vaches.values()
+    flux = [f"{pie.id},abc,herbe", "999999999,1,herbe", f"{vache.id},1,foin", f"{pie.id},1,caviar", f"{pie.id},-1"]
+    rejets = []
+
+    # Act
+    executer(flux, vaches, rejets.append)
+
+    # Assert (1 assertion métier)
+    assert [r.code for r in rejets] == [
+        CodeErreur.QUANTITE_NON_NUMERIQUE,
+        CodeErreur.VACHE_INCONNUE,
+        CodeErreur.NOURRITURE_INTERDITE,
+        CodeErreur.NOURRITURE_INTERDITE,
+        CodeErreur.QUANTITE_NON_POSITIVE,
+    ]
+
+
+def test_should_check_panse_max_against_earlier_events_of_same_batch():
+    # Arrange
+    vaches = _vaches()
+    pie, _ = vaches.values()
+    moitie = PieNoire.PANSE_MAX / 2
+    flux = [(pie.id, moitie), (pie.id, moitie), (pie.id, 1.0)]
+    rejets = []
+
+    # Act
+    executer(flux, vaches, rejets.append)
+
+    # Assert (1 assertion métier)
+    assert [(r.ligne, r.code) for r in rejets] == [(3, CodeErreur.PANSE_DEPASSEE)]
+
+
+def test_should_count_every_event_given_bilan():
+    # Arrange
+    vaches = _vaches()
+    pie, _ = vaches.values()
+    flux = (f"{pie.id},0.001,foin" for _ in range(10_000))
+
+    # Act
+    bilan = executer(flux, vaches, taille_lot=256)
+
+    # Assert (1 assertion métier)
+    assert (bilan.appliques, bilan.rejetes) == (10_000, 0)
+
+
+def test_should_read_source_lazily_given_batches():
+    # Arrange
+    lus = []
+
+    def source():
+        for i in range(10):
+            lus.append(i)
+            yield f"1,{i}"
+
+    # Act
+    next(analyser(source(), taille_lot=3))
+
+    # Assert (1 assertion métier)
+    assert lus == [0, 1, 2]
+
+
+def test_should_validate_against_buffered_feeding_without_applying_it():
+    # Arrange
+    vaches = _vaches()
+    pie = next(v for v in vaches.values() if isinstance(v, PieNoire))
+    pie.brouter_differe(45.0, TypeNourriture.FOIN)
+    flux = [f"{pie.id},3,foin", f"{pie.id},3,foin"]
+
+    # Act
+    lot = next(valider(resoudre(analyser(flux), vaches)))
+
+    # Assert (1 assertion métier)
+    assert ([r.code for r in lot.rejets], pie.panse) == ([CodeErreur.PANSE_DEPASSEE], 0.0)
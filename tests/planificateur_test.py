@@ -0,0 +1,89 @@
+import pytest
+
+from src.vaches.domain.vache import Vache
+from src.vaches.domain.vache_a_lait import VacheALait
+from src.vaches.troupeau.planificateur import PlanificateurTraite
+
+
+def _laitieres(n: int) -> list[VacheALait]:
+    return [VacheALait(petitNom=f"Lola{i}", poids=500.0) for i in range(n)]
+
+
+def test_should_return_cows_closest_to_max_first_given_top_k():
+    # Arrange
+    vaches = _laitieres(4)
+    planificateur = PlanificateurTraite(vaches)
+    for vache, panse in zip(vaches, (5.0, 30.0, 10.0, 20.0)):
+        vache.brouter(panse)
+        vache.ruminer()
+
+    # Act
+    prochaines = planificateur.prochaines(2)
+
+    # Assert (1 assertion métier)
+    assert prochaines == [vaches[1], vaches[3]]
+
+
+def test_should_demote_cow_given_traire():
+    # Arrange
+    vaches = _laitieres(2)
+    planificateur = PlanificateurTraite(vaches)
+    vaches[0].brouter(30.0)
+    vaches[0].ruminer()
+    vaches[1].brouter(10.0)
+    vaches[1].ruminer()
+
+    # Act
+    vaches[0].traire(30.0)
+
+    # Assert (1 assertion métier)
+    assert planificateur.prochaines(1) == [vaches[1]]
+
+
+def test_should_skip_removed_cow_given_top_k():
+    # Arrange
+    vaches = _laitieres(3)
+    planificateur = PlanificateurTraite(vaches)
+    vaches[2].brouter(10.0)
+    vaches[2].ruminer()
+
+    # Act
+    planificateur.retirer(vaches[2])
+
+    # Assert (1 assertion métier)
+    assert vaches[2] not in planificateur.prochaines(3)
+
+
+def test_should_bound_heap_size_given_many_refreshes():
+    # Arrange
+    vaches = _laitieres(10)
+    planificateur = PlanificateurTraite(vaches)
+
+    # Act
+    for _ in range(100):
+        for vache in vaches:
+            vache.brouter(1.0)
+            vache.ruminer()
+            vache.traire(vache.lait_disponible)
+
+    # Assert (1 assertion métier)
+    assert len(planificateur._tas) <= 2 * len(vaches) + 64
+
+
+def test_should_raise_type_error_given_non_milking_cow():
+    # Act / Assert
+    with pytest.raises(TypeError):
+        PlanificateurTraite([Vache(petit_nom="Marguerite", poids=450.0)])
+
+
+def test_should_not_return_cow_twice_given_removed_then_added_again():
+    # Arrange
+    a, b = _laitieres(2)
+    planificateur = PlanificateurTraite([a, b])
+    planificateur.retirer(a)
+
+    # Act
+    planificateur.ajouter(a)
+
+    # Assert (1 assertion métier)
+    assert [v.id for v in planificateur.prochaines(3)] == sorted([a.id, b.id])
@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+
+from point_plan.point_3d import Point3D
+from point_plan.point_cloud import PointCloud
+from point_plan.point_plan import PointPlan
+
+
+def test_should_keep_coordinates_given_points():
+    # Arrange
+    points = [PointPlan(1, 2), PointPlan(3, 4)]
+
+    # Act
+    nuage = PointCloud.depuis_points(points)
+
+    # Assert (1 assertion métier)
+    assert [(p.abscisse, p.ordonnee) for p in (nuage[0], nuage[1])] == [(1.0, 2.0), (3.0, 4.0)]
+
+
+def test_should_move_every_point_when_translater_called():
+    # Arrange
+    nuage = PointCloud([0.0, 1.0], [0.0, 1.0], [0.0, 1.0])
+
+    # Act
+    nuage.translater(1.0, -1.0, np.array([2.0, 3.0]))
+
+    # Assert (1 assertion métier)
+    assert nuage.coordonnees().tolist() == [[1.0, -1.0, 2.0], [2.0, 0.0, 4.0]]
+
+
+def test_should_return_euclidean_distances_when_distances_called():
+    # Arrange
+    nuage = PointCloud([3.0, 0.0], [4.0, 0.0])
+
+    # Act
+    distances = nuage.distances(PointPlan(0.0, 0.0))
+
+    # Assert (1 assertion métier)
+    assert distances.tolist() == [5.0, 0.0]
+
+
+def test_should_bound_all_points_when_boite_englobante_called():
+    # Arrange
+    nuage = PointCloud.depuis_points([Point3D(1, 5, -2), Point3D(4, 0, 3), Point3D(-1, 2, 0)])
+
+    # Act
+    minimum, maximum = nuage.boite_englobante()
+
+    # Assert (1 assertion métier)
+    assert ((minimum.abscisse, minimum.ordonnee, minimum.azimut), (maximum.abscisse, maximum.ordonnee, maximum.azimut)) \
+        == ((-1.0, 0.0, -2.0), (4.0, 5.0, 3.0))
+
+
+def test_should_select_points_inside_box_when_dans_boite_called():
+    # Arrange
+    nuage = PointCloud([0.0, 5.0, 10.0], [0.0, 5.0, 10.0])
+
+    # Act
+    masque = nuage.dans_boite(PointPlan(1.0, 1.0), PointPlan(5.0, 5.0))
+
+    # Assert (1 assertion métier)
+    assert masque.tolist() == [False, True, False]
+
+
+def test_should_raise_when_columns_have_different_lengths():
+    # Arrange / Act / Assert (1 assertion métier)
+    with pytest.raises(ValueError):
+        PointCloud([0.0, 1.0], [0.0])
@@ -0,0 +1,83 @@
+import pytest
+
+from src.vaches.domain.errors.exceptions import InvalidVacheException
+from src.vaches.domain.nourriture.TypeNourriture import TypeNourriture
+from src.vaches.domain.pie_noire import PieNoire
+from src.vaches.domain.vache import Vache
+from src.vaches.domain.vache_a_lait import VacheALait
+from src.vaches.infrastructure.profilage import Profileur
+
+
+def test_should_restore_original_methods_given_disabled_profiler():
+    # Arrange
+    originale = Vache.__dict__["ruminer"]
+
+    # Act
+    with Profileur():
+        pass
+
+    # Assert (1 assertion métier)
+    assert Vache.__dict__["ruminer"] is originale
+
+
+def test_should_count_failures_per_rule_given_empty_panse():
+    # Arrange
+    vache = VacheALait(petitNom="Lola", poids=500.0)
+
+    # Act
+    with Profileur() as profileur:
+        with pytest.raises(InvalidVacheException):
+            vache.ruminer()
+
+    # Assert (1 assertion métier)
+    assert profileur.instantane()["echecs"] == {"VacheALait.ruminer": {"PANSE_VIDE": 1}}
+
+
+def test_should_split_milk_per_food_type_given_typed_ration():
+    # Arrange
+    pie = PieNoire("Bella", 500.0, nb_taches_blanches=1, nb_taches_noires=1)
+
+    # Act
+    with Profileur() as profileur:
+        pie.brouter(2.0, TypeNourriture.HERBE)
+        pie.brouter(1.0, TypeNourriture.CEREALES)
+        pie.ruminer()
+
+    # Assert (1 assertion métier) : HERBE 2 × 1,0 × 1,1 ; CEREALES 1 × 2,0 × 1,1
+    assert profileur.lait_par_nourriture == pytest.approx({"HERBE": 2.2, "CEREALES": 2.2})
+
+
+def test_should_book_buffered_typed_milk_per_food_type_given_brouter_differe():
+    # Arrange
+    pie = PieNoire("Bella", 500.0, nb_taches_blanches=1, nb_taches_noires=1)
+
+    # Act
+    with Profileur() as profileur:
+        pie.brouter_differe(2.0, TypeNourriture.CEREALES)
+        pie.ruminer()
+
+    # Assert (1 assertion métier) : CEREALES 2 × 2,0 × 1,1
+    assert profileur.lait_par_nourriture == pytest.approx({"CEREALES": 4.4})
+
+
+def test_should_export_call_counter_given_prometheus_format():
+    # Arrange
+    vache = VacheALait(petitNom="Lola", poids=500.0)
+    vache.brouter(5.0)
+
+    # Act
+    with Profileur() as profileur:
+        vache.ruminer()
+        vache.traire(1.0)
+
+    # Assert (1 assertion métier)
+    assert 'vaches_appels_total{methode="VacheALait.traire"} 1' in profileur.prometheus()
+
+
+def test_should_refuse_second_profiler_given_one_already_active():
+    # Arrange
+    with Profileur():
+
+        # Act / Assert
+        with pytest.raises(RuntimeError):
+            Profileur().activer()
@@ -0,0 +1,97 @@
+import dataclasses
+
+import pytest
+
+from src.vaches.domain.errors.codes import CodeErreur
+from src.vaches.domain.errors.exceptions import InvalidVacheException
+from src.vaches.domain.nourriture.TypeNourriture import INDEX_NOURRITURE, TypeNourriture
+from src.vaches.domain.pie_noire import PieNoire
+from src.vaches.domain.races import fiche, races
+from src.vaches.domain.vache import Vache
+from src.vaches.domain.vache_a_lait import VacheALait
+
+
+def test_should_reject_breed_at_class_definition_given_age_naissance_above_age_max():
+    # Arrange / Act
+    with pytest.raises(InvalidVacheException) as erreur:
+        class VacheImmortelle(Vache):
+            AGE_NAISSANCE = 30
+
+    # Assert (1 assertion métier)
+    assert erreur.value.code == CodeErreur.AGE_NAISSANCE_INVALIDE
+
+
+def test_should_reject_breed_given_negative_nutrition_coefficient():
+    # Arrange / Act
+    with pytest.raises(InvalidVacheException) as erreur:
+        class PieNoireCarencee(PieNoire):
+            COEFFICIENT_NUTRITIONNEL = {TypeNourriture.HERBE: -1.0}
+
+    # Assert (1 assertion métier)
+    assert erreur.value.code == CodeErreur.CONSTANTE_RACE_INVALIDE
+
+
+def test_should_freeze_coefficients_in_type_order_given_new_breed():
+    # Arrange
+    class PieNoireCerealiere(PieNoire):
+        COEFFICIENT_NUTRITIONNEL = {TypeNourriture.CEREALES: 3.0}
+
+    # Act
+    coefficients = PieNoireCerealiere._COEFFICIENTS
+
+    # Assert (1 assertion métier)
+    assert coefficients == tuple(3.0 if t is TypeNourriture.CEREALES else 0.0 for t in INDEX_NOURRITURE)
+
+
+def test_should_not_allow_mutating_fiche_given_registered_breed():
+    # Arrange
+    fiche_race = fiche(VacheALait)
+
+    # Act / Assert (1 assertion métier)
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        fiche_race.production_lait_max = 1e9
+
+
+def test_should_list_base_breeds_given_registry():
+    # Arrange / Act
+    inscrites = races()
+
+    # Assert (1 assertion métier)
+    assert {"src.vaches.domain.vache.Vache", "src.vaches.domain.vache_a_lait.VacheALait",
+            "src.vaches.domain.pie_noire.PieNoire"} <= inscrites.keys()
+
+
+def test_should_name_breed_given_age_naissance_above_age_max():
+    # Arrange / Act
+    with pytest.raises(InvalidVacheException) as erreur:
+        class VacheCentenaire(Vache):
+            AGE_NAISSANCE = 100
+
+    # Assert (1 assertion métier)
+    assert str(erreur.value).startswith("VacheCentenaire : ")
+
+
+def test_should_reject_breed_given_non_numeric_nutrition_coefficient():
+    # Arrange / Act
+    with pytest.raises(InvalidVacheException) as erreur:
+        class PieNoireBavarde(PieNoire):
+            COEFFICIENT_NUTRITIONNEL = {TypeNourriture.HERBE: "beaucoup"}
+
+    # Assert (1 assertion métier)
+    assert erreur.value.code == CodeErreur.CONSTANTE_RACE_INVALIDE
+
+
+def test_should_not_allow_rebinding_constant_given_registered_breed():
+    # Arrange
+    class PieNoireFigee(PieNoire):
+        pass
+
+    # Act / Assert (1 assertion métier)
+    with pytest.raises(AttributeError):
+        PieNoireFigee.PANSE_MAX = 1e9
+
+
+def test_should_not_allow_mutating_nutrition_coefficients_given_registered_breed():
+    # Arrange / Act / Assert (1 assertion métier)
+    with pytest.raises(TypeError):
+        PieNoire.COEFFICIENT_NUTRITIONNEL[TypeNourriture.HERBE] = 9.0
@@ -0,0 +1,107 @@
+import pytest
+
+from src.vaches.domain.errors.exceptions import InvalidVacheException
+from src.vaches.domain.vache import Vache
+from src.vaches.domain.vache_a_lait import VacheALait
+from src.vaches.troupeau.registre import Registre
+
+
+def _laitieres(*litres: float) -> list[VacheALait]:
+    vaches = []
+    for i, l in enumerate(litres):
+        vache = VacheALait(petitNom=f"Lola{i}", poids=500.0)
+        vache.lait_disponible = l
+        vaches.append(vache)
+    return vaches
+
+
+def test_should_find_cows_by_name_given_homonyms():
+    # Arrange
+    registre = Registre([VacheALait(petitNom="Lola", poids=500.0), Vache(petit_nom="Lola", poids=400.0),
+                         Vache(petit_nom="Rosie", poids=450.0)])
+
+    # Act
+    trouvees = registre.par_nom("Lola")
+
+    # Assert (1 assertion métier)
+    assert len(trouvees) == 2
+
+
+def test_should_find_cow_by_id_given_registered_cow():
+    # Arrange
+    vache = Vache(petit_nom="Marguerite", poids=450.0)
+    registre = Registre([vache])
+
+    # Act / Assert (1 assertion métier)
+    assert registre.par_id(vache.id) is vache
+
+
+def test_should_move_cow_to_next_age_bucket_given_vieillir():
+    # Arrange
+    vieille = Vache(petit_nom="Marguerite", poids=450.0)
+    registre = Registre([vieille, Vache(petit_nom="Rosie", poids=450.0)])
+    for _ in range(20):
+        vieille.vieillir()
+
+    # Act
+    proches_age_max = registre.par_age(20)
+
+    # Assert (1 assertion métier)
+    assert proches_age_max == [vieille]
+
+
+def test_should_return_cows_over_threshold_given_milk_range_query():
+    # Arrange
+    vaches = _laitieres(10.0, 35.0, 30.0, 31.0)
+    registre = Registre(vaches)
+
+    # Act
+    trouvees = registre.par_lait(minimum=30.0, inclus=False)
+
+    # Assert (1 assertion métier)
+    assert trouvees == [vaches[3], vaches[1]]
+
+
+def test_should_reorder_milk_index_given_ruminer_and_traire():
+    # Arrange
+    vaches = _laitieres(0.0, 0.0)
+    registre = Registre(vaches)
+    vaches[0].brouter(20.0)
+    vaches[0].ruminer()  # 22 L
+
+    # Act
+    vaches[0].traire(20.0)  # reste 2 L
+    vaches[1].brouter(10.0)
+    vaches[1].ruminer()  # 11 L
+
+    # Assert (1 assertion métier)
+    assert registre.par_lait(minimum=5.0) == [vaches[1]]
+
+
+def test_should_keep_milk_index_given_failed_traire():
+    # Arrange
+    vaches = _laitieres(5.0)
+    registre = Registre(vaches)
+
+    # Act
+    with pytest.raises(InvalidVacheException):
+        vaches[0].traire(6.0)
+
+    # Assert (1 assertion métier)
+    assert registre.par_lait(5.0, 5.0) == vaches
+
+
+@pytest.mark.parametrize("minimum, maximum, inclus", [(1.0, 3.0, True), (1.0, 3.0, False), (0.5, 2.5, True),
+                                                      (-1.0, 0.0, True), (2.0, 2.0, True)])
+def test_should_match_linear_scan_given_bounds_on_bucket_edges(minimum, maximum, inclus):
+    # Arrange
+    vaches = _laitieres(0.0, 0.5, 1.0, 1.999, 2.0, 2.5, 3.0, 3.0, 7.25)
+    registre = Registre(vaches)
+    dedans = (lambda l: minimum <= l <= maximum) if inclus else (lambda l: minimum < l < maximum)
+    attendues = sorted((v for v in vaches if dedans(v.lait_disponible)), key=lambda v: (v.lait_disponible, v.id))
+
+    # Act
+    trouvees = registre.par_lait(minimum, maximum, inclus)
+
+    # Assert (1 assertion métier)
+    assert trouvees == attendues
@@ -0,0 +1,88 @@
+import asyncio
+
+import pytest
+
+from src.vaches.domain.errors.codes import CodeErreur
+from src.vaches.domain.vache import Vache
+from src.vaches.domain.vache_a_lait import VacheALait
+from src.vaches.simulation.salle_de_traite import SalleDeTraite, Tank
+
+
+def _vaches_pleines(n: int) -> list[VacheALait]:
+    vaches = []
+    for i in range(n):
+        vache = VacheALait(petitNom=f"Lola{i}", poids=500.0)
+        vache.brouter(10.0)
+        vache.ruminer()  # 11 L disponibles
+        vaches.append(vache)
+    return vaches
+
+
+def test_should_milk_every_cow_given_enough_budget():
+    # Arrange
+    vaches = _vaches_pleines(20)
+    salle = SalleDeTraite(nb_postes=4, tank=Tank(capacite=1000.0), debit=1.0, budget=60.0)
+
+    # Act
+    rapport = asyncio.run(salle.traire(vaches))
+
+    # Assert (1 assertion métier)
+    assert rapport.litres == pytest.approx(20 * 11.0)
+
+
+def test_should_cap_each_session_given_station_budget():
+    # Arrange
+    vaches = _vaches_pleines(3)
+    salle = SalleDeTraite(nb_postes=2, tank=Tank(capacite=1000.0), debit=0.5, budget=10.0)
+
+    # Act
+    asyncio.run(salle.traire(vaches))
+
+    # Assert (1 assertion métier) : 10 s à 0,5 L/s = 5 L par session
+    assert [v.lait_total_traite for v in vaches] == [5.0, 5.0, 5.0]
+
+
+def test_should_wait_for_collection_given_full_tank():
+    # Arrange
+    vaches = _vaches_pleines(10)
+    tank = Tank(capacite=25.0)
+    salle = SalleDeTraite(nb_postes=5, tank=tank, debit=1.0, budget=60.0)
+
+    # Act
+    rapport = asyncio.run(salle.traire(vaches))
+
+    # Assert (1 assertion métier)
+    assert rapport.attentes_tank > 0
+
+
+def test_should_count_refusal_given_cow_without_milk():
+    # Arrange
+    vaches = [VacheALait(petitNom="Lola", poids=500.0)]
+    salle = SalleDeTraite(nb_postes=1, tank=Tank(capacite=100.0))
+
+    # Act
+    rapport = asyncio.run(salle.traire(vaches))
+
+    # Assert (1 assertion métier)
+    assert rapport.refus == {CodeErreur.LITRES_NON_POSITIFS: 1}
+
+
+def test_should_handle_thousands_of_stations_given_single_event_loop():
+    # Arrange
+    vaches = _vaches_pleines(3000)
+    salle = SalleDeTraite(nb_postes=3000, tank=Tank(capacite=50_000.0), debit=1.0, budget=60.0)
+
+    # Act
+    rapport = asyncio.run(salle.traire(vaches))
+
+    # Assert (1 assertion métier)
+    assert rapport.vaches_traites == 3000
+
+
+def test_should_raise_type_error_given_non_milking_cow():
+    # Arrange
+    salle = SalleDeTraite(nb_postes=1, tank=Tank(capacite=100.0))
+
+    # Act / Assert
+    with pytest.raises(TypeError):
+        asyncio.run(salle.traire([Vache(petit_nom="Marguerite", poids=450.0)]))
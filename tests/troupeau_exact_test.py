@@ -0,0 +1,83 @@
+import numpy as np
+import pytest
+
+from src.vaches.domain.nourriture.TypeNourriture import TypeNourriture
+from src.vaches.domain.pie_noire import PieNoire
+from src.vaches.domain.vache_a_lait import VacheALait
+from src.vaches.infrastructure.instantane import restaurer, sauvegarder
+from src.vaches.troupeau.troupeau_exact import TroupeauExact
+
+
+def _troupeau(race: type = VacheALait, nombre: int = 1) -> TroupeauExact:
+    troupeau = TroupeauExact(race=race)
+    for i in range(nombre):
+        troupeau.ajouter(f"Lola{i}", 500.0)
+    return troupeau
+
+
+def test_should_store_grams_and_millilitres_as_int64():
+    # Arrange
+    troupeau = _troupeau()
+
+    # Act
+    troupeau.brouter_all(10.0)
+    troupeau.ruminer_all()
+
+    # Assert (1 assertion métier)
+    assert (troupeau.poids.dtype, troupeau.poids[0], troupeau.lait_disponible[0]) == (np.int64, 502_500, 11_000)
+
+
+def test_should_reach_panse_max_exactly_given_many_small_grazings():
+    # Arrange
+    troupeau = _troupeau()
+
+    # Act
+    refus = [bool(troupeau.brouter_all(0.1)[0]) for _ in range(int(VacheALait.PANSE_MAX / 0.1))]
+
+    # Assert (1 assertion métier)
+    assert (any(refus), troupeau.total_exact("panse")) == (False, 50_000)
+
+
+def test_should_keep_exact_totals_given_season_of_milking():
+    # Arrange
+    troupeau = _troupeau(nombre=10)
+    jours = 1000
+
+    # Act
+    for _ in range(jours):
+        troupeau.brouter_all(1.0)
+        troupeau.ruminer_all()
+        troupeau.traire_all(1.1)
+
+    # Assert (1 assertion métier)
+    assert (troupeau.total_exact("lait_total_produit"), troupeau.total_exact("lait_total_traite")) \
+        == (10 * jours * 1100, 10 * jours * 1100)
+
+
+def test_should_produce_same_milk_as_pie_noire_given_typed_ration():
+    # Arrange
+    pie = PieNoire("Bella", 500.0, nb_taches_blanches=1, nb_taches_noires=1)
+    pie.brouter(3.0, TypeNourriture.CEREALES)
+    pie.brouter(2.0, TypeNourriture.PAILLE)
+    troupeau = TroupeauExact.depuis_vaches([pie])
+
+    # Act
+    troupeau.ruminer_all()
+    lait = pie.ruminer()
+
+    # Assert (1 assertion métier)
+    assert troupeau.total("lait_disponible") == pytest.approx(lait, abs=1e-3)
+
+
+def test_should_restore_exact_troupeau_given_snapshot(tmp_path):
+    # Arrange
+    troupeau = _troupeau(race=PieNoire, nombre=2)
+    troupeau.brouter_all(1.234, nourritures=TypeNourriture.FOIN)
+    chemin = str(tmp_path / "troupeau.snap")
+    sauvegarder(chemin, troupeau, [1, 2], [3, 4])
+
+    # Act
+    restaure = restaurer(chemin).troupeau
+
+    # Assert (1 assertion métier)
+    assert (type(restaure), restaure.ration.tolist()) == (TroupeauExact, troupeau.ration.tolist())
@@ -0,0 +1,290 @@
+import numpy as np
+import pytest
+
+from src.vaches.domain.errors.codes import CodeErreur
+from src.vaches.domain.errors.exceptions import InvalidVacheException
+from src.vaches.domain.nourriture.TypeNourriture import TypeNourriture
+from src.vaches.domain.pie_noire import PieNoire
+from src.vaches.domain.vache import Vache
+from src.vaches.domain.vache_a_lait import VacheALait
+from src.vaches.troupeau.troupeau import Troupeau
+
+
+@pytest.fixture
+def troupeau_ok() -> Troupeau:
+    # 3 vaches à lait neuves
+    troupeau = Troupeau(race=VacheALait)
+    for nom in ("Lola", "Bella", "Rosie"):
+        troupeau.ajouter(nom, 500.0)
+    return troupeau
+
+
+# -------------------------
+# CONSTRUCTION
+# -------------------------
+
+def test_should_copy_state_given_depuis_vaches():
+    # Arrange
+    vache = VacheALait(petitNom="Lola", poids=500.0)
+    vache.brouter(10.0)
+    vache.ruminer()
+
+    # Act
+    troupeau = Troupeau.depuis_vaches([vache])
+
+    # Assert (1 assertion métier)
+    assert troupeau.lait_disponible[0] == vache.lait_disponible
+
+
+@pytest.mark.parametrize("petit_nom, poids", [("  ", 500.0), ("Lola", -1.0)])
+def test_should_raise_invalid_vache_exception_given_invalid_row_when_ajouter(troupeau_ok: Troupeau, petit_nom, poids):
+    # Arrange / Act / Assert
+    with pytest.raises(InvalidVacheException):
+        troupeau_ok.ajouter(petit_nom, poids)
+
+
+def test_should_keep_rows_given_growth_beyond_capacity():
+    # Arrange
+    troupeau = Troupeau(race=Vache, capacite=1)
+
+    # Act
+    for i in range(5):
+        troupeau.ajouter(f"V{i}", float(i))
+
+    # Assert (1 assertion métier)
+    assert troupeau.poids.tolist() == [0.0, 1.0, 2.0, 3.0, 4.0]
+
+
+# -------------------------
+# BROUTER
+# -------------------------
+
+def test_should_flag_only_overflowing_cow_given_brouter_all(troupeau_ok: Troupeau):
+    # Arrange
+    quantites = np.array([10.0, VacheALait.PANSE_MAX + 1.0, 0.0])
+
+    # Act
+    refus = troupeau_ok.brouter_all(quantites)
+
+    # Assert (1 assertion métier)
+    assert refus.tolist() == [False, True, True]
+
+
+def test_should_not_change_rejected_cow_given_brouter_all(troupeau_ok: Troupeau):
+    # Arrange
+    quantites = np.array([10.0, VacheALait.PANSE_MAX + 1.0, 5.0])
+
+    # Act
+    troupeau_ok.brouter_all(quantites)
+
+    # Assert (1 assertion métier)
+    assert troupeau_ok.panse.tolist() == [10.0, 0.0, 5.0]
+
+
+def test_should_return_reason_codes_given_check_brouter_all(troupeau_ok: Troupeau):
+    # Arrange
+    quantites = np.array([10.0, VacheALait.PANSE_MAX + 1.0, 0.0])
+
+    # Act
+    codes = troupeau_ok.check_brouter_all(quantites)
+
+    # Assert (1 assertion métier)
+    assert codes.tolist() == [CodeErreur.OK, CodeErreur.PANSE_DEPASSEE, CodeErreur.QUANTITE_NON_POSITIVE]
+
+
+def test_should_reject_typed_food_given_vache_a_lait_herd(troupeau_ok: Troupeau):
+    # Arrange / Act
+    refus = troupeau_ok.brouter_all(2.0, nourritures=TypeNourriture.FOIN)
+
+    # Assert (1 assertion métier)
+    assert refus.all()
+
+
+def test_should_only_touch_selected_cows_given_selection(troupeau_ok: Troupeau):
+    # Arrange / Act
+    troupeau_ok.brouter_all(4.0, selection=np.array([True, False, True]))
+
+    # Assert (1 assertion métier)
+    assert troupeau_ok.panse.tolist() == [4.0, 0.0, 4.0]
+
+
+# -------------------------
+# RUMINER : mêmes résultats que les classes
+# -------------------------
+
+def test_should_match_vache_a_lait_given_ruminer_all():
+    # Arrange
+    vache = VacheALait(petitNom="Lola", poids=500.0)
+    troupeau = Troupeau.depuis_vaches([vache])
+    vache.brouter(10.0)
+    vache.ruminer()
+
+    # Act
+    troupeau.brouter_all(10.0)
+    troupeau.ruminer_all()
+
+    # Assert (1 assertion métier)
+    assert (troupeau.poids[0], troupeau.lait_disponible[0]) == (vache.poids, vache.lait_disponible)
+
+
+def test_should_match_pie_noire_given_typed_ration_when_ruminer_all():
+    # Arrange
+    pie = PieNoire("Bella", 520.0, nb_taches_blanches=12, nb_taches_noires=18)
+    troupeau = Troupeau.depuis_vaches([pie])
+    pie.brouter(2.0, TypeNourriture.HERBE)
+    pie.brouter(1.0, TypeNourriture.CEREALES)
+    pie.ruminer()
+
+    # Act
+    index = list(TypeNourriture)
+    troupeau.brouter_all(2.0, nourritures=np.array([index.index(TypeNourriture.HERBE)]))
+    troupeau.brouter_all(1.0, nourritures=TypeNourriture.CEREALES)
+    troupeau.ruminer_all()
+
+    # Assert (1 assertion métier)
+    assert troupeau.lait_disponible[0] == pytest.approx(pie.lait_disponible)
+
+
+def test_should_clear_ration_given_ruminer_all():
+    # Arrange
+    troupeau = Troupeau(race=PieNoire)
+    troupeau.ajouter("Bella", 520.0)
+    troupeau.brouter_all(2.0, nourritures=TypeNourriture.MARGUERITE)
+
+    # Act
+    troupeau.ruminer_all()
+
+    # Assert (1 assertion métier)
+    assert not troupeau.ration.any()
+
+
+def test_should_flag_empty_panse_and_production_max_given_ruminer_all(troupeau_ok: Troupeau):
+    # Arrange
+    troupeau_ok.lait_disponible[1] = VacheALait.PRODUCTION_LAIT_MAX
+    troupeau_ok.brouter_all(1.0, selection=np.array([True, True, False]))
+
+    # Act
+    refus = troupeau_ok.ruminer_all()
+
+    # Assert (1 assertion métier)
+    assert refus.tolist() == [False, True, True]
+
+
+# -------------------------
+# TRAIRE
+# -------------------------
+
+def test_should_flag_litres_above_lait_disponible_given_traire_all(troupeau_ok: Troupeau):
+    # Arrange
+    troupeau_ok.brouter_all(10.0)
+    troupeau_ok.ruminer_all()
+
+    # Act
+    refus = troupeau_ok.traire_all(np.array([3.0, 100.0, -1.0]))
+
+    # Assert (1 assertion métier)
+    assert refus.tolist() == [False, True, True]
+
+
+def test_should_accumulate_lait_total_traite_given_traire_all(troupeau_ok: Troupeau):
+    # Arrange
+    troupeau_ok.brouter_all(10.0)
+    troupeau_ok.ruminer_all()
+
+    # Act
+    troupeau_ok.traire_all(2.0)
+    troupeau_ok.traire_all(3.0)
+
+    # Assert (1 assertion métier)
+    assert troupeau_ok.lait_total_traite.tolist() == [5.0, 5.0, 5.0]
+
+
+def test_should_raise_type_error_given_traire_all_on_vache_herd():
+    # Arrange
+    troupeau = Troupeau(race=Vache)
+    troupeau.ajouter("Marguerite", 450.0)
+
+    # Act / Assert
+    with pytest.raises(TypeError):
+        troupeau.traire_all(1.0)
+
+
+def test_should_raise_type_error_given_race_not_a_vache():
+    # Arrange / Act / Assert
+    with pytest.raises(TypeError):
+        Troupeau(race=int)
+
+
+def test_should_raise_type_error_given_cow_of_another_breed_when_depuis_vaches():
+    # Arrange
+    vaches = [VacheALait("Lola", 500.0), Vache("Marguerite", 450.0)]
+
+    # Act / Assert
+    with pytest.raises(TypeError):
+        Troupeau.depuis_vaches(vaches)
+
+
+def test_should_raise_value_error_given_archive_of_another_breed_when_vieillir_all(troupeau_ok: Troupeau):
+    # Arrange
+    archive = Troupeau(race=Vache)
+
+    # Act / Assert
+    with pytest.raises(ValueError):
+        troupeau_ok.vieillir_all(archive)
+
+
+def test_should_retire_cows_reaching_age_max_given_vieillir_all():
+    # Arrange
+    troupeau = Troupeau(race=VacheALait)
+    for nom in ("Jeune", "Presque", "Vieille"):
+        troupeau.ajouter(nom, 500.0)
+    troupeau.age[:] = [0, VacheALait.AGE_MAX - 1, VacheALait.AGE_MAX]
+
+    # Act
+    archive = troupeau.vieillir_all()
+
+    # Assert (1 assertion métier)
+    assert (troupeau.petits_noms, archive.petits_noms) == (["Jeune"], ["Presque", "Vieille"])
+
+
+def test_should_compact_columns_given_retirement():
+    # Arrange
+    troupeau = Troupeau(race=VacheALait)
+    for i in range(4):
+        troupeau.ajouter(f"Lola{i}", 500.0 + i)
+    troupeau.age[:] = [VacheALait.AGE_MAX, 3, VacheALait.AGE_MAX, 5]
+
+    # Act
+    troupeau.vieillir_all()
+
+    # Assert (1 assertion métier)
+    assert (troupeau.poids.tolist(), troupeau.age.tolist()) == ([501.0, 503.0], [4, 6])
+
+
+def test_should_append_to_existing_archive_given_successive_years():
+    # Arrange
+    troupeau = Troupeau(race=VacheALait)
+    for i in range(3):
+        troupeau.ajouter(f"Lola{i}", 500.0)
+    troupeau.age[:] = [VacheALait.AGE_MAX - 2, VacheALait.AGE_MAX - 1, 0]
+    archive = troupeau.vieillir_all()
+
+    # Act
+    troupeau.vieillir_all(archive)
+
+    # Assert (1 assertion métier)
+    assert archive.petits_noms == ["Lola1", "Lola0"]
+
+
+def test_should_report_age_max_given_check_vieillir_all():
+    # Arrange
+    troupeau = Troupeau(race=VacheALait)
+    troupeau.ajouter("Lola", 500.0)
+    troupeau.ajouter("Rosie", 500.0)
+    troupeau.age[:] = [VacheALait.AGE_MAX, 1]
+
+    # Act
+    codes = troupeau.check_vieillir_all()
+
+    # Assert (1 assertion métier)
+    assert codes.tolist() == [CodeErreur.AGE_MAX_ATTEINT, CodeErreur.OK]
@@ -1,6 +1,9 @@
 import pytest
 
+from src.vaches.domain.errors.codes import CodeErreur
 from src.vaches.domain.errors.exceptions import InvalidVacheException
+from src.vaches.domain.pie_noire import PieNoire
+from src.vaches.domain.strategies.production_lait import StrategieLait
 from src.vaches.domain.vache_a_lait import VacheALait
 
 
@@ -249,6 +252,47 @@ def test_should_raise_invalid_vache_exception_given_production_max_reached_when_
     with pytest.raises(InvalidVacheException):
         vache.ruminer()
 
+def test_should_return_production_depassee_given_check_ruminer_over_production_max():
+    # Arrange
+    vache = VacheALait(petitNom="Lola", poids=500.0)
+    _produire_lait_jusqua(vache, VacheALait.PRODUCTION_LAIT_MAX)
+    vache.brouter(0.1)
+
+    # Act
+    code = vache.check_ruminer()
+
+    # Assert (1 assertion métier)
+    assert code == CodeErreur.PRODUCTION_LAIT_DEPASSEE
+
+
+@pytest.mark.parametrize(
+    "litres, code",
+    [(3.0, CodeErreur.OK), (0.0, CodeErreur.LITRES_NON_POSITIFS), (100.0, CodeErreur.LAIT_INSUFFISANT)],
+)
+def test_should_return_reason_code_given_check_traire(litres, code):
+    # Arrange
+    vache = VacheALait(petitNom="Lola", poids=500.0)
+    vache.brouter(10.0)
+    vache.ruminer()
+
+    # Act
+    resultat = vache.check_traire(litres)
+
+    # Assert (1 assertion métier)
+    assert resultat == code
+
+
+def test_should_carry_lait_insuffisant_code_given_traire_above_lait_disponible():
+    # Arrange
+    vache = VacheALait(petitNom="Lola", poids=500.0)
+
+    # Act
+    with pytest.raises(InvalidVacheException) as erreur:
+        vache.traire(1.0)
+
+    # Assert (1 assertion métier)
+    assert erreur.value.code == CodeErreur.LAIT_INSUFFISANT
+
 def test_should_include_milk_fields_in_str_given_new_vache_a_lait():
     # Arrange
     vache = VacheALait(petitNom="Lola", poids=500.0)
@@ -271,3 +315,51 @@ def test_should_reflect_milk_values_in_str_given_ruminer_and_traire():
 
     # Assert (1 assertion métier)
     assert "Lait total trait : 3.0 L" in s
+
+
+# -------------------------
+# TEMPLATE METHOD
+# -------------------------
+
+def test_should_return_produced_lait_given_ruminer():
+    # Arrange
+    vache = VacheALait(petitNom="Lola", poids=500.0)
+    vache.brouter(10.0)
+
+    # Act
+    lait = vache.ruminer()
+
+    # Assert (1 assertion métier)
+    assert lait == pytest.approx(VacheALait.RENDEMENT_LAIT * 10.0)
+
+
+def test_should_keep_poids_and_panse_given_production_overflow_when_ruminer():
+    # Arrange
+    vache = VacheALait(petitNom="Lola", poids=500.0)
+    vache.lait_disponible = VacheALait.PRODUCTION_LAIT_MAX
+    vache.brouter(10.0)
+
+    # Act
+    with pytest.raises(InvalidVacheException):
+        vache.ruminer()
+
+    # Assert (1 assertion métier)
+    assert (vache.poids, vache.panse) == (500.0, 10.0)
+
+
+def test_should_not_override_ruminer_given_milking_races():
+    # Act
+    redefinitions = [c.__name__ for c in (VacheALait, PieNoire) if "ruminer" in c.__dict__]
+
+    # Assert (1 assertion métier)
+    assert redefinitions == []
+
+
+def test_should_refuse_strategy_without_calculer_given_abstract_base():
+    # Arrange
+    class StrategieIncomplete(StrategieLait):
+        pass
+
+    # Act / Assert (1 assertion métier)
+    with pytest.raises(TypeError):
+        StrategieIncomplete()
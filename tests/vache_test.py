@@ -1,5 +1,6 @@
 import pytest
 
+from src.vaches.domain.errors.codes import CodeErreur
 from src.vaches.domain.errors.exceptions import InvalidVacheException
 from src.vaches.domain.vache import Vache
 
@@ -19,6 +20,17 @@ def test_should_create_vache_given_valid_state():
     assert poids == 450.0
 
 
+def test_should_not_allocate_instance_dict_given_slotted_vache():
+    # Arrange
+    vache = Vache(petit_nom="Marguerite", poids=450.0)
+
+    # Act
+    a_un_dict = hasattr(vache, "__dict__")
+
+    # Assert (1 assertion métier)
+    assert not a_un_dict
+
+
 @pytest.mark.parametrize("petit_nom", ["", "   ", "\n\t"])
 def test_should_raise_invalid_vache_exception_given_empty_petit_nom(petit_nom):
     # Arrange / Act / Assert
@@ -124,6 +136,50 @@ def test_should_raise_invalid_vache_exception_given_panse_overflow_cases_when_br
         vache.brouter(quantite)
 
 
+def test_should_carry_panse_depassee_code_given_overflow_when_brouter():
+    # Arrange
+    vache = Vache(petit_nom="Marguerite", poids=450.0)
+    vache.brouter(Vache.PANSE_MAX)
+
+    # Act
+    with pytest.raises(InvalidVacheException) as erreur:
+        vache.brouter(1.0)
+
+    # Assert (1 assertion métier)
+    assert erreur.value.code == CodeErreur.PANSE_DEPASSEE
+
+
+@pytest.mark.parametrize(
+    "quantite, nourriture, code",
+    [
+        (5.0, None, CodeErreur.OK),
+        (0.0, None, CodeErreur.QUANTITE_NON_POSITIVE),
+        (Vache.PANSE_MAX + 1.0, None, CodeErreur.PANSE_DEPASSEE),
+        (5.0, "HERBE", CodeErreur.NOURRITURE_INTERDITE),
+    ],
+)
+def test_should_return_reason_code_without_raising_given_check_brouter(quantite, nourriture, code):
+    # Arrange
+    vache = Vache(petit_nom="Marguerite", poids=450.0)
+
+    # Act
+    resultat = vache.check_brouter(quantite, nourriture)
+
+    # Assert (1 assertion métier)
+    assert resultat == code
+
+
+def test_should_leave_state_unchanged_given_check_brouter():
+    # Arrange
+    vache = Vache(petit_nom="Marguerite", poids=450.0)
+
+    # Act
+    vache.check_brouter(5.0)
+
+    # Assert (1 assertion métier)
+    assert vache.panse == 0.0
+
+
 # -------------------------
 # RUMINER
 # -------------------------
@@ -177,6 +233,17 @@ def test_should_raise_invalid_vache_exception_when_aging_beyond_max_limit():
     with pytest.raises(InvalidVacheException):
         vache.vieillir()
 
+def test_should_return_age_max_atteint_given_check_vieillir_at_limit():
+    # Arrange
+    vache = Vache(petit_nom="Mamie", poids=450.0)
+    _faire_vieillir_jusqu_a_la_limite(vache)
+
+    # Act
+    code = vache.check_vieillir()
+
+    # Assert (1 assertion métier)
+    assert code == CodeErreur.AGE_MAX_ATTEINT
+
 '''
 HELPER
 '''